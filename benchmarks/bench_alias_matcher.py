@@ -0,0 +1,107 @@
+"""Compare the linear alias scan with the Aho-Corasick matcher on quarterly results text.
+
+Run with: python benchmarks/bench_alias_matcher.py
+"""
+
+import time
+from functools import partial
+
+from webwatcher.financial.alias_matcher import AliasMatcher
+from webwatcher.financial.canonical_map import CANONICAL_METRIC_MAP
+from webwatcher.financial.financial_extractor import LINE_RE
+
+# Excerpt laid out like an Indian listed company's "Statement of Standalone Audited Financial
+# Results for the Quarter and Year ended 31 March" as published on the exchange filing.
+RESULTS_TEXT = """
+Statement of Standalone Audited Financial Results for the Quarter and Year ended March 31
+(Rs. in Crore, except per share data)
+Particulars Quarter ended Year ended
+Revenue from operations 12,456.30 11,872.10 48,213.55
+Other income 312.45 287.90 1,145.20
+Total income 12,768.75 12,160.00 49,358.75
+Cost of materials consumed 6,734.20 6,512.85 26,104.90
+Purchases of stock-in-trade 412.30 398.75 1,620.10
+Changes in inventories of finished goods 85.40 -112.60 -64.25
+Employee benefits expense 1,245.80 1,198.30 4,872.60
+Finance costs 156.70 162.40 640.85
+Depreciation and amortisation expense 478.90 465.20 1,874.35
+Other expenses 1,890.65 1,802.15 7,356.40
+Total expenses 10,993.95 10,427.05 42,405.05
+EBITDA 2,414.95 2,279.60 9,373.80
+Profit before exceptional items and tax 1,774.80 1,732.95 6,953.70
+Exceptional items 45.00 0.00 45.00
+Profit before tax 1,729.80 1,732.95 6,908.70
+Current tax 402.10 398.60 1,612.45
+Deferred tax 38.25 41.80 152.90
+Net Profit after tax 1,289.45 1,292.55 5,143.35
+Profit for the period 1,289.45 1,292.55 5,143.35
+Other comprehensive income net of tax -12.40 8.75 -25.60
+Total comprehensive income for the period 1,277.05 1,301.30 5,117.75
+Paid-up equity share capital (Face value Rs. 10 each) 1,050.00 1,050.00 1,050.00
+Earnings per share (Basic) 12.28 12.31 48.98
+Earnings per share (Diluted) 12.26 12.29 48.91
+Net sales 12,101.85 11,540.25 46,880.10
+Income from operations 12,456.30 11,872.10 48,213.55
+"""
+
+SYNTHETIC_QUALIFIERS = [
+    "consolidated", "standalone", "segment", "adjusted", "reported", "normalised", "underlying",
+    "group", "continuing", "discontinued", "domestic", "export", "gross", "operating", "core",
+    "recurring", "annualised", "comparable", "organic", "statutory",
+]
+SYNTHETIC_BASES = [
+    "interest income", "dividend payout", "capital expenditure", "free cash flow", "order book",
+    "order inflow", "book value per share", "return on equity", "return on capital employed",
+    "net debt", "working capital", "inventory days", "receivable days", "payable days",
+    "gross npa", "net npa", "provision coverage", "cost to income", "tier one capital", "casa ratio",
+]
+
+
+def build_alias_map(size: int) -> dict[str, str]:
+    aliases = dict(CANONICAL_METRIC_MAP)
+    for qualifier in SYNTHETIC_QUALIFIERS:
+        for base in SYNTHETIC_BASES:
+            if len(aliases) >= size:
+                return aliases
+            aliases[f"{qualifier} {base}"] = base.replace(" ", "_")
+    return aliases
+
+
+def linear_longest(aliases: dict[str, str], key: str) -> str | None:
+    best: tuple[int, str] | None = None
+    for alias, canonical in aliases.items():
+        if alias in key and (best is None or len(alias) > best[0]):
+            best = (len(alias), canonical)
+    return best[1] if best else None
+
+
+def time_it(fn, labels: list[str], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for label in labels:
+            fn(label)
+    return (time.perf_counter() - started) * 1000
+
+
+def main(rounds: int = 200) -> None:
+    labels = [
+        " ".join(match.group("label").lower().split())
+        for line in RESULTS_TEXT.splitlines()
+        if (match := LINE_RE.search(line))
+    ]
+    print(f"{len(labels)} labels x {rounds} rounds")
+    print(f"{'aliases':>8} {'linear ms':>10} {'matcher ms':>11} {'build ms':>9} {'speedup':>8}")
+    for size in (len(CANONICAL_METRIC_MAP), 100, 400):
+        aliases = build_alias_map(size)
+        started = time.perf_counter()
+        matcher = AliasMatcher(aliases)
+        build_ms = (time.perf_counter() - started) * 1000
+        for label in labels:
+            assert matcher.longest(label) == linear_longest(aliases, label), label
+        linear_ms = time_it(partial(linear_longest, aliases), labels, rounds)
+        matcher_ms = time_it(matcher.longest, labels, rounds)
+        print(f"{len(aliases):>8} {linear_ms:>10.1f} {matcher_ms:>11.1f} {build_ms:>9.2f} {linear_ms / matcher_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from webwatcher.api.routes_changes import router as changes_router
 from webwatcher.api.routes_company import router as company_router
+from webwatcher.api.routes_financials import router as financials_router
 from webwatcher.api.routes_monitor import router as monitor_router
 from webwatcher.observability.metrics import metrics
 
@@ -9,6 +10,7 @@ api_router = APIRouter()
 api_router.include_router(company_router)
 api_router.include_router(monitor_router)
 api_router.include_router(changes_router)
+api_router.include_router(financials_router)
 
 
 @api_router.get("/health")
@@ -0,0 +1,50 @@
+from dataclasses import asdict
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from webwatcher.api.schemas import GrowthScreenOut, MetricSeriesOut, MetricSeriesRowOut
+from webwatcher.core.database import get_db_session
+from webwatcher.financial.timeseries import MetricSeriesStore
+
+router = APIRouter(prefix="/financials", tags=["financials"])
+
+
+@router.get("/series", response_model=MetricSeriesOut)
+async def get_metric_series(
+    metric: str,
+    company_ids: list[int] | None = Query(default=None),
+    periods: int = Query(default=12, ge=1, le=40),
+    db: AsyncSession = Depends(get_db_session),
+) -> MetricSeriesOut:
+    try:
+        matrix = await MetricSeriesStore().matrix(db, metric, company_ids=company_ids, periods=periods)
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=503, detail=f"Database unavailable: {exc}") from exc
+    values = np.where(np.isnan(matrix.values), None, matrix.values).tolist()
+    return MetricSeriesOut(
+        metric=metric,
+        period_ends=matrix.period_ends,
+        companies=[
+            MetricSeriesRowOut(company_id=int(company_id), values=row)
+            for company_id, row in zip(matrix.company_ids, values, strict=True)
+        ],
+    )
+
+
+@router.get("/screen", response_model=list[GrowthScreenOut])
+async def screen_metric_growth(
+    metric: str,
+    min_growth: float = 0.0,
+    lag: int = Query(default=1, ge=1, le=12),
+    periods: int = Query(default=12, ge=2, le=40),
+    limit: int = Query(default=100, ge=1, le=2000),
+    db: AsyncSession = Depends(get_db_session),
+) -> list[GrowthScreenOut]:
+    try:
+        rows = await MetricSeriesStore().screen_growth(db, metric, min_growth, lag=lag, periods=periods)
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=503, detail=f"Database unavailable: {exc}") from exc
+    return [GrowthScreenOut(**asdict(row)) for row in rows[:limit]]
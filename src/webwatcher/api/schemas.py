@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 from pydantic import BaseModel, Field, HttpUrl
@@ -80,3 +80,22 @@ class ChangeOut(BaseModel):
     summary: str
     details: dict[str, Any]
     created_at: datetime
+
+
+class MetricSeriesRowOut(BaseModel):
+    company_id: int
+    values: list[float | None]
+
+
+class MetricSeriesOut(BaseModel):
+    metric: str
+    period_ends: list[date]
+    companies: list[MetricSeriesRowOut]
+
+
+class GrowthScreenOut(BaseModel):
+    company_id: int
+    period_end: date
+    latest: float
+    previous: float
+    growth: float
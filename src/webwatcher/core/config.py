@@ -54,6 +54,18 @@ class Settings(BaseSettings):
     azure_openai_api_version: str = Field(
         default="2024-12-01-preview", alias="AZURE_OPENAI_API_VERSION"
     )
+    webwatch_llm_max_concurrency: int = Field(default=4, alias="WEBWATCH_LLM_MAX_CONCURRENCY")
+    webwatch_llm_timeout_seconds: float = Field(default=30.0, alias="WEBWATCH_LLM_TIMEOUT_SECONDS")
+    webwatch_llm_max_retries: int = Field(default=3, alias="WEBWATCH_LLM_MAX_RETRIES")
+    webwatch_llm_batch_size: int = Field(default=1, alias="WEBWATCH_LLM_BATCH_SIZE")
+    webwatch_llm_batch_window_ms: int = Field(default=50, alias="WEBWATCH_LLM_BATCH_WINDOW_MS")
+    webwatch_llm_prompt_token_budget: int = Field(default=3000, alias="WEBWATCH_LLM_PROMPT_TOKEN_BUDGET")
+    webwatch_llm_single_flight_wait_seconds: float = Field(
+        default=60.0, alias="WEBWATCH_LLM_SINGLE_FLIGHT_WAIT_SECONDS"
+    )
+    webwatch_llm_single_flight_ttl_seconds: int = Field(
+        default=300, alias="WEBWATCH_LLM_SINGLE_FLIGHT_TTL_SECONDS"
+    )
     openai_api_key: str | None = Field(default=None, alias="OPENAI_API_KEY")
     enable_openai_fallback: bool = Field(default=False, alias="WEBWATCH_ENABLE_OPENAI_FALLBACK")
 
@@ -81,10 +93,19 @@ class Settings(BaseSettings):
     webwatch_crawl_depth: int = Field(default=2, alias="WEBWATCH_CRAWL_DEPTH")
     webwatch_scan_interval_minutes: int = Field(default=90, alias="WEBWATCH_SCAN_INTERVAL_MINUTES")
     webwatch_scan_jitter_minutes: int = Field(default=30, alias="WEBWATCH_SCAN_JITTER_MINUTES")
+    webwatch_adaptive_scan_intervals: bool = Field(default=True, alias="WEBWATCH_ADAPTIVE_SCAN_INTERVALS")
+    webwatch_scan_min_interval_minutes: int = Field(default=30, alias="WEBWATCH_SCAN_MIN_INTERVAL_MINUTES")
+    webwatch_scan_max_interval_minutes: int = Field(default=720, alias="WEBWATCH_SCAN_MAX_INTERVAL_MINUTES")
+    webwatch_scan_change_lookback_days: int = Field(default=30, alias="WEBWATCH_SCAN_CHANGE_LOOKBACK_DAYS")
     webwatch_max_file_size_mb: int = Field(default=40, alias="WEBWATCH_MAX_FILE_SIZE_MB")
     webwatch_request_timeout_seconds: int = Field(default=20, alias="WEBWATCH_REQUEST_TIMEOUT_SECONDS")
     webwatch_max_retries: int = Field(default=3, alias="WEBWATCH_MAX_RETRIES")
     webwatch_rate_limit_per_domain: int = Field(default=12, alias="WEBWATCH_RATE_LIMIT_PER_DOMAIN")
+    webwatch_pdf_download_concurrency: int = Field(default=6, alias="WEBWATCH_PDF_DOWNLOAD_CONCURRENCY")
+    webwatch_pdf_store_concurrency: int = Field(default=4, alias="WEBWATCH_PDF_STORE_CONCURRENCY")
+    webwatch_pdf_parse_concurrency: int = Field(default=2, alias="WEBWATCH_PDF_PARSE_CONCURRENCY")
+    webwatch_pdf_pipeline_buffer: int = Field(default=8, alias="WEBWATCH_PDF_PIPELINE_BUFFER")
+    webwatch_pdf_page_budget: int = Field(default=80, alias="WEBWATCH_PDF_PAGE_BUDGET")
     webwatch_alert_confidence_threshold: float = Field(
         default=0.75, alias="WEBWATCH_ALERT_CONFIDENCE_THRESHOLD"
     )
@@ -98,9 +119,47 @@ class Settings(BaseSettings):
     webwatch_materiality_critical: float = Field(
         default=0.9, alias="WEBWATCH_MATERIALITY_CRITICAL"
     )
+    webwatch_text_cosmetic_threshold: float = Field(
+        default=0.08, alias="WEBWATCH_TEXT_COSMETIC_THRESHOLD"
+    )
+    webwatch_text_meaningful_threshold: float = Field(
+        default=0.3, alias="WEBWATCH_TEXT_MEANINGFUL_THRESHOLD"
+    )
+    webwatch_scheduler_batch_size: int = Field(default=8, alias="WEBWATCH_SCHEDULER_BATCH_SIZE")
+    webwatch_scheduler_max_per_tick: int = Field(default=500, alias="WEBWATCH_SCHEDULER_MAX_PER_TICK")
+    webwatch_scheduler_claim_lease_seconds: int = Field(
+        default=1800, alias="WEBWATCH_SCHEDULER_CLAIM_LEASE_SECONDS"
+    )
+    webwatch_scheduler_pending_ttl_seconds: int = Field(
+        default=3600, alias="WEBWATCH_SCHEDULER_PENDING_TTL_SECONDS"
+    )
+    webwatch_batch_scan_concurrency: int = Field(default=16, alias="WEBWATCH_BATCH_SCAN_CONCURRENCY")
+    webwatch_batch_scan_per_domain: int = Field(default=2, alias="WEBWATCH_BATCH_SCAN_PER_DOMAIN")
+    webwatch_worker_persistent_loop: bool = Field(default=True, alias="WEBWATCH_WORKER_PERSISTENT_LOOP")
+    webwatch_pipeline_stages: bool = Field(default=True, alias="WEBWATCH_PIPELINE_STAGES")
+    webwatch_crawl_concurrency: int = Field(default=4, alias="WEBWATCH_CRAWL_CONCURRENCY")
+    webwatch_pipeline_lock_ttl_seconds: int = Field(default=3600, alias="WEBWATCH_PIPELINE_LOCK_TTL_SECONDS")
     webwatch_enable_ocr_on_pdf_failure: bool = Field(
         default=True, alias="WEBWATCH_ENABLE_OCR_ON_PDF_FAILURE"
     )
+    webwatch_ocr_engine: str = Field(default="tesseract", alias="WEBWATCH_OCR_ENGINE")
+    webwatch_ocr_max_pages: int = Field(default=40, alias="WEBWATCH_OCR_MAX_PAGES")
+    webwatch_ocr_time_limit_seconds: int = Field(default=300, alias="WEBWATCH_OCR_TIME_LIMIT_SECONDS")
+    webwatch_ocr_rate_limit: str = Field(default="6/m", alias="WEBWATCH_OCR_RATE_LIMIT")
+
+    webwatch_retention_daily_after_days: int = Field(
+        default=30, alias="WEBWATCH_RETENTION_DAILY_AFTER_DAYS"
+    )
+    webwatch_retention_monthly_after_days: int = Field(
+        default=365, alias="WEBWATCH_RETENTION_MONTHLY_AFTER_DAYS"
+    )
+    webwatch_retention_archive_after_days: int = Field(
+        default=90, alias="WEBWATCH_RETENTION_ARCHIVE_AFTER_DAYS"
+    )
+    webwatch_retention_cache_days: int = Field(default=90, alias="WEBWATCH_RETENTION_CACHE_DAYS")
+    webwatch_retention_llm_event_days: int = Field(
+        default=180, alias="WEBWATCH_RETENTION_LLM_EVENT_DAYS"
+    )
 
     @computed_field
     @property
@@ -37,6 +37,15 @@ def get_session_maker() -> async_sessionmaker[AsyncSession]:
     return _session_maker
 
 
+async def dispose_engine() -> None:
+    global _engine, _session_maker
+    engine = _engine
+    _engine = None
+    _session_maker = None
+    if engine is not None:
+        await engine.dispose()
+
+
 @asynccontextmanager
 async def session_scope() -> AsyncIterator[AsyncSession]:
     session = get_session_maker()()
@@ -0,0 +1,139 @@
+import asyncio
+import os
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+import httpx
+
+from webwatcher.core.config import get_settings
+from webwatcher.core.database import dispose_engine
+from webwatcher.llm.llm_client import close_shared_llm_client
+from webwatcher.observability.metrics import metrics
+
+T = TypeVar("T")
+
+
+class WorkerRuntime:
+    # One event loop per worker process, running on a daemon thread. Celery tasks hand their
+    # coroutines to it, so the database engine pool, the shared HTTP client and per-loop state
+    # (LLM semaphores, single-flight futures) survive from one task to the next.
+
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+        self.loop = asyncio.new_event_loop()
+        self.http_client: httpx.AsyncClient | None = None
+        self._thread = threading.Thread(target=self._serve, name="webwatcher-runtime", daemon=True)
+        self._ready = threading.Event()
+
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        self.loop.run_forever()
+
+    def start(self) -> "WorkerRuntime":
+        self._thread.start()
+        self._ready.wait()
+        self.http_client = self.run(self._open_http_client())
+        return self
+
+    async def _open_http_client(self) -> httpx.AsyncClient:
+        settings = get_settings()
+        return httpx.AsyncClient(
+            timeout=settings.webwatch_request_timeout_seconds,
+            follow_redirects=True,
+            headers={"User-Agent": "webwatcher-agent/0.1"},
+        )
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result()
+        except BaseException:
+            # Celery time limits interrupt the waiting thread; stop the coroutine on the loop too.
+            future.cancel()
+            raise
+
+    async def _close_pools(self) -> None:
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+        await close_shared_llm_client()
+        await dispose_engine()
+
+    def stop(self) -> None:
+        if not self.loop.is_running():
+            return
+        try:
+            self.run(self._close_pools())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=10)
+            self.loop.close()
+
+
+_runtime: WorkerRuntime | None = None
+_runtime_lock = threading.Lock()
+_worker_mode = False
+
+
+def enable_worker_runtime() -> None:
+    # Called from Celery worker signals. The loop itself starts lazily in the process that runs
+    # tasks, so a prefork parent never owns a loop thread its children would inherit.
+    global _worker_mode
+    _worker_mode = get_settings().webwatch_worker_persistent_loop
+
+
+def current_runtime() -> WorkerRuntime | None:
+    runtime = _runtime
+    if runtime is None or runtime.pid != os.getpid():
+        return None
+    return runtime
+
+
+def start_worker_runtime() -> WorkerRuntime | None:
+    global _runtime
+    if not _worker_mode:
+        return None
+    with _runtime_lock:
+        if current_runtime() is None:
+            _runtime = WorkerRuntime().start()
+            metrics.inc("worker_runtime_starts_total")
+        return _runtime
+
+
+def stop_worker_runtime() -> None:
+    global _runtime
+    with _runtime_lock:
+        runtime = current_runtime()
+        _runtime = None
+    if runtime is not None:
+        runtime.stop()
+
+
+def shared_http_client() -> httpx.AsyncClient | None:
+    # Only handed out to code running on the runtime loop; httpx pools are bound to one loop.
+    runtime = current_runtime()
+    if runtime is None or runtime.http_client is None:
+        return None
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return runtime.http_client if running is runtime.loop else None
+
+
+async def _run_and_dispose(coro: Coroutine[Any, Any, T]) -> T:
+    try:
+        return await coro
+    finally:
+        # Pooled connections belong to this loop, which asyncio.run is about to close.
+        await close_shared_llm_client()
+        await dispose_engine()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    runtime = current_runtime() or start_worker_runtime()
+    if runtime is not None:
+        return runtime.run(coro)
+    return asyncio.run(_run_and_dispose(coro))
@@ -7,6 +7,7 @@ import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from webwatcher.core.config import get_settings
+from webwatcher.core.runtime import shared_http_client
 from webwatcher.security.security_utils import prevent_ssrf
 
 
@@ -30,14 +31,17 @@ class DomainRateLimiter:
         self._lock = asyncio.Lock()
 
     async def wait(self, domain: str) -> None:
+        # Reserve the next slot under the lock but sleep outside it, so a slow domain does not
+        # stall requests to other domains.
+        loop = asyncio.get_running_loop()
         async with self._lock:
-            loop = asyncio.get_running_loop()
             now = loop.time()
-            last = self._last_hit.get(domain, 0.0)
-            delay = self._interval_seconds - (now - last)
-            if delay > 0:
-                await asyncio.sleep(delay)
-            self._last_hit[domain] = loop.time()
+            last = self._last_hit.get(domain)
+            slot = now if last is None else max(now, last + self._interval_seconds)
+            self._last_hit[domain] = slot
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
 
 
 class Fetcher:
@@ -46,14 +50,19 @@ class Fetcher:
         self.timeout = settings.webwatch_request_timeout_seconds
         self.max_retries = settings.webwatch_max_retries
         self.rate_limiter = DomainRateLimiter(settings.webwatch_rate_limit_per_domain)
-        self._client = httpx.AsyncClient(
+        # Inside a worker runtime the process-wide client is reused, keeping its connection pool
+        # warm across tasks; it is closed when the worker shuts down, not here.
+        shared = shared_http_client()
+        self._owns_client = shared is None
+        self._client = shared or httpx.AsyncClient(
             timeout=self.timeout,
             follow_redirects=True,
             headers={"User-Agent": "webwatcher-agent/0.1"},
         )
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     @retry(wait=wait_exponential(min=1, max=8), stop=stop_after_attempt(3), reraise=True)
     async def _request(self, method: str, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
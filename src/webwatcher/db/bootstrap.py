@@ -15,6 +15,37 @@ async def bootstrap_database() -> None:
         except Exception:
             # Keep API startup available even if compatibility DDL cannot acquire locks.
             pass
+        try:
+            await _add_new_document_columns(conn)
+        except Exception:
+            pass
+        try:
+            await _add_new_indexes(conn)
+        except Exception:
+            pass
+
+
+async def _add_new_document_columns(conn) -> None:
+    columns = await _columns_meta(conn, table="documents")
+    if not columns:
+        return
+    await conn.execute(text("SET LOCAL lock_timeout = '2s'"))
+    await _add_if_missing(conn, columns, "page_hashes", "JSON DEFAULT '[]'", table="documents")
+    await _add_if_missing(conn, columns, "archived_at", "TIMESTAMPTZ", table="documents")
+    snapshot_columns = await _columns_meta(conn, table="snapshots")
+    if snapshot_columns:
+        await _add_if_missing(conn, snapshot_columns, "archived_at", "TIMESTAMPTZ", table="snapshots")
+    event_columns = await _columns_meta(conn, table="llm_events")
+    if event_columns:
+        await _add_if_missing(conn, event_columns, "cached", "BOOLEAN NOT NULL DEFAULT FALSE", table="llm_events")
+
+
+async def _add_new_indexes(conn) -> None:
+    # create_all skips tables that already exist, so indexes added to existing tables land here.
+    await conn.execute(text("SET LOCAL lock_timeout = '2s'"))
+    await conn.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_companies_active_next_scan ON companies (is_active, next_scan_at)")
+    )
 
 
 async def _repair_legacy_companies_table(conn) -> None:
@@ -139,15 +170,16 @@ async def _repair_legacy_companies_table(conn) -> None:
         await conn.execute(text("UPDATE companies SET company_slug = NULL WHERE company_slug = ''"))
 
 
-async def _columns_meta(conn) -> dict[str, dict[str, str | None]]:
+async def _columns_meta(conn, table: str = "companies") -> dict[str, dict[str, str | None]]:
     rows = await conn.execute(
         text(
             """
             SELECT column_name, is_nullable, column_default
             FROM information_schema.columns
-            WHERE table_schema='public' AND table_name='companies'
+            WHERE table_schema='public' AND table_name=:table
             """
-        )
+        ),
+        {"table": table},
     )
     return {
         row.column_name: {
@@ -158,6 +190,12 @@ async def _columns_meta(conn) -> dict[str, dict[str, str | None]]:
     }
 
 
-async def _add_if_missing(conn, columns: dict[str, dict[str, str | None]], name: str, ddl_type: str) -> None:
+async def _add_if_missing(
+    conn,
+    columns: dict[str, dict[str, str | None]],
+    name: str,
+    ddl_type: str,
+    table: str = "companies",
+) -> None:
     if name not in columns:
-        await conn.execute(text(f"ALTER TABLE companies ADD COLUMN {name} {ddl_type}"))
+        await conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl_type}"))
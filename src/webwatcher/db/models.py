@@ -1,10 +1,11 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from enum import Enum
 from typing import Any
 
 from sqlalchemy import (
     JSON,
     Boolean,
+    Date,
     DateTime,
     Float,
     ForeignKey,
@@ -49,6 +50,7 @@ class Severity(str, Enum):
 
 class Company(Base):
     __tablename__ = "companies"
+    __table_args__ = (Index("ix_companies_active_next_scan", "is_active", "next_scan_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -101,6 +103,7 @@ class Snapshot(Base):
     section_hashes: Mapped[dict[str, str]] = mapped_column(JSON, default=dict, nullable=False)
     normalized_json: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
     raw_blob_path: Mapped[str | None] = mapped_column(String(1024), nullable=True)
+    archived_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
 
     company: Mapped["Company"] = relationship(back_populates="snapshots")
@@ -124,11 +127,38 @@ class Document(Base):
     file_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
     content_type: Mapped[str | None] = mapped_column(String(255), nullable=True)
     storage_path: Mapped[str | None] = mapped_column(String(1024), nullable=True)
+    page_hashes: Mapped[list[str]] = mapped_column(JSON, default=list, nullable=False)
+    archived_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
 
     snapshot: Mapped["Snapshot"] = relationship(back_populates="documents")
 
 
+class PdfParseCacheEntry(Base):
+    __tablename__ = "pdf_parse_cache"
+    __table_args__ = (
+        UniqueConstraint("doc_hash", "parser_version", name="uq_pdf_parse_cache_hash_version"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    doc_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    parser_version: Mapped[str] = mapped_column(String(32), nullable=False)
+    pages: Mapped[list[str]] = mapped_column(JSON, default=list, nullable=False)
+    report_type: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    headings: Mapped[list[str]] = mapped_column(JSON, default=list, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
+
+
+class ExtractionCacheEntry(Base):
+    __tablename__ = "extraction_cache"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    extractor_version: Mapped[str] = mapped_column(String(32), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
+
+
 class FinancialMetric(Base):
     __tablename__ = "financial_metrics"
     __table_args__ = (
@@ -150,6 +180,31 @@ class FinancialMetric(Base):
     snapshot: Mapped["Snapshot"] = relationship(back_populates="financial_metrics")
 
 
+class MetricSeries(Base):
+    # One row per (company, metric, period end): re-extracting the same quarter from later
+    # snapshots updates the point instead of adding another row.
+    __tablename__ = "metric_series"
+    __table_args__ = (
+        UniqueConstraint("company_id", "metric_name", "period_end", name="uq_metric_series_point"),
+        Index("ix_metric_series_metric_period", "metric_name", "period_end"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    company_id: Mapped[int] = mapped_column(ForeignKey("companies.id"), nullable=False)
+    metric_name: Mapped[str] = mapped_column(String(128), nullable=False)
+    period_end: Mapped[date] = mapped_column(Date, nullable=False)
+    period_label: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    value: Mapped[float] = mapped_column(Float, nullable=False)
+    currency: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    report_type: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    confidence: Mapped[float] = mapped_column(Float, default=0.5, nullable=False)
+    # Plain id rather than a foreign key: retention may prune the snapshot, the point stays.
+    source_snapshot_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False
+    )
+
+
 class Change(Base):
     __tablename__ = "changes"
     __table_args__ = (
@@ -182,6 +237,8 @@ class LlmEvent(Base):
     prompt_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
     completion_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
     latency_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # True when the answer came from an earlier call (llm_events cache or a shared in-flight call).
+    cached: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
 
 
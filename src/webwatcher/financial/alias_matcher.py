@@ -0,0 +1,84 @@
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AliasMatch:
+    start: int
+    end: int
+    alias: str
+    canonical: str
+
+
+class AliasMatcher:
+    # Aho-Corasick automaton over characters: one pass over the text finds every alias occurrence,
+    # so lookup cost depends on the label length rather than on how many aliases are registered.
+
+    def __init__(self, aliases: dict[str, str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Best alias ending at each node (following fail links): (length, -priority, alias, canonical).
+        self._best: list[tuple[int, int, str, str] | None] = [None]
+        self._outputs: list[list[tuple[str, str]]] = [[]]
+        for priority, (alias, canonical) in enumerate(aliases.items()):
+            key = " ".join(alias.lower().split())
+            if key:
+                self._insert(key, canonical, priority)
+        self._link()
+
+    def _insert(self, alias: str, canonical: str, priority: int) -> None:
+        node = 0
+        for char in alias:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._best.append(None)
+                self._outputs.append([])
+                self._goto[node][char] = next_node
+            node = next_node
+        self._outputs[node].append((alias, canonical))
+        candidate = (len(alias), -priority, alias, canonical)
+        if self._best[node] is None or candidate > self._best[node]:
+            self._best[node] = candidate
+
+    def _link(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                inherited = self._best[self._fail[child]]
+                if inherited is not None and (self._best[child] is None or inherited > self._best[child]):
+                    self._best[child] = inherited
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+
+    def _step(self, node: int, char: str) -> int:
+        while node and char not in self._goto[node]:
+            node = self._fail[node]
+        return self._goto[node].get(char, 0)
+
+    def find_all(self, text: str) -> Iterator[AliasMatch]:
+        node = 0
+        for index, char in enumerate(text):
+            node = self._step(node, char)
+            for alias, canonical in self._outputs[node]:
+                yield AliasMatch(start=index - len(alias) + 1, end=index + 1, alias=alias, canonical=canonical)
+
+    def longest(self, text: str) -> str | None:
+        # Longest alias wins; equal lengths fall back to declaration order in the alias map.
+        node = 0
+        best: tuple[int, int, str, str] | None = None
+        for char in text:
+            node = self._step(node, char)
+            candidate = self._best[node]
+            if candidate is not None and (best is None or candidate > best):
+                best = candidate
+        return best[3] if best else None
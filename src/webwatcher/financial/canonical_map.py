@@ -1,3 +1,7 @@
+import re
+
+from webwatcher.financial.alias_matcher import AliasMatcher
+
 CANONICAL_METRIC_MAP: dict[str, str] = {
     "revenue": "revenue",
     "net sales": "revenue",
@@ -6,16 +10,32 @@ CANONICAL_METRIC_MAP: dict[str, str] = {
     "net profit": "net_profit",
     "profit after tax": "net_profit",
     "pat": "net_profit",
+    "net income": "net_profit",
+    # Longer than "income from operations", so this profit line is not read as revenue.
+    "net income from operations": "net_profit",
+    "profit for the period": "net_profit",
+    "profit for the year": "net_profit",
     "ebitda": "ebitda",
     "eps": "eps",
     "earnings per share": "eps",
 }
 
+# Cheap "does this text mention any metric" probe, used to skip pages and lines before running
+# the full extraction regex.
+METRIC_KEYWORD_RE = re.compile(
+    "|".join(
+        r"\s+".join(re.escape(word) for word in alias.split())
+        for alias in sorted(CANONICAL_METRIC_MAP, key=len, reverse=True)
+    ),
+    re.IGNORECASE,
+)
+
+
+_ALIAS_MATCHER = AliasMatcher(CANONICAL_METRIC_MAP)
+
 
 def canonicalize_metric_name(name: str) -> str | None:
-    key = " ".join(name.lower().split())
-    for alias, canonical in CANONICAL_METRIC_MAP.items():
-        if alias in key:
-            return canonical
-    return None
+    # The longest alias found anywhere in the label wins, so "net profit margin" style labels
+    # resolve to the most specific entry rather than whichever alias happens to be listed first.
+    return _ALIAS_MATCHER.longest(" ".join(name.lower().split()))
 
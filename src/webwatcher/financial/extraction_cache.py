@@ -0,0 +1,92 @@
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from webwatcher.db.models import ExtractionCacheEntry
+from webwatcher.normalization.html_normalizer import TableGrid
+from webwatcher.observability.metrics import metrics
+
+# Bump whenever extraction, validation or confidence scoring changes what a given input produces.
+EXTRACTOR_VERSION = "3"
+
+
+@dataclass
+class ExtractionOutcome:
+    metrics: dict[str, float]
+    currency: str | None
+    quarter: str | None
+    report_type: str | None
+    agreement_score: float
+    snapshot_confidence: float
+    metric_confidence: dict[str, float] = field(default_factory=dict)
+    provenance: dict[str, dict[str, Any]] = field(default_factory=dict)
+    has_tables: bool = False
+
+
+def extraction_fingerprint(
+    source_url: str,
+    page_hash: str,
+    table_grids: list[TableGrid],
+    documents: list[tuple[str, list[int]]],
+    llm_model: str | None,
+    extractor_version: str = EXTRACTOR_VERSION,
+    llm_prompt: str | None = None,
+) -> str:
+    # Everything the extraction chain reads: page text (via its hash), result tables, the exact
+    # PDF pages fed to the extractor, and whether and which LLM validated the result with which
+    # prompt (version and token budget).
+    material = {
+        "version": extractor_version,
+        "source": source_url,
+        "page_hash": page_hash,
+        "tables": [asdict(grid) for grid in table_grids],
+        "documents": sorted([doc_hash, pages] for doc_hash, pages in documents),
+        "llm_model": llm_model,
+        "llm_prompt": llm_prompt,
+    }
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _record_lookup(hit: bool) -> None:
+    metrics.inc("extraction_cache_hits_total" if hit else "extraction_cache_misses_total")
+    hits = metrics.counters["extraction_cache_hits_total"]
+    total = hits + metrics.counters["extraction_cache_misses_total"]
+    metrics.set_gauge("extraction_cache_hit_ratio", hits / total if total else 0.0)
+
+
+class ExtractionCache:
+    def __init__(self, extractor_version: str = EXTRACTOR_VERSION) -> None:
+        self.extractor_version = extractor_version
+
+    async def get(self, session: AsyncSession, fingerprint: str) -> ExtractionOutcome | None:
+        result = await session.execute(
+            select(ExtractionCacheEntry.payload).where(
+                ExtractionCacheEntry.fingerprint == fingerprint,
+                ExtractionCacheEntry.extractor_version == self.extractor_version,
+            )
+        )
+        payload = result.scalar_one_or_none()
+        _record_lookup(payload is not None)
+        if payload is None:
+            return None
+        return ExtractionOutcome(**payload)
+
+    async def put(self, session: AsyncSession, fingerprint: str, outcome: ExtractionOutcome) -> None:
+        # Identical content scanned concurrently resolves to the same row; first writer wins.
+        try:
+            async with session.begin_nested():
+                session.add(
+                    ExtractionCacheEntry(
+                        fingerprint=fingerprint,
+                        extractor_version=self.extractor_version,
+                        payload=asdict(outcome),
+                    )
+                )
+        except IntegrityError:
+            metrics.inc("extraction_cache_conflicts_total")
@@ -1,7 +1,8 @@
 import re
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 
-from webwatcher.financial.canonical_map import canonicalize_metric_name
+from webwatcher.financial.canonical_map import METRIC_KEYWORD_RE, canonicalize_metric_name
 from webwatcher.financial.unit_normalizer import normalize_numeric_value
 
 LINE_RE = re.compile(
@@ -11,6 +12,21 @@ LINE_RE = re.compile(
 )
 PERIOD_RE = re.compile(r"\b(Q[1-4]\s*FY\d{2,4}|FY\d{2,4}|quarter ended)\b", re.IGNORECASE)
 REPORT_RE = re.compile(r"\b(consolidated|standalone)\b", re.IGNORECASE)
+DIGIT_RE = re.compile(r"\d")
+
+
+@dataclass
+class TextChunk:
+    text: str
+    source: str | None = None
+    page: int | None = None
+
+
+@dataclass
+class MetricProvenance:
+    source: str | None
+    page: int | None
+    line: str
 
 
 @dataclass
@@ -19,32 +35,67 @@ class ExtractedFinancial:
     currency: str | None
     quarter: str | None
     report_type: str | None
+    provenance: dict[str, MetricProvenance] = field(default_factory=dict)
+
+    def fill_missing(self, other: "ExtractedFinancial") -> None:
+        for name, value in other.metrics.items():
+            if name in self.metrics:
+                continue
+            self.metrics[name] = value
+            if name in other.provenance:
+                self.provenance[name] = other.provenance[name]
+        self.currency = self.currency or other.currency
+        self.quarter = self.quarter or other.quarter
+        self.report_type = self.report_type or other.report_type
 
 
 class FinancialExtractor:
     def extract(self, text: str) -> ExtractedFinancial:
+        return self.extract_stream([text])
+
+    def extract_stream(self, chunks: Iterable[str | TextChunk]) -> ExtractedFinancial:
+        # Chunks (page text, PDF pages) are consumed one at a time, so callers can pass a
+        # generator and never build the merged text. Later chunks win for repeated metrics and the
+        # first period/report marker in stream order wins, matching extract() on the joined text.
         metrics: dict[str, float] = {}
+        provenance: dict[str, MetricProvenance] = {}
         currency: str | None = None
-        for line in text.splitlines():
-            match = LINE_RE.search(line)
-            if not match:
-                continue
-            canonical = canonicalize_metric_name(match.group("label"))
-            if not canonical:
-                continue
-            raw_value = float(match.group("value").replace(",", ""))
-            parsed_currency = match.group("currency")
-            if parsed_currency and not currency:
-                currency = parsed_currency.replace("Rs.", "INR").replace("₹", "INR")
-            normalized = normalize_numeric_value(raw_value, match.group("unit"), currency)
-            metrics[canonical] = normalized.base_value
-
-        period_match = PERIOD_RE.search(text)
-        report_match = REPORT_RE.search(text)
+        quarter: str | None = None
+        report_type: str | None = None
+        for item in chunks:
+            if isinstance(item, TextChunk):
+                chunk, source, page = item.text, item.source, item.page
+            else:
+                chunk, source, page = item, None, None
+            if quarter is None:
+                period_match = PERIOD_RE.search(chunk)
+                quarter = period_match.group(1) if period_match else None
+            if report_type is None:
+                report_match = REPORT_RE.search(chunk)
+                report_type = report_match.group(1).lower() if report_match else None
+            for line in chunk.splitlines():
+                # LINE_RE needs a digit and canonicalization needs an alias, so most prose and
+                # boilerplate lines are dropped by two cheap scans before the full regex runs.
+                if not DIGIT_RE.search(line) or not METRIC_KEYWORD_RE.search(line):
+                    continue
+                match = LINE_RE.search(line)
+                if not match:
+                    continue
+                canonical = canonicalize_metric_name(match.group("label"))
+                if not canonical:
+                    continue
+                raw_value = float(match.group("value").replace(",", ""))
+                parsed_currency = match.group("currency")
+                if parsed_currency and not currency:
+                    currency = parsed_currency.replace("Rs.", "INR").replace("₹", "INR")
+                normalized = normalize_numeric_value(raw_value, match.group("unit"), currency)
+                metrics[canonical] = normalized.base_value
+                provenance[canonical] = MetricProvenance(source=source, page=page, line=line.strip())
+
         return ExtractedFinancial(
             metrics=metrics,
             currency=currency,
-            quarter=period_match.group(1) if period_match else None,
-            report_type=report_match.group(1).lower() if report_match else None,
+            quarter=quarter,
+            report_type=report_type,
+            provenance=provenance,
         )
-
@@ -0,0 +1,82 @@
+import calendar
+import re
+from datetime import date
+
+MONTHS = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3, "apr": 4, "april": 4,
+    "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7, "aug": 8, "august": 8, "sep": 9, "sept": 9,
+    "september": 9, "oct": 10, "october": 10, "nov": 11, "november": 11, "dec": 12, "december": 12,
+}
+
+_QUARTER_RE = re.compile(r"\bQ([1-4])\s*[-']?\s*FY\s*'?(\d{2}(?:\d{2})?)\b", re.IGNORECASE)
+_HALF_RE = re.compile(r"\bH([12])\s*[-']?\s*FY\s*'?(\d{2}(?:\d{2})?)\b", re.IGNORECASE)
+_FY_RE = re.compile(r"\bFY\s*'?(\d{2}(?:\d{2})?)(?:\s*[-/]\s*(\d{2}(?:\d{2})?))?\b", re.IGNORECASE)
+_NUMERIC_DATE_RE = re.compile(r"\b(\d{1,2})[./-](\d{1,2})[./-](\d{4}|\d{2})\b")
+_DAY_MONTH_YEAR_RE = re.compile(r"\b(\d{1,2})(?:st|nd|rd|th)?[\s-]+([A-Za-z]{3,9})[,\s-]+(\d{4}|\d{2})\b")
+_MONTH_DAY_YEAR_RE = re.compile(r"\b([A-Za-z]{3,9})\s+(\d{1,2}),?\s+(\d{4})\b")
+_MONTH_YEAR_RE = re.compile(r"\b([A-Za-z]{3,9})[\s'-]+(\d{4}|\d{2})\b")
+_YEAR_RE = re.compile(r"\b((?:19|20)\d{2})\b")
+
+# Indian fiscal years run April to March, so FY25 ends on 31 March 2025 and Q1 FY25 on 30 June 2024.
+_QUARTER_END = {1: (-1, 6, 30), 2: (-1, 9, 30), 3: (-1, 12, 31), 4: (0, 3, 31)}
+_HALF_END = {1: (-1, 9, 30), 2: (0, 3, 31)}
+
+
+def _year(value: str) -> int:
+    year = int(value)
+    return year + 2000 if year < 100 else year
+
+
+def _safe_date(year: int, month: int, day: int | None = None) -> date | None:
+    if not 1 <= month <= 12 or not 1900 <= year <= 2200:
+        return None
+    last_day = calendar.monthrange(year, month)[1]
+    if day is None:
+        return date(year, month, last_day)
+    if not 1 <= day <= last_day:
+        return None
+    return date(year, month, day)
+
+
+def _fiscal_end(fiscal_year: int, offsets: tuple[int, int, int]) -> date:
+    year_offset, month, day = offsets
+    return date(fiscal_year + year_offset, month, day)
+
+
+def parse_period_end(text: str) -> date | None:
+    if not text:
+        return None
+    if match := _QUARTER_RE.search(text):
+        return _fiscal_end(_year(match.group(2)), _QUARTER_END[int(match.group(1))])
+    if match := _HALF_RE.search(text):
+        return _fiscal_end(_year(match.group(2)), _HALF_END[int(match.group(1))])
+    if match := _FY_RE.search(text):
+        end_year = match.group(2) or match.group(1)
+        return date(_year(end_year), 3, 31)
+    if match := _NUMERIC_DATE_RE.search(text):
+        first, second, year = int(match.group(1)), int(match.group(2)), _year(match.group(3))
+        # Day-first unless that is impossible (results tables are mostly dd.mm.yyyy).
+        parsed = _safe_date(year, second, first) if second <= 12 else _safe_date(year, first, second)
+        if parsed:
+            return parsed
+    for match in _DAY_MONTH_YEAR_RE.finditer(text):
+        month = MONTHS.get(match.group(2).lower())
+        if month and (parsed := _safe_date(_year(match.group(3)), month, int(match.group(1)))):
+            return parsed
+    for match in _MONTH_DAY_YEAR_RE.finditer(text):
+        month = MONTHS.get(match.group(1).lower())
+        if month and (parsed := _safe_date(_year(match.group(3)), month, int(match.group(2)))):
+            return parsed
+    for match in _MONTH_YEAR_RE.finditer(text):
+        month = MONTHS.get(match.group(1).lower())
+        if month and (parsed := _safe_date(_year(match.group(2)), month)):
+            return parsed
+    if match := _YEAR_RE.search(text):
+        return date(int(match.group(1)), 12, 31)
+    return None
+
+
+def period_sort_key(text: str) -> int:
+    # Ordinal of the period end date; unparseable labels sort before every real period.
+    parsed = parse_period_end(text)
+    return parsed.toordinal() if parsed else 0
@@ -0,0 +1,192 @@
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from webwatcher.financial.canonical_map import canonicalize_metric_name
+from webwatcher.financial.financial_extractor import REPORT_RE, ExtractedFinancial, MetricProvenance
+from webwatcher.financial.periods import period_sort_key
+from webwatcher.financial.unit_normalizer import normalize_numeric_value
+from webwatcher.normalization.html_normalizer import TableGrid
+
+_NUMBER_CELL_RE = re.compile(r"^\(?\s*-?[\d,]*\d(?:\.\d+)?\s*\)?$")
+_CELL_NOISE_RE = re.compile(r"(?:INR|USD|EUR|Rs\.?|₹|\$|€|%|\*)", re.IGNORECASE)
+_UNIT_RE = re.compile(r"\b(crores?|cr|lakhs?|lacs?|millions?|mn|billions?|bn)\b", re.IGNORECASE)
+_CURRENCY_RE = re.compile(r"\b(INR|USD|EUR|Rs)\b|([₹$€])", re.IGNORECASE)
+_UNIT_ALIASES = {
+    "crores": "crore",
+    "lakhs": "lakh",
+    "lacs": "lakh",
+    "lac": "lakh",
+    "millions": "million",
+    "billions": "billion",
+}
+_CURRENCY_ALIASES = {"rs": "INR", "₹": "INR", "$": "USD", "€": "EUR"}
+# Per-share figures are quoted in currency units even when the table is "in Crore".
+PER_SHARE_METRICS = {"eps"}
+
+
+def parse_number_cell(text: str) -> float | None:
+    cleaned = _CELL_NOISE_RE.sub("", text).strip()
+    if not cleaned or not _NUMBER_CELL_RE.match(cleaned):
+        return None
+    negative = cleaned.startswith("(") and cleaned.endswith(")")
+    value = float(cleaned.strip("() ").replace(",", ""))
+    return -value if negative else value
+
+
+def _detect_unit(text: str) -> str | None:
+    match = _UNIT_RE.search(text)
+    if not match:
+        return None
+    unit = match.group(1).lower()
+    return _UNIT_ALIASES.get(unit, unit)
+
+
+def _detect_currency(text: str) -> str | None:
+    match = _CURRENCY_RE.search(text)
+    if not match:
+        return None
+    currency = match.group(1) or match.group(2)
+    return _CURRENCY_ALIASES.get(currency.lower(), currency.upper())
+
+
+@dataclass
+class TableMatrix:
+    periods: list[str]
+    values: dict[str, dict[str, float]]
+    labels: dict[str, str]
+    unit: str | None
+    currency: str | None
+    report_type: str | None
+    latest_period: str | None = None
+
+    def latest(self) -> dict[str, float]:
+        if self.latest_period is None:
+            return {}
+        return {
+            metric: by_period[self.latest_period]
+            for metric, by_period in self.values.items()
+            if self.latest_period in by_period
+        }
+
+
+@dataclass
+class _Column:
+    index: int
+    header: str
+    sort_key: int = 0
+
+
+def _label_index(row: list[str]) -> int | None:
+    for index, cell in enumerate(row):
+        if any(char.isalpha() for char in cell) and parse_number_cell(cell) is None:
+            return index
+    return None
+
+
+def build_table_matrix(grid: TableGrid) -> TableMatrix | None:
+    rows = grid.rows
+    # Header rows are everything above the first row that has both a label and a number.
+    body_start = None
+    for row_index, row in enumerate(rows):
+        label_index = _label_index(row)
+        if label_index is None:
+            continue
+        if any(parse_number_cell(cell) is not None for cell in row[label_index + 1 :]):
+            body_start = row_index
+            break
+    if body_start is None:
+        return None
+
+    width = len(rows[0])
+    headers = [
+        " ".join(dict.fromkeys(rows[row_index][column] for row_index in range(body_start) if rows[row_index][column]))
+        for column in range(width)
+    ]
+    context = " ".join([grid.caption, *headers])
+    unit = _detect_unit(context)
+    currency = _detect_currency(context)
+    report_match = REPORT_RE.search(context)
+
+    columns = [_Column(index=index, header=header, sort_key=period_sort_key(header)) for index, header in enumerate(headers)]
+    period_columns = [column for column in columns if column.sort_key]
+    if not period_columns:
+        # No recognisable period headers: fall back to the first column holding numbers.
+        for column in columns[1:]:
+            if any(parse_number_cell(row[column.index]) is not None for row in rows[body_start:]):
+                column.header = column.header or f"column {column.index}"
+                period_columns = [column]
+                break
+    if not period_columns:
+        return None
+    period_indexes = {column.index for column in period_columns}
+
+    values: dict[str, dict[str, float]] = {}
+    labels: dict[str, str] = {}
+    for row in rows[body_start:]:
+        label_index = _label_index(row)
+        if label_index is None or label_index in period_indexes or "%" in row[label_index]:
+            continue
+        canonical = canonicalize_metric_name(row[label_index])
+        if not canonical or canonical in values:
+            continue
+        row_unit = None if canonical in PER_SHARE_METRICS else (_detect_unit(row[label_index]) or unit)
+        by_period: dict[str, float] = {}
+        for column in period_columns:
+            raw_value = parse_number_cell(row[column.index])
+            if raw_value is None or column.header in by_period:
+                continue
+            by_period[column.header] = normalize_numeric_value(raw_value, row_unit, currency).base_value
+        if by_period:
+            values[canonical] = by_period
+            labels[canonical] = row[label_index]
+    if not values:
+        return None
+
+    # Latest period end wins; on a tie (quarter and year ending the same day) the leftmost column,
+    # which is the current quarter in the usual results layout.
+    latest = max(period_columns, key=lambda column: (column.sort_key, -column.index))
+    return TableMatrix(
+        periods=[column.header for column in period_columns],
+        values=values,
+        labels=labels,
+        unit=unit,
+        currency=currency,
+        report_type=report_match.group(1).lower() if report_match else None,
+        latest_period=latest.header,
+    )
+
+
+class TableExtractor:
+    def extract(self, grids: Iterable[TableGrid], source: str | None = None) -> ExtractedFinancial:
+        metrics: dict[str, float] = {}
+        provenance: dict[str, MetricProvenance] = {}
+        best_keys: dict[str, int] = {}
+        currency: str | None = None
+        quarter: str | None = None
+        quarter_key = 0
+        report_type: str | None = None
+        for grid in grids:
+            matrix = build_table_matrix(grid)
+            if matrix is None or matrix.latest_period is None:
+                continue
+            matrix_key = period_sort_key(matrix.latest_period)
+            currency = currency or matrix.currency
+            report_type = report_type or matrix.report_type
+            if quarter is None or matrix_key > quarter_key:
+                quarter, quarter_key = matrix.latest_period[:64], matrix_key
+            for metric, value in matrix.latest().items():
+                if metric in best_keys and best_keys[metric] >= matrix_key:
+                    continue
+                best_keys[metric] = matrix_key
+                metrics[metric] = value
+                provenance[metric] = MetricProvenance(
+                    source=source, page=None, line=f"{matrix.labels[metric]} | {matrix.latest_period}"
+                )
+        return ExtractedFinancial(
+            metrics=metrics,
+            currency=currency,
+            quarter=quarter,
+            report_type=report_type,
+            provenance=provenance,
+        )
@@ -0,0 +1,190 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from webwatcher.db.models import MetricSeries
+from webwatcher.financial.periods import parse_period_end
+
+
+@dataclass
+class SeriesMatrix:
+    metric: str
+    company_ids: np.ndarray
+    period_ends: list[date]
+    values: np.ndarray
+
+    def row(self, company_id: int) -> np.ndarray:
+        matches = np.flatnonzero(self.company_ids == company_id)
+        if not matches.size:
+            return np.full(len(self.period_ends), np.nan)
+        return self.values[matches[0]]
+
+
+@dataclass
+class GrowthScreenRow:
+    company_id: int
+    period_end: date
+    latest: float
+    previous: float
+    growth: float
+
+
+def build_series_matrix(
+    metric: str,
+    rows: Sequence[tuple[int, date, float]],
+    period_ends: Sequence[date],
+    company_ids: Sequence[int] | None = None,
+) -> SeriesMatrix:
+    # Companies x periods, NaN where a company has not reported. Periods ascend left to right.
+    axis = sorted(set(period_ends))
+    if company_ids is None:
+        company_axis = np.unique(np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows)))
+    else:
+        company_axis = np.asarray(list(dict.fromkeys(company_ids)), dtype=np.int64)
+    values = np.full((len(company_axis), len(axis)), np.nan)
+    if rows and len(company_axis) and axis:
+        row_companies = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+        row_periods = np.fromiter((row[1].toordinal() for row in rows), dtype=np.int64, count=len(rows))
+        row_values = np.fromiter((row[2] for row in rows), dtype=np.float64, count=len(rows))
+        period_ordinals = np.asarray([period.toordinal() for period in axis], dtype=np.int64)
+
+        order = np.argsort(company_axis)
+        company_pos = np.searchsorted(company_axis, row_companies, sorter=order).clip(max=len(company_axis) - 1)
+        company_index = order[company_pos]
+        period_index = np.searchsorted(period_ordinals, row_periods).clip(max=len(axis) - 1)
+        known = (company_axis[company_index] == row_companies) & (period_ordinals[period_index] == row_periods)
+        values[company_index[known], period_index[known]] = row_values[known]
+    return SeriesMatrix(metric=metric, company_ids=company_axis, period_ends=axis, values=values)
+
+
+def latest_growth(matrix: SeriesMatrix, lag: int = 1) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Growth of each company's most recent reported period against the period `lag` columns
+    # earlier (lag=1 sequential, lag=4 year on year for quarterly series). Companies still
+    # waiting to report this season compare their own latest quarter rather than dropping out.
+    count, width = matrix.values.shape
+    latest_index = np.full(count, -1, dtype=np.int64)
+    latest = np.full(count, np.nan)
+    previous = np.full(count, np.nan)
+    if count and width:
+        reported = ~np.isnan(matrix.values)
+        has_any = reported.any(axis=1)
+        latest_index = np.where(has_any, width - 1 - np.argmax(reported[:, ::-1], axis=1), -1)
+        rows = np.arange(count)
+        latest = np.where(has_any, matrix.values[rows, latest_index.clip(min=0)], np.nan)
+        previous_index = latest_index - lag
+        valid = has_any & (previous_index >= 0)
+        previous = np.where(valid, matrix.values[rows, previous_index.clip(min=0)], np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = np.where(
+            np.isfinite(previous) & (previous != 0), (latest - previous) / np.abs(previous), np.nan
+        )
+    return latest_index, latest, previous, growth
+
+
+class MetricSeriesStore:
+    async def record(
+        self,
+        session: AsyncSession,
+        company_id: int,
+        metrics: dict[str, float],
+        period: str | None,
+        snapshot_id: int | None = None,
+        currency: str | None = None,
+        report_type: str | None = None,
+        confidence: dict[str, float] | None = None,
+    ) -> int:
+        period_end = parse_period_end(period or "")
+        if period_end is None or not metrics:
+            return 0
+        confidence = confidence or {}
+        existing = await session.execute(
+            select(MetricSeries).where(
+                MetricSeries.company_id == company_id,
+                MetricSeries.metric_name.in_(list(metrics)),
+                MetricSeries.period_end == period_end,
+            )
+        )
+        by_metric = {row.metric_name: row for row in existing.scalars().all()}
+        new_rows: list[dict] = []
+        for metric_name, value in metrics.items():
+            point = by_metric.get(metric_name)
+            if point is None:
+                new_rows.append(
+                    {
+                        "company_id": company_id,
+                        "metric_name": metric_name,
+                        "period_end": period_end,
+                        "period_label": period[:64] if period else None,
+                        "value": value,
+                        "currency": currency,
+                        "report_type": report_type,
+                        "confidence": confidence.get(metric_name, 0.5),
+                        "source_snapshot_id": snapshot_id,
+                    }
+                )
+                continue
+            if point.value != value:
+                # The point now describes the new source; labels it left out keep their old values.
+                point.value = value
+                point.confidence = confidence.get(metric_name, point.confidence)
+                point.source_snapshot_id = snapshot_id
+                point.period_label = period[:64] if period else point.period_label
+                point.currency = currency or point.currency
+                point.report_type = report_type or point.report_type
+        if new_rows:
+            await session.execute(insert(MetricSeries), new_rows)
+        return len(new_rows)
+
+    async def matrix(
+        self,
+        session: AsyncSession,
+        metric: str,
+        company_ids: Sequence[int] | None = None,
+        periods: int = 12,
+        until: date | None = None,
+    ) -> SeriesMatrix:
+        axis_query = select(MetricSeries.period_end).where(MetricSeries.metric_name == metric).distinct()
+        if company_ids is not None:
+            axis_query = axis_query.where(MetricSeries.company_id.in_(list(company_ids)))
+        if until is not None:
+            axis_query = axis_query.where(MetricSeries.period_end <= until)
+        axis_result = await session.execute(axis_query.order_by(MetricSeries.period_end.desc()).limit(periods))
+        period_ends = list(axis_result.scalars().all())
+        rows: list[tuple[int, date, float]] = []
+        if period_ends:
+            query = select(MetricSeries.company_id, MetricSeries.period_end, MetricSeries.value).where(
+                MetricSeries.metric_name == metric,
+                MetricSeries.period_end.in_(period_ends),
+            )
+            if company_ids is not None:
+                query = query.where(MetricSeries.company_id.in_(list(company_ids)))
+            rows = [tuple(row) for row in (await session.execute(query)).all()]
+        return build_series_matrix(metric, rows, period_ends, company_ids)
+
+    async def screen_growth(
+        self,
+        session: AsyncSession,
+        metric: str,
+        min_growth: float,
+        lag: int = 1,
+        periods: int = 12,
+        company_ids: Sequence[int] | None = None,
+    ) -> list[GrowthScreenRow]:
+        matrix = await self.matrix(session, metric, company_ids=company_ids, periods=periods)
+        latest_index, latest, previous, growth = latest_growth(matrix, lag)
+        selected = np.flatnonzero(np.nan_to_num(growth, nan=-np.inf) >= min_growth)
+        selected = selected[np.argsort(-growth[selected], kind="stable")]
+        return [
+            GrowthScreenRow(
+                company_id=int(matrix.company_ids[index]),
+                period_end=matrix.period_ends[latest_index[index]],
+                latest=float(latest[index]),
+                previous=float(previous[index]),
+                growth=float(growth[index]),
+            )
+            for index in selected
+        ]
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 UNIT_MULTIPLIERS = {
     "cr": 10_000_000,
     "crore": 10_000_000,
+    "lakh": 100_000,
     "mn": 1_000_000,
     "million": 1_000_000,
     "bn": 1_000_000_000,
@@ -1,7 +1,13 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 from webwatcher.db.models import ChangeType
+from webwatcher.intelligence.text_similarity import COSMETIC, TextChangeScorer
+
+FINANCIAL_CHANGE_THRESHOLD = 0.02
 
 
 @dataclass
@@ -12,7 +18,34 @@ class ChangeDetectionResult:
     score: float
 
 
+@dataclass
+class BatchFinancialDelta:
+    metric_names: list[str]
+    deltas: np.ndarray
+    max_change: np.ndarray
+    scores: np.ndarray
+
+    @property
+    def financial_mask(self) -> np.ndarray:
+        return self.max_change > FINANCIAL_CHANGE_THRESHOLD
+
+
+def metric_matrix(rows: Sequence[dict[str, float] | None], metric_names: Sequence[str]) -> np.ndarray:
+    # One row per company, one column per metric, NaN where the metric is absent.
+    matrix = np.full((len(rows), len(metric_names)), np.nan)
+    columns = {name: index for index, name in enumerate(metric_names)}
+    for row_index, row in enumerate(rows):
+        for name, value in (row or {}).items():
+            column = columns.get(name)
+            if column is not None and value is not None:
+                matrix[row_index, column] = value
+    return matrix
+
+
 class ChangeDetector:
+    def __init__(self, text_scorer: TextChangeScorer | None = None) -> None:
+        self.text_scorer = text_scorer
+
     def detect(
         self,
         old_snapshot: dict[str, Any] | None,
@@ -20,10 +53,11 @@ class ChangeDetector:
         old_financial: dict[str, float] | None,
         new_financial: dict[str, float],
         pdf_changed: bool,
+        pdf_changes: list[dict[str, Any]] | None = None,
     ) -> ChangeDetectionResult:
         if old_financial and new_financial:
             delta = self._financial_delta(old_financial, new_financial)
-            if delta["max_change"] > 0.02:
+            if delta["max_change"] > FINANCIAL_CHANGE_THRESHOLD:
                 return ChangeDetectionResult(
                     change_type=ChangeType.financial.value,
                     summary="Financial metrics changed",
@@ -31,19 +65,40 @@ class ChangeDetector:
                     score=min(1.0, delta["max_change"]),
                 )
         if pdf_changed:
+            details: dict[str, Any] = {"pdf_changed": True}
+            summary = "Document update detected"
+            if pdf_changes:
+                details["documents"] = pdf_changes
+                changed_pages = sum(len(item.get("changed_pages", [])) for item in pdf_changes)
+                if changed_pages:
+                    summary = f"Document update detected ({changed_pages} page(s) changed)"
             return ChangeDetectionResult(
                 change_type=ChangeType.document.value,
-                summary="Document update detected",
-                details={"pdf_changed": True},
+                summary=summary,
+                details=details,
                 score=0.6,
             )
         old_hash = (old_snapshot or {}).get("page_hash")
         new_hash = new_snapshot.get("page_hash")
         if old_hash != new_hash:
+            details = {"old_hash": old_hash, "new_hash": new_hash}
+            assessment = None
+            if old_snapshot:
+                self.text_scorer = self.text_scorer or TextChangeScorer()
+                assessment = self.text_scorer.assess(old_snapshot, new_snapshot)
+            if assessment is not None:
+                details.update(assessment.as_details())
+                if assessment.verdict == COSMETIC:
+                    return ChangeDetectionResult(
+                        change_type=ChangeType.text.value,
+                        summary="Cosmetic text change",
+                        details=details,
+                        score=0.0,
+                    )
             return ChangeDetectionResult(
                 change_type=ChangeType.text.value,
                 summary="Textual content changed",
-                details={"old_hash": old_hash, "new_hash": new_hash},
+                details=details,
                 score=0.35,
             )
         return ChangeDetectionResult(
@@ -65,3 +120,23 @@ class ChangeDetector:
             max_change = max(max_change, change)
         return {"deltas": deltas, "max_change": max_change}
 
+    def batch_financial_delta(
+        self, old: np.ndarray, new: np.ndarray, metric_names: Sequence[str] | None = None
+    ) -> BatchFinancialDelta:
+        # Same rules as _financial_delta for every company at once: a metric only counts when it
+        # is present in both matrices and the old value is non-zero.
+        old = np.asarray(old, dtype=np.float64)
+        new = np.asarray(new, dtype=np.float64)
+        if old.shape != new.shape:
+            raise ValueError(f"Metric matrices differ in shape: {old.shape} vs {new.shape}")
+        comparable = ~np.isnan(old) & ~np.isnan(new) & (old != 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            deltas = np.where(comparable, np.abs(new - old) / np.abs(old), np.nan)
+        max_change = np.max(np.where(comparable, deltas, 0.0), axis=1, initial=0.0)
+        scores = np.where(max_change > FINANCIAL_CHANGE_THRESHOLD, np.minimum(1.0, max_change), 0.0)
+        return BatchFinancialDelta(
+            metric_names=list(metric_names or []),
+            deltas=deltas,
+            max_change=max_change,
+            scores=scores,
+        )
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+import numpy as np
+
 from webwatcher.core.config import get_settings
 from webwatcher.db.models import Severity
 
@@ -10,6 +12,12 @@ class MaterialityResult:
     score: float
 
 
+@dataclass
+class BatchMaterialityResult:
+    severities: np.ndarray
+    scores: np.ndarray
+
+
 class MaterialityEngine:
     def __init__(self) -> None:
         settings = get_settings()
@@ -30,3 +38,11 @@ class MaterialityEngine:
             severity = Severity.minor.value
         return MaterialityResult(severity=severity, score=score)
 
+    def score_batch(self, raw_scores: np.ndarray) -> BatchMaterialityResult:
+        scores = np.clip(np.nan_to_num(np.asarray(raw_scores, dtype=np.float64), nan=0.0), 0.0, 1.0)
+        severities = np.select(
+            [scores >= self.critical, scores >= self.significant, scores >= self.moderate],
+            [Severity.critical.value, Severity.significant.value, Severity.moderate.value],
+            default=Severity.minor.value,
+        )
+        return BatchMaterialityResult(severities=severities, scores=scores)
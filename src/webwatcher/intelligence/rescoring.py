@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from webwatcher.db.models import Change
+from webwatcher.intelligence.materiality_engine import MaterialityEngine
+
+RESCORE_CHUNK_SIZE = 5000
+
+
+@dataclass
+class RescoreReport:
+    scanned: int = 0
+    updated: int = 0
+
+
+async def rescore_changes(
+    session: AsyncSession,
+    engine: MaterialityEngine | None = None,
+    chunk_size: int = RESCORE_CHUNK_SIZE,
+) -> RescoreReport:
+    # Change.score already holds the clipped raw score, so new thresholds only need a fresh
+    # severity bucket per row: one vectorised pass per chunk and a bulk update of the rows
+    # whose bucket moved.
+    engine = engine or MaterialityEngine()
+    report = RescoreReport()
+    last_id = 0
+    while True:
+        result = await session.execute(
+            select(Change.id, Change.score, Change.severity)
+            .where(Change.id > last_id)
+            .order_by(Change.id)
+            .limit(chunk_size)
+        )
+        rows = result.all()
+        if not rows:
+            break
+        ids = np.fromiter((row.id for row in rows), dtype=np.int64, count=len(rows))
+        scores = np.fromiter((row.score for row in rows), dtype=np.float64, count=len(rows))
+        current = np.asarray([row.severity for row in rows])
+        rescored = engine.score_batch(scores)
+        moved = np.flatnonzero(rescored.severities != current)
+        if moved.size:
+            await session.execute(
+                update(Change),
+                [{"id": int(ids[index]), "severity": str(rescored.severities[index])} for index in moved],
+            )
+        report.scanned += len(rows)
+        report.updated += int(moved.size)
+        last_id = int(ids[-1])
+    await session.flush()
+    return report
@@ -0,0 +1,106 @@
+import hashlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from webwatcher.core.config import get_settings
+
+SHINGLE_SIZE = 4
+COSMETIC = "cosmetic"
+AMBIGUOUS = "ambiguous"
+MEANINGFUL = "meaningful"
+
+
+@dataclass
+class TextChangeAssessment:
+    verdict: str
+    score: float
+    text_distance: float
+    numeric_delta: float
+    section_ratio: float
+
+    def as_details(self) -> dict[str, Any]:
+        return {
+            "verdict": self.verdict,
+            "text_score": round(self.score, 4),
+            "text_distance": round(self.text_distance, 4),
+            "numeric_delta": round(self.numeric_delta, 4),
+            "section_ratio": round(self.section_ratio, 4),
+        }
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[int]:
+    words = text.lower().split()
+    if len(words) < size:
+        return {_stable_hash(" ".join(words))} if words else set()
+    return {_stable_hash(" ".join(words[index : index + size])) for index in range(len(words) - size + 1)}
+
+
+def _stable_hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def jaccard(left: set, right: set) -> float:
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+
+def numeric_delta(old_numbers: list[str], new_numbers: list[str]) -> float:
+    # Multiset difference: a figure moving from 120 to 125 counts, reordering a list does not.
+    old_counts = Counter(old_numbers)
+    new_counts = Counter(new_numbers)
+    union = sum((old_counts | new_counts).values())
+    if not union:
+        return 0.0
+    return sum(((old_counts - new_counts) + (new_counts - old_counts)).values()) / union
+
+
+def section_ratio(old_sections: dict[str, str], new_sections: dict[str, str]) -> float:
+    old_hashes = Counter(old_sections.values())
+    new_hashes = Counter(new_sections.values())
+    union = sum((old_hashes | new_hashes).values())
+    if not union:
+        return 0.0
+    return sum(((old_hashes - new_hashes) + (new_hashes - old_hashes)).values()) / union
+
+
+def changed_section_text(old_snapshot: dict[str, Any], new_snapshot: dict[str, Any], limit: int = 6000) -> tuple[str, str]:
+    # Only the sections that differ, so an escalated LLM call sees the diff and not the whole page.
+    old_texts = [item.get("text", "") for item in old_snapshot.get("structured_sections") or []]
+    new_texts = [item.get("text", "") for item in new_snapshot.get("structured_sections") or []]
+    old_set, new_set = set(old_texts), set(new_texts)
+    removed = "\n".join(text for text in old_texts if text not in new_set)
+    added = "\n".join(text for text in new_texts if text not in old_set)
+    return removed[:limit], added[:limit]
+
+
+class TextChangeScorer:
+    def __init__(self) -> None:
+        settings = get_settings()
+        self.cosmetic_threshold = settings.webwatch_text_cosmetic_threshold
+        self.meaningful_threshold = settings.webwatch_text_meaningful_threshold
+
+    def assess(self, old_snapshot: dict[str, Any], new_snapshot: dict[str, Any]) -> TextChangeAssessment | None:
+        old_text = old_snapshot.get("clean_text")
+        new_text = new_snapshot.get("clean_text")
+        if old_text is None or new_text is None:
+            return None
+        text_distance = 1.0 - jaccard(shingles(old_text), shingles(new_text))
+        numbers = numeric_delta(old_snapshot.get("numbers") or [], new_snapshot.get("numbers") or [])
+        sections = section_ratio(old_snapshot.get("section_hashes") or {}, new_snapshot.get("section_hashes") or {})
+        # Numbers carry the most signal on IR pages; wording churn and section moves less so.
+        score = min(1.0, 0.4 * text_distance + 0.4 * numbers + 0.2 * sections)
+        if score < self.cosmetic_threshold:
+            verdict = COSMETIC
+        elif score >= self.meaningful_threshold:
+            verdict = MEANINGFUL
+        else:
+            verdict = AMBIGUOUS
+        return TextChangeAssessment(
+            verdict=verdict,
+            score=score,
+            text_distance=text_distance,
+            numeric_delta=numbers,
+            section_ratio=sections,
+        )
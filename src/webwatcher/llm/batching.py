@@ -0,0 +1,95 @@
+import asyncio
+import json
+from dataclasses import dataclass
+
+from webwatcher.llm.llm_client import LlmClient, LlmResult, input_hash
+from webwatcher.observability.metrics import metrics
+
+BATCH_INSTRUCTIONS = (
+    "\n\nYou will receive a JSON object {\"items\": [{\"id\", \"input\"}]}. Apply the instructions "
+    "above to each item's input independently and return JSON {\"results\": {<id>: <result object>}}."
+)
+
+
+@dataclass
+class _PendingRequest:
+    user_prompt: str
+    future: asyncio.Future
+
+
+class LlmMicroBatcher:
+    # Requests sharing a system prompt that arrive within the window are merged into one chat
+    # completion. Items the model fails to answer in the batch fall back to individual calls.
+    # Callers already hold the single-flight slot for each prompt, so requests go straight to
+    # the API through request_json; complete_json would wait on the caller's own flight.
+
+    def __init__(self, client: LlmClient, max_batch: int = 8, window_ms: int = 50) -> None:
+        self.client = client
+        self.max_batch = max(1, max_batch)
+        self.window_seconds = max(0, window_ms) / 1000
+        self._pending: dict[str, list[_PendingRequest]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, system_prompt: str, user_prompt: str) -> LlmResult:
+        loop = asyncio.get_running_loop()
+        request = _PendingRequest(user_prompt=user_prompt, future=loop.create_future())
+        group = self._pending.setdefault(system_prompt, [])
+        group.append(request)
+        if len(group) >= self.max_batch:
+            self._flush(system_prompt)
+        elif system_prompt not in self._timers:
+            self._timers[system_prompt] = loop.call_later(self.window_seconds, self._flush, system_prompt)
+        return await request.future
+
+    def _flush(self, system_prompt: str) -> None:
+        timer = self._timers.pop(system_prompt, None)
+        if timer is not None:
+            timer.cancel()
+        requests = self._pending.pop(system_prompt, [])
+        if not requests:
+            return
+        task = asyncio.ensure_future(self._run(system_prompt, requests))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_single(self, system_prompt: str, request: _PendingRequest) -> None:
+        try:
+            request.future.set_result(await self.client.request_json(system_prompt, request.user_prompt))
+        except Exception as exc:
+            request.future.set_exception(exc)
+
+    async def _run(self, system_prompt: str, requests: list[_PendingRequest]) -> None:
+        if len(requests) == 1:
+            await self._run_single(system_prompt, requests[0])
+            return
+        metrics.inc("llm_batches_total")
+        metrics.inc("llm_batched_requests_total", len(requests))
+        items = [{"id": str(index), "input": request.user_prompt} for index, request in enumerate(requests)]
+        try:
+            batched = await self.client.request_json(system_prompt + BATCH_INSTRUCTIONS, json.dumps({"items": items}))
+        except Exception as exc:
+            for request in requests:
+                request.future.set_exception(exc)
+            return
+        results = batched.payload.get("results")
+        results = results if isinstance(results, dict) else {}
+        share = len(requests)
+        leftovers: list[_PendingRequest] = []
+        for index, request in enumerate(requests):
+            payload = results.get(str(index))
+            if not isinstance(payload, dict):
+                leftovers.append(request)
+                continue
+            request.future.set_result(
+                LlmResult(
+                    payload=payload,
+                    prompt_tokens=(batched.prompt_tokens or 0) // share,
+                    completion_tokens=(batched.completion_tokens or 0) // share,
+                    latency_ms=batched.latency_ms,
+                    input_hash=input_hash(system_prompt, request.user_prompt),
+                )
+            )
+        if leftovers:
+            metrics.inc("llm_batch_fallbacks_total", len(leftovers))
+            await asyncio.gather(*(self._run_single(system_prompt, request) for request in leftovers))
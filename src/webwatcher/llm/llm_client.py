@@ -1,12 +1,59 @@
+import asyncio
 import hashlib
 import json
 import time
+import weakref
 from dataclasses import dataclass
 from typing import Any
 
-from openai import AzureOpenAI
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncAzureOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from webwatcher.core.config import get_settings
+from webwatcher.db.models import LlmEvent
+from webwatcher.observability.metrics import Timer, metrics
+
+RETRYABLE_ERRORS = (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError, asyncio.TimeoutError)
+
+# One semaphore per event loop: Celery tasks each run their own loop, and asyncio primitives
+# cannot be shared between loops.
+_loop_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _llm_slots(limit: int) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    slots = _loop_slots.get(loop)
+    if slots is None:
+        slots = asyncio.Semaphore(max(1, limit))
+        _loop_slots[loop] = slots
+    return slots
+
+
+# One client per event loop: concurrent scans share its connection pool and micro-batcher.
+_loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LlmClient]" = weakref.WeakKeyDictionary()
+
+
+def shared_llm_client() -> "LlmClient":
+    loop = asyncio.get_running_loop()
+    client = _loop_clients.get(loop)
+    if client is None:
+        client = LlmClient()
+        _loop_clients[loop] = client
+    return client
+
+
+async def close_shared_llm_client() -> None:
+    client = _loop_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
 
 
 @dataclass
@@ -16,6 +63,11 @@ class LlmResult:
     completion_tokens: int | None
     latency_ms: int
     input_hash: str
+    cached: bool = False
+
+
+def input_hash(system_prompt: str, user_prompt: str) -> str:
+    return hashlib.sha256(f"{system_prompt}\n{user_prompt}".encode()).hexdigest()
 
 
 class LlmClient:
@@ -23,32 +75,77 @@ class LlmClient:
         settings = get_settings()
         self.settings = settings
         self.client = None
+        self.batcher = None
+        self.single_flight = None
         if settings.azure_openai_endpoint and settings.azure_openai_key:
-            self.client = AzureOpenAI(
+            # Retries are handled below with jitter, so the SDK's own retry loop is disabled.
+            self.client = AsyncAzureOpenAI(
                 api_key=settings.azure_openai_key,
                 api_version=settings.azure_openai_api_version,
                 azure_endpoint=settings.azure_openai_endpoint,
+                timeout=settings.webwatch_llm_timeout_seconds,
+                max_retries=0,
             )
+            if settings.webwatch_llm_batch_size > 1:
+                from webwatcher.llm.batching import LlmMicroBatcher
+
+                self.batcher = LlmMicroBatcher(
+                    self,
+                    max_batch=settings.webwatch_llm_batch_size,
+                    window_ms=settings.webwatch_llm_batch_window_ms,
+                )
+            if settings.webwatch_llm_single_flight_wait_seconds > 0:
+                from webwatcher.llm.single_flight import LlmSingleFlight
+
+                self.single_flight = LlmSingleFlight()
 
     def enabled(self) -> bool:
         return self.client is not None
 
-    def complete_json(self, system_prompt: str, user_prompt: str) -> LlmResult:
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.close()
+
+    async def complete_json(self, system_prompt: str, user_prompt: str) -> LlmResult:
         if not self.client:
             raise RuntimeError("Azure OpenAI client is not configured.")
-        content = f"{system_prompt}\n{user_prompt}"
-        payload_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
-        start = time.perf_counter()
-        response = self.client.chat.completions.create(
-            model=self.settings.azure_openai_deployment,
-            temperature=0,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
+        if self.single_flight is None:
+            return await self.request_json(system_prompt, user_prompt)
+        return await self.single_flight.run(
+            input_hash(system_prompt, user_prompt),
+            lambda: self.request_json(system_prompt, user_prompt),
         )
-        latency_ms = int((time.perf_counter() - start) * 1000)
+
+    async def request_json(self, system_prompt: str, user_prompt: str) -> LlmResult:
+        # One API call with retries and no single-flight, for callers that already hold the flight
+        # for this prompt, such as LlmMicroBatcher.
+        payload_hash = input_hash(system_prompt, user_prompt)
+        retrying = AsyncRetrying(
+            wait=wait_random_exponential(multiplier=0.5, max=8),
+            stop=stop_after_attempt(max(0, self.settings.webwatch_llm_max_retries) + 1),
+            retry=retry_if_exception_type(RETRYABLE_ERRORS),
+            reraise=True,
+        )
+        async for attempt in retrying:
+            with attempt:
+                if attempt.retry_state.attempt_number > 1:
+                    metrics.inc("llm_retries_total")
+                async with _llm_slots(self.settings.webwatch_llm_max_concurrency):
+                    start = time.perf_counter()
+                    with Timer("llm_request_ms"):
+                        response = await asyncio.wait_for(
+                            self.client.chat.completions.create(
+                                model=self.settings.azure_openai_deployment,
+                                temperature=0,
+                                messages=[
+                                    {"role": "system", "content": system_prompt},
+                                    {"role": "user", "content": user_prompt},
+                                ],
+                                response_format={"type": "json_object"},
+                            ),
+                            timeout=self.settings.webwatch_llm_timeout_seconds,
+                        )
+                    latency_ms = int((time.perf_counter() - start) * 1000)
         raw = response.choices[0].message.content or "{}"
         parsed = json.loads(raw)
         usage = response.usage
@@ -60,3 +157,78 @@ class LlmClient:
             input_hash=payload_hash,
         )
 
+    async def complete_json_cached(
+        self,
+        session: AsyncSession,
+        purpose: str,
+        prompt_version: str,
+        system_prompt: str,
+        user_prompt: str,
+        scan_run_id: int | None = None,
+    ) -> LlmResult:
+        # Identical prompts to the same deployment and prompt version are answered from
+        # llm_events, so re-scanning unchanged content costs no tokens. Every call is logged; hits are
+        # marked cached with zero tokens, so hit rates can be read back from llm_events.
+        model = self.settings.azure_openai_deployment
+        payload_hash = input_hash(system_prompt, user_prompt)
+        cached = await session.execute(
+            select(LlmEvent.output_json)
+            .where(
+                LlmEvent.input_hash == payload_hash,
+                LlmEvent.model == model,
+                LlmEvent.prompt_version == prompt_version,
+            )
+            .order_by(LlmEvent.created_at.desc())
+            .limit(1)
+        )
+        output = cached.scalar_one_or_none()
+        if output is not None:
+            metrics.inc("llm_cache_hits_total")
+            result = LlmResult(
+                payload=output,
+                prompt_tokens=0,
+                completion_tokens=0,
+                latency_ms=0,
+                input_hash=payload_hash,
+                cached=True,
+            )
+            await self._log_event(session, purpose, model, prompt_version, result, scan_run_id)
+            return result
+        metrics.inc("llm_cache_misses_total")
+        if self.batcher is not None and self.single_flight is not None:
+            result = await self.single_flight.run(
+                payload_hash, lambda: self.batcher.submit(system_prompt, user_prompt)
+            )
+        elif self.batcher is not None:
+            result = await self.batcher.submit(system_prompt, user_prompt)
+        else:
+            result = await self.complete_json(system_prompt, user_prompt)
+        await self._log_event(session, purpose, model, prompt_version, result, scan_run_id)
+        metrics.inc("llm_prompt_tokens_total", result.prompt_tokens or 0)
+        metrics.inc("llm_completion_tokens_total", result.completion_tokens or 0)
+        return result
+
+    async def _log_event(
+        self,
+        session: AsyncSession,
+        purpose: str,
+        model: str,
+        prompt_version: str,
+        result: LlmResult,
+        scan_run_id: int | None,
+    ) -> None:
+        session.add(
+            LlmEvent(
+                scan_run_id=scan_run_id,
+                purpose=purpose,
+                model=model,
+                prompt_version=prompt_version,
+                input_hash=result.input_hash,
+                output_json=result.payload,
+                prompt_tokens=result.prompt_tokens,
+                completion_tokens=result.completion_tokens,
+                latency_ms=result.latency_ms,
+                cached=result.cached,
+            )
+        )
+        await session.flush()
@@ -1,7 +1,16 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from webwatcher.financial.financial_extractor import TextChunk
 from webwatcher.llm.llm_client import LlmClient
+from webwatcher.llm.prompt_builder import FinancialPromptBuilder
+from webwatcher.observability.metrics import metrics
+
+PURPOSE = "financial_validation"
+PROMPT_VERSION = "financial-v1"
 
 
 @dataclass
@@ -9,13 +18,22 @@ class FinancialValidationResult:
     merged_metrics: dict[str, float]
     agreement_score: float
     llm_payload: dict[str, Any] | None
+    prompt_tokens: int | None = None
 
 
 class LlmFinancialValidator:
-    def __init__(self, client: LlmClient) -> None:
+    def __init__(self, client: LlmClient, prompt_builder: FinancialPromptBuilder | None = None) -> None:
         self.client = client
+        self.prompt_builder = prompt_builder
 
-    def validate(self, text: str, deterministic: dict[str, float]) -> FinancialValidationResult:
+    async def validate(
+        self,
+        text: str,
+        deterministic: dict[str, float],
+        session: AsyncSession | None = None,
+        scan_run_id: int | None = None,
+        pdf_pages: Iterable[TextChunk] = (),
+    ) -> FinancialValidationResult:
         if not self.client.enabled():
             return FinancialValidationResult(
                 merged_metrics=deterministic,
@@ -26,13 +44,24 @@ class LlmFinancialValidator:
             "Extract JSON with keys revenue, net_profit, ebitda, eps when present. "
             "Return numbers only."
         )
-        result = self.client.complete_json(prompt, text[:12000])
+        self.prompt_builder = self.prompt_builder or FinancialPromptBuilder()
+        built = self.prompt_builder.build(text, pdf_pages)
+        metrics.inc("llm_financial_prompts_total")
+        metrics.inc("llm_financial_prompt_estimated_tokens_total", built.estimated_tokens)
+        metrics.inc("llm_financial_prompt_sections_dropped_total", built.dropped)
+        if session is None:
+            result = await self.client.complete_json(prompt, built.text)
+        else:
+            result = await self.client.complete_json_cached(
+                session, PURPOSE, PROMPT_VERSION, prompt, built.text, scan_run_id=scan_run_id
+            )
+        prompt_tokens = result.prompt_tokens if result.prompt_tokens is not None else built.estimated_tokens
         llm_metrics = {k: float(v) for k, v in result.payload.items() if _is_number(v)}
         if not deterministic:
-            return FinancialValidationResult(llm_metrics, 0.5, result.payload)
+            return FinancialValidationResult(llm_metrics, 0.5, result.payload, prompt_tokens)
         overlap = set(deterministic).intersection(llm_metrics)
         if not overlap:
-            return FinancialValidationResult(deterministic, 0.1, result.payload)
+            return FinancialValidationResult(deterministic, 0.1, result.payload, prompt_tokens)
         agreements = []
         for key in overlap:
             a = deterministic[key]
@@ -45,7 +74,7 @@ class LlmFinancialValidator:
         merged = deterministic.copy()
         for key, value in llm_metrics.items():
             merged.setdefault(key, value)
-        return FinancialValidationResult(merged, score, result.payload)
+        return FinancialValidationResult(merged, score, result.payload, prompt_tokens)
 
 
 def _is_number(value: Any) -> bool:
@@ -1,7 +1,12 @@
 from dataclasses import dataclass
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from webwatcher.llm.llm_client import LlmClient
 
+PURPOSE = "section_classification"
+PROMPT_VERSION = "section-v1"
+
 
 @dataclass
 class SectionClassification:
@@ -14,7 +19,13 @@ class LlmSectionClassifier:
     def __init__(self, client: LlmClient) -> None:
         self.client = client
 
-    def classify_diff(self, old_text: str, new_text: str) -> SectionClassification:
+    async def classify_diff(
+        self,
+        old_text: str,
+        new_text: str,
+        session: AsyncSession | None = None,
+        scan_run_id: int | None = None,
+    ) -> SectionClassification:
         if not self.client.enabled():
             return SectionClassification(summary="LLM disabled", is_meaningful=True, confidence=0.5)
         system = (
@@ -22,7 +33,12 @@ class LlmSectionClassifier:
             "{summary, is_meaningful, confidence}."
         )
         user = f"OLD:\n{old_text[:6000]}\n\nNEW:\n{new_text[:6000]}"
-        result = self.client.complete_json(system, user)
+        if session is None:
+            result = await self.client.complete_json(system, user)
+        else:
+            result = await self.client.complete_json_cached(
+                session, PURPOSE, PROMPT_VERSION, system, user, scan_run_id=scan_run_id
+            )
         payload = result.payload
         return SectionClassification(
             summary=str(payload.get("summary", "")),
@@ -0,0 +1,147 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from webwatcher.core.config import get_settings
+from webwatcher.financial.alias_matcher import AliasMatcher
+from webwatcher.financial.canonical_map import CANONICAL_METRIC_MAP
+from webwatcher.financial.financial_extractor import DIGIT_RE, TextChunk
+
+_ALIASES = AliasMatcher(CANONICAL_METRIC_MAP)
+_BLOCK_CHARS = 1500
+# Below this many tokens of headroom a truncated section is mostly noise, so packing stops.
+_MIN_PARTIAL_TOKENS = 100
+
+
+def estimate_tokens(text: str) -> int:
+    # Roughly four characters per token for English prose and numbers; close enough for budgeting.
+    return (len(text) + 3) // 4
+
+
+@dataclass
+class PromptSection:
+    text: str
+    label: str
+    order: int
+    alias_hits: int
+    metrics: int
+    tokens: int
+
+    @property
+    def density(self) -> float:
+        # Distinct metrics count double so a results table beats a paragraph repeating "revenue".
+        return (self.alias_hits + 2 * self.metrics) / max(self.tokens, 1)
+
+
+@dataclass
+class BuiltPrompt:
+    text: str
+    estimated_tokens: int
+    sections: list[PromptSection] = field(default_factory=list)
+    dropped: int = 0
+
+
+def _alias_hits(text: str) -> tuple[int, int]:
+    lowered = " ".join(text.lower().split())
+    hits = 0
+    metrics: set[str] = set()
+    for match in _ALIASES.find_all(lowered):
+        before = lowered[match.start - 1] if match.start else " "
+        after = lowered[match.end] if match.end < len(lowered) else " "
+        if before.isalnum() or after.isalnum():
+            continue
+        hits += 1
+        metrics.add(match.canonical)
+    return hits, len(metrics)
+
+
+def _blocks(text: str) -> Iterable[str]:
+    # Page text is one line per heading or paragraph; neighbouring lines are grouped so a metric
+    # label stays next to the figures printed on the following lines.
+    block: list[str] = []
+    size = 0
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if block and size + len(line) > _BLOCK_CHARS:
+            yield "\n".join(block)
+            block, size = [], 0
+        block.append(line)
+        size += len(line) + 1
+    if block:
+        yield "\n".join(block)
+
+
+def _truncate(text: str, tokens: int) -> str:
+    limit = tokens * 4
+    cut = text.rfind("\n", 0, limit)
+    return text[: cut if cut > 0 else limit]
+
+
+class FinancialPromptBuilder:
+    def __init__(self, token_budget: int | None = None) -> None:
+        self.token_budget = token_budget or get_settings().webwatch_llm_prompt_token_budget
+
+    def sections(self, page_text: str, pdf_pages: Iterable[TextChunk] = ()) -> list[PromptSection]:
+        candidates: list[tuple[str, str]] = [("page", block) for block in _blocks(page_text)]
+        for chunk in pdf_pages:
+            page = f" p.{chunk.page}" if chunk.page is not None else ""
+            candidates.append((f"pdf {chunk.source or ''}{page}".strip(), chunk.text.strip()))
+        sections: list[PromptSection] = []
+        for order, (label, text) in enumerate(candidates):
+            if not text or not DIGIT_RE.search(text):
+                continue
+            hits, metrics = _alias_hits(text)
+            if not hits:
+                continue
+            sections.append(
+                PromptSection(
+                    text=text,
+                    label=label,
+                    order=order,
+                    alias_hits=hits,
+                    metrics=metrics,
+                    tokens=estimate_tokens(text),
+                )
+            )
+        return sections
+
+    def build(self, page_text: str, pdf_pages: Iterable[TextChunk] = ()) -> BuiltPrompt:
+        sections = self.sections(page_text, pdf_pages)
+        ranked = sorted(sections, key=lambda section: (-section.density, section.order))
+        chosen: list[PromptSection] = []
+        remaining = self.token_budget
+        for section in ranked:
+            header_tokens = estimate_tokens(f"[{section.label}]\n")
+            if section.tokens + header_tokens <= remaining:
+                chosen.append(section)
+                remaining -= section.tokens + header_tokens
+            elif remaining - header_tokens >= _MIN_PARTIAL_TOKENS:
+                text = _truncate(section.text, remaining - header_tokens)
+                chosen.append(
+                    PromptSection(
+                        text=text,
+                        label=section.label,
+                        order=section.order,
+                        alias_hits=section.alias_hits,
+                        metrics=section.metrics,
+                        tokens=estimate_tokens(text),
+                    )
+                )
+                remaining = 0
+            if remaining < _MIN_PARTIAL_TOKENS:
+                break
+        if not chosen and page_text.strip():
+            # Nothing mentions a known metric alias: send the head of the page, as before, and let
+            # the model look for differently labelled figures.
+            text = _truncate(page_text.strip(), self.token_budget)
+            return BuiltPrompt(text=text, estimated_tokens=estimate_tokens(text), dropped=len(sections))
+        # Document order keeps the prompt readable and the input hash stable for the LLM cache.
+        chosen.sort(key=lambda section: section.order)
+        text = "\n\n".join(f"[{section.label}]\n{section.text}" for section in chosen)
+        return BuiltPrompt(
+            text=text,
+            estimated_tokens=estimate_tokens(text),
+            sections=chosen,
+            dropped=len(sections) - len(chosen),
+        )
@@ -0,0 +1,168 @@
+import asyncio
+import json
+import time
+import uuid
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
+from typing import Any
+
+import redis.asyncio as redis_asyncio
+
+from webwatcher.core.config import get_settings
+from webwatcher.llm.llm_client import LlmResult
+from webwatcher.observability.metrics import metrics
+
+_POLL_SECONDS = 0.1
+_REDIS_RETRY_SECONDS = 30.0
+_RELEASE_SCRIPT = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+
+# In-process leaders per event loop, so duplicate prompts inside one worker never reach Redis.
+_loop_flights: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Future]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _local_flights() -> dict[str, asyncio.Future]:
+    loop = asyncio.get_running_loop()
+    flights = _loop_flights.get(loop)
+    if flights is None:
+        flights = {}
+        _loop_flights[loop] = flights
+    return flights
+
+
+def _shared(result: LlmResult, waited_ms: int) -> LlmResult:
+    # Followers spent no tokens of their own; only the leader's call is billed and logged as such.
+    return LlmResult(
+        payload=result.payload,
+        prompt_tokens=0,
+        completion_tokens=0,
+        latency_ms=waited_ms,
+        input_hash=result.input_hash,
+        cached=True,
+    )
+
+
+class LlmSingleFlight:
+    def __init__(self, client: Any | None = None) -> None:
+        settings = get_settings()
+        self.redis_url = settings.redis_url
+        self.wait_seconds = settings.webwatch_llm_single_flight_wait_seconds
+        self.result_ttl_seconds = settings.webwatch_llm_single_flight_ttl_seconds
+        # The lease outlives the slowest leader: every attempt timing out plus backoff.
+        self.lease_seconds = int(settings.webwatch_llm_timeout_seconds * (max(0, settings.webwatch_llm_max_retries) + 1)) + 10
+        self.client = client
+        self._redis_down_until = 0.0
+
+    def enabled(self) -> bool:
+        return self.wait_seconds > 0
+
+    async def run(self, payload_hash: str, call: Callable[[], Awaitable[LlmResult]]) -> LlmResult:
+        if not self.enabled():
+            return await call()
+        flights = _local_flights()
+        pending = flights.get(payload_hash)
+        if pending is not None:
+            metrics.inc("llm_single_flight_local_shared_total")
+            start = time.perf_counter()
+            try:
+                result = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                return await self.run(payload_hash, call)
+            return _shared(result, int((time.perf_counter() - start) * 1000))
+
+        future = asyncio.get_running_loop().create_future()
+        flights[payload_hash] = future
+        try:
+            result = await self._run_shared(payload_hash, call)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Followers re-raise the leader's error; keep asyncio from warning when there are none.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            flights.pop(payload_hash, None)
+
+    async def _run_shared(self, payload_hash: str, call: Callable[[], Awaitable[LlmResult]]) -> LlmResult:
+        client = self.client
+        owned = False
+        if client is None and time.monotonic() < self._redis_down_until:
+            return await call()
+        if client is None:
+            try:
+                client = redis_asyncio.from_url(
+                    self.redis_url,
+                    decode_responses=True,
+                    socket_connect_timeout=1,
+                    socket_timeout=1,
+                )
+                owned = True
+            except Exception:
+                return await call()
+        try:
+            return await self._coordinate(client, payload_hash, call)
+        finally:
+            if owned:
+                try:
+                    await client.aclose()
+                except Exception:
+                    pass
+
+    async def _coordinate(self, client: Any, payload_hash: str, call: Callable[[], Awaitable[LlmResult]]) -> LlmResult:
+        lock_key = f"llm:flight:{payload_hash}"
+        result_key = f"llm:result:{payload_hash}"
+        token = str(uuid.uuid4())
+        start = time.perf_counter()
+        deadline = start + self.wait_seconds
+        while True:
+            try:
+                stored = await client.get(result_key)
+                if stored is not None:
+                    metrics.inc("llm_single_flight_shared_total")
+                    return _shared(LlmResult(**json.loads(stored)), int((time.perf_counter() - start) * 1000))
+                acquired = await client.set(lock_key, token, nx=True, ex=self.lease_seconds)
+            except Exception:
+                # Redis unavailable: in-process coalescing above still applies, and Redis is
+                # not retried for a while so every prompt does not pay the connect timeout.
+                metrics.inc("llm_single_flight_fallbacks_total")
+                self._redis_down_until = time.monotonic() + _REDIS_RETRY_SECONDS
+                return await call()
+            if acquired:
+                return await self._lead(client, lock_key, result_key, token, call)
+            if time.perf_counter() >= deadline:
+                # The leader is stuck or slow; pay for a duplicate call rather than stall the scan.
+                metrics.inc("llm_single_flight_timeouts_total")
+                return await call()
+            await asyncio.sleep(_POLL_SECONDS)
+
+    async def _lead(
+        self,
+        client: Any,
+        lock_key: str,
+        result_key: str,
+        token: str,
+        call: Callable[[], Awaitable[LlmResult]],
+    ) -> LlmResult:
+        metrics.inc("llm_single_flight_leaders_total")
+        try:
+            result = await call()
+            try:
+                await client.set(result_key, json.dumps(asdict(result)), ex=self.result_ttl_seconds)
+            except Exception:
+                pass
+            return result
+        finally:
+            # Release only our own lease; a failed leader frees waiters to take over at once.
+            try:
+                await client.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+            except Exception:
+                pass
@@ -1,13 +1,20 @@
 import hashlib
 import re
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from webwatcher.normalization.url_utils import normalize_url
 
 _NUM_RE = re.compile(r"\b\d[\d,.\-]*\b")
 _TIMESTAMP_RE = re.compile(r"\b(?:\d{1,2}[:/.-]){2,}\d{2,4}\b")
+_MAX_SPAN = 50
+
+
+@dataclass
+class TableGrid:
+    caption: str
+    rows: list[list[str]]
 
 
 @dataclass
@@ -19,15 +26,80 @@ class NormalizedPage:
     page_hash: str
     section_hashes: dict[str, str]
     numbers_hash: str
+    table_grids: list[TableGrid] = field(default_factory=list)
 
     def as_json(self) -> dict:
-        return asdict(self)
+        # Grids feed table extraction only; snapshots and their hashes stay text-based.
+        data = asdict(self)
+        data.pop("table_grids")
+        return data
 
 
 def _sha256(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
 
+def _cell_text(cell: Tag) -> str:
+    return " ".join(cell.get_text(" ", strip=True).split())
+
+
+def _span(value: str | None) -> int:
+    try:
+        return max(1, min(int(value or 1), _MAX_SPAN))
+    except ValueError:
+        return 1
+
+
+def _table_caption(table: Tag) -> str:
+    parts: list[str] = []
+    caption = table.find("caption")
+    if caption is not None:
+        parts.append(_cell_text(caption))
+    # Unit notes such as "(Rs. in Crore)" usually sit in the heading or paragraph just above.
+    previous = table.find_previous(["h1", "h2", "h3", "h4", "p"])
+    if previous is not None:
+        parts.append(_cell_text(previous)[:200])
+    return " ".join(part for part in parts if part)
+
+
+def _fill_carried(row: list[str], carried: dict[int, list]) -> None:
+    # Cells from a rowspan above occupy their column before the row's own cells continue.
+    while len(row) in carried:
+        column = len(row)
+        row.append(carried[column][0])
+        carried[column][1] -= 1
+        if carried[column][1] == 0:
+            del carried[column]
+
+
+def _table_grid(table: Tag) -> TableGrid | None:
+    # Expands colspan/rowspan so every row has one cell per column, which lets period headers
+    # spanning several columns line up with the values below them.
+    rows: list[list[str]] = []
+    carried: dict[int, list] = {}
+    for row_tag in table.find_all("tr"):
+        if row_tag.find_parent("table") is not table:
+            continue
+        row: list[str] = []
+        for cell in row_tag.find_all(["td", "th"], recursive=False):
+            _fill_carried(row, carried)
+            text = _cell_text(cell)
+            rowspan = _span(cell.get("rowspan"))
+            for _ in range(_span(cell.get("colspan"))):
+                if rowspan > 1:
+                    carried[len(row)] = [text, rowspan - 1]
+                row.append(text)
+        _fill_carried(row, carried)
+        if any(row):
+            rows.append(row)
+    if len(rows) < 2:
+        return None
+    width = max(len(row) for row in rows)
+    if width < 2:
+        return None
+    return TableGrid(caption=_table_caption(table), rows=[row + [""] * (width - len(row)) for row in rows])
+
+
 def normalize_html(html: str, source_url: str) -> NormalizedPage:
     soup = BeautifulSoup(html, "lxml")
 
@@ -45,6 +117,8 @@ def normalize_html(html: str, source_url: str) -> NormalizedPage:
             continue
         sections.append({"type": node.name, "text": text})
 
+    table_grids = [grid for table in soup.find_all("table") if (grid := _table_grid(table))]
+
     clean_text = "\n".join(item["text"] for item in sections)
     numbers = _NUM_RE.findall(clean_text)
     pdf_links: list[str] = []
@@ -72,5 +146,6 @@ def normalize_html(html: str, source_url: str) -> NormalizedPage:
         page_hash=page_hash,
         section_hashes=section_hashes,
         numbers_hash=numbers_hash,
+        table_grids=table_grids,
     )
 
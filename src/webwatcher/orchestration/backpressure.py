@@ -0,0 +1,77 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import redis
+
+from webwatcher.core.config import get_settings
+from webwatcher.observability.metrics import metrics
+
+PENDING_KEY = "scheduler:pending"
+# Batch scans are routed here in queue.py.
+BATCH_QUEUE = "crawl"
+# kombu's Redis transport parks reserved and countdown messages in this hash until they are acked.
+UNACKED_KEY = "unacked"
+
+
+@dataclass
+class QueueState:
+    depth: int
+    in_flight: int
+    lag_seconds: float
+    pending: set[int] = field(default_factory=set)
+
+
+class SchedulerBackpressure:
+    # Companies the scheduler has enqueued and no batch has finished yet, kept in a Redis sorted
+    # set scored by enqueue time. Every call degrades to a no-op when Redis is unavailable.
+
+    def __init__(self, client: Any | None = None) -> None:
+        settings = get_settings()
+        self.redis_url = settings.redis_url
+        self.pending_ttl_seconds = settings.webwatch_scheduler_pending_ttl_seconds
+        self.client = client
+
+    def _redis(self):
+        if self.client is None:
+            self.client = redis.from_url(
+                self.redis_url, decode_responses=True, socket_connect_timeout=1, socket_timeout=1
+            )
+        return self.client
+
+    def snapshot(self) -> QueueState | None:
+        now = time.time()
+        try:
+            client = self._redis()
+            # Entries a crashed worker never cleared stop blocking their company after the TTL.
+            client.zremrangebyscore(PENDING_KEY, "-inf", now - self.pending_ttl_seconds)
+            pending = client.zrange(PENDING_KEY, 0, -1, withscores=True)
+            depth = client.llen(BATCH_QUEUE)
+            in_flight = client.hlen(UNACKED_KEY)
+        except Exception:
+            metrics.inc("scheduler_backpressure_unavailable_total")
+            return None
+        oldest = min((score for _, score in pending), default=now)
+        return QueueState(
+            depth=int(depth),
+            in_flight=int(in_flight),
+            lag_seconds=max(0.0, now - oldest),
+            pending={int(member) for member, _ in pending},
+        )
+
+    def mark_pending(self, company_ids: list[int]) -> None:
+        if not company_ids:
+            return
+        now = time.time()
+        try:
+            self._redis().zadd(PENDING_KEY, {str(company_id): now for company_id in company_ids}, nx=True)
+        except Exception:
+            pass
+
+    def mark_finished(self, company_ids: list[int]) -> None:
+        if not company_ids:
+            return
+        try:
+            self._redis().zrem(PENDING_KEY, *(str(company_id) for company_id in company_ids))
+        except Exception:
+            pass
@@ -13,36 +13,37 @@ class DistributedLockError(RuntimeError):
 
 _local_guard = Lock()
 _local_active_company_ids: set[int] = set()
+LOCAL_LOCK_TOKEN = "local"
+# Compare-and-expire, so a late stage never extends a lock another scan has taken since.
+_EXTEND_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
 
 
-@contextmanager
-def company_scan_lock(company_id: int, ttl_seconds: int = 900):
+def _lock_key(company_id: int) -> str:
+    return f"lock:company:{company_id}:scan"
+
+
+def _redis_client():
     settings = get_settings()
-    key = f"lock:company:{company_id}:scan"
-    token = str(uuid.uuid4())
+    return redis.from_url(
+        settings.redis_url,
+        decode_responses=True,
+        socket_connect_timeout=1,
+        socket_timeout=1,
+    )
+
 
+def acquire_company_scan_lock(company_id: int, ttl_seconds: int = 900) -> str:
+    # Returns the token that release_company_scan_lock needs. Pipelined scans acquire in the first
+    # stage and release in the last, possibly in another worker process.
+    token = str(uuid.uuid4())
     try:
-        client = redis.from_url(
-            settings.redis_url,
-            decode_responses=True,
-            socket_connect_timeout=1,
-            socket_timeout=1,
-        )
-        acquired = client.set(key, token, nx=True, ex=ttl_seconds)
-        if not acquired:
-            raise DistributedLockError(f"Company {company_id} already has an active lock.")
-        try:
-            yield
-        finally:
-            try:
-                current = client.get(key)
-                if current == token:
-                    client.delete(key)
-            except Exception:
-                pass
-        return
-    except DistributedLockError:
-        raise
+        client = _redis_client()
+        acquired = client.set(_lock_key(company_id), token, nx=True, ex=ttl_seconds)
     except Exception:
         # Local fallback when Redis is unavailable.
         with _local_guard:
@@ -51,8 +52,42 @@ def company_scan_lock(company_id: int, ttl_seconds: int = 900):
                     f"Company {company_id} already has an active local lock."
                 ) from None
             _local_active_company_ids.add(company_id)
-        try:
-            yield
-        finally:
-            with _local_guard:
-                _local_active_company_ids.discard(company_id)
+        return LOCAL_LOCK_TOKEN
+    if not acquired:
+        raise DistributedLockError(f"Company {company_id} already has an active lock.")
+    return token
+
+
+def release_company_scan_lock(company_id: int, token: str | None) -> None:
+    if not token:
+        return
+    if token == LOCAL_LOCK_TOKEN:
+        with _local_guard:
+            _local_active_company_ids.discard(company_id)
+        return
+    try:
+        client = _redis_client()
+        current = client.get(_lock_key(company_id))
+        if current == token:
+            client.delete(_lock_key(company_id))
+    except Exception:
+        pass
+
+
+def extend_company_scan_lock(company_id: int, token: str | None, ttl_seconds: int) -> bool:
+    if not token or token == LOCAL_LOCK_TOKEN:
+        return False
+    try:
+        client = _redis_client()
+        return bool(client.eval(_EXTEND_SCRIPT, 1, _lock_key(company_id), token, ttl_seconds))
+    except Exception:
+        return False
+
+
+@contextmanager
+def company_scan_lock(company_id: int, ttl_seconds: int = 900):
+    token = acquire_company_scan_lock(company_id, ttl_seconds)
+    try:
+        yield
+    finally:
+        release_company_scan_lock(company_id, token)
@@ -0,0 +1,46 @@
+from dataclasses import asdict
+
+from celery import shared_task
+
+from webwatcher.core.database import session_scope
+from webwatcher.core.logger import get_logger
+from webwatcher.core.runtime import run_async
+from webwatcher.intelligence.rescoring import rescore_changes
+from webwatcher.observability.metrics import Timer, metrics
+from webwatcher.storage.retention import SnapshotCompactor
+from webwatcher.storage.storage_service import StorageService
+
+
+async def run_storage_compaction() -> dict:
+    logger = get_logger("webwatcher.maintenance")
+    with Timer("compaction_duration_ms"):
+        async with session_scope() as session:
+            report = await SnapshotCompactor(StorageService()).run(session)
+    metrics.inc("compaction_runs_total")
+    metrics.inc("compaction_snapshots_pruned_total", report.snapshots_pruned)
+    metrics.inc("compaction_bytes_reclaimed_total", report.bytes_reclaimed)
+    metrics.inc("compaction_bytes_archived_total", report.bytes_archived)
+    metrics.inc("compaction_archive_failures_total", report.archive_failures)
+    metrics.inc("compaction_cache_rows_pruned_total", report.cache_rows_pruned + report.llm_events_pruned)
+    logger.info("Storage compaction completed", extra={"event_name": "compaction_completed"})
+    return asdict(report)
+
+
+@shared_task(name="webwatcher.orchestration.maintenance.compact_storage")
+def compact_storage() -> dict:
+    return run_async(run_storage_compaction())
+
+
+async def run_change_rescoring() -> dict:
+    logger = get_logger("webwatcher.maintenance")
+    with Timer("rescoring_duration_ms"):
+        async with session_scope() as session:
+            report = await rescore_changes(session)
+    metrics.inc("rescoring_changes_updated_total", report.updated)
+    logger.info("Change re-scoring completed", extra={"event_name": "rescoring_completed"})
+    return asdict(report)
+
+
+@shared_task(name="webwatcher.orchestration.maintenance.rescore_changes")
+def rescore_changes_task() -> dict:
+    return run_async(run_change_rescoring())
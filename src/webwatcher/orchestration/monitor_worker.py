@@ -1,6 +1,10 @@
 import asyncio
+import weakref
+from collections import Counter
 from contextlib import nullcontext
-from datetime import datetime, timedelta, timezone
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from itertools import chain
 from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
@@ -10,20 +14,35 @@ from sqlalchemy import desc, select
 from webwatcher.core.config import get_settings
 from webwatcher.core.database import session_scope
 from webwatcher.core.logger import get_logger
+from webwatcher.core.runtime import run_async
 from webwatcher.crawler.crawler_controller import CrawlerController
 from webwatcher.crawler.fetcher import Fetcher
-from webwatcher.db.models import Change, Company, FinancialMetric, ScanRun, ScanStatus, Snapshot
-from webwatcher.financial.financial_extractor import FinancialExtractor
-from webwatcher.intelligence.change_detector import ChangeDetector
+from webwatcher.db.models import Change, ChangeType, Company, FinancialMetric, ScanRun, ScanStatus, Snapshot
+from webwatcher.financial.extraction_cache import ExtractionCache, ExtractionOutcome, extraction_fingerprint
+from webwatcher.financial.financial_extractor import FinancialExtractor, TextChunk
+from webwatcher.financial.table_extractor import TableExtractor
+from webwatcher.financial.timeseries import MetricSeriesStore
+from webwatcher.intelligence.change_detector import ChangeDetectionResult, ChangeDetector
 from webwatcher.intelligence.confidence_engine import ConfidenceEngine
 from webwatcher.intelligence.materiality_engine import MaterialityEngine
-from webwatcher.llm.llm_client import LlmClient
+from webwatcher.intelligence.text_similarity import AMBIGUOUS, changed_section_text
+from webwatcher.llm.llm_client import shared_llm_client
+from webwatcher.llm.llm_financial_validator import PROMPT_VERSION as VALIDATION_PROMPT_VERSION
 from webwatcher.llm.llm_financial_validator import LlmFinancialValidator
-from webwatcher.normalization.html_normalizer import normalize_html
+from webwatcher.llm.llm_section_classifier import LlmSectionClassifier
+from webwatcher.normalization.html_normalizer import NormalizedPage, TableGrid, normalize_html
 from webwatcher.normalization.url_utils import normalize_url
 from webwatcher.observability.metrics import Timer, metrics
-from webwatcher.orchestration.locks import DistributedLockError, company_scan_lock
-from webwatcher.pdf.pdf_monitor import PdfMonitor
+from webwatcher.orchestration.backpressure import SchedulerBackpressure
+from webwatcher.orchestration.locks import (
+    DistributedLockError,
+    acquire_company_scan_lock,
+    company_scan_lock,
+    release_company_scan_lock,
+)
+from webwatcher.orchestration.scan_timing import adaptive_interval_minutes, load_change_history, next_scan_time
+from webwatcher.pdf.ocr_worker import dispatch_ocr
+from webwatcher.pdf.pdf_monitor import PdfMonitor, PdfMonitorResult, restore_pdf_result
 from webwatcher.pdf.pdf_parser import PdfParser
 from webwatcher.storage.snapshot_manager import SnapshotManager
 from webwatcher.storage.storage_service import StorageService
@@ -121,182 +140,542 @@ async def _get_or_create_scan_run(session, company_id: int) -> ScanRun:
     return run
 
 
-async def run_monitor(company_id: int, use_distributed_lock: bool = True) -> dict:
+async def _escalate_text_change(
+    session, detection: ChangeDetectionResult, old_json: dict, new_json: dict, scan_run_id: int
+) -> None:
+    # Only diffs the local scorer could not call either way reach the LLM.
+    llm_client = shared_llm_client()
+    if not llm_client.enabled():
+        return
+    metrics.inc("text_change_escalated_total")
+    old_text, new_text = changed_section_text(old_json, new_json)
+    classification = await LlmSectionClassifier(llm_client).classify_diff(
+        old_text, new_text, session=session, scan_run_id=scan_run_id
+    )
+    detection.details["llm_meaningful"] = classification.is_meaningful
+    detection.details["llm_confidence"] = classification.confidence
+    if not classification.is_meaningful:
+        detection.summary = "No meaningful change"
+        detection.score = 0.0
+    elif classification.summary:
+        detection.summary = classification.summary
+
+
+async def _extract_financials(
+    session,
+    normalized: NormalizedPage,
+    pdf_result: PdfMonitorResult,
+    target_url: str,
+    scan_run_id: int | None = None,
+) -> ExtractionOutcome:
+    # Extraction, LLM validation and confidence are pure functions of the page text, result
+    # tables and changed PDF pages, so an unchanged fingerprint reuses the stored outcome.
+    llm_client = shared_llm_client()
+    fingerprint = extraction_fingerprint(
+        target_url,
+        normalized.page_hash,
+        normalized.table_grids,
+        [(document.doc_hash, document.changed_pages) for document in pdf_result.documents],
+        llm_client.settings.azure_openai_deployment if llm_client.enabled() else None,
+        llm_prompt=(
+            f"{VALIDATION_PROMPT_VERSION}:{llm_client.settings.webwatch_llm_prompt_token_budget}"
+            if llm_client.enabled()
+            else None
+        ),
+    )
+    cache = ExtractionCache()
+    cached = await cache.get(session, fingerprint)
+    if cached is not None:
+        return cached
+
+    extracted = FinancialExtractor().extract_stream(
+        chain(
+            [TextChunk(text=normalized.clean_text, source=target_url)],
+            pdf_result.iter_financial_pages(),
+        )
+    )
+    # Result tables are not part of clean_text; they only fill metrics the text missed.
+    table_extracted = TableExtractor().extract(normalized.table_grids, source=target_url)
+    extracted.fill_missing(table_extracted)
+
+    # The validator packs the page sections and changed PDF pages densest in metric aliases into
+    # the prompt token budget.
+    llm_validation = await LlmFinancialValidator(llm_client).validate(
+        normalized.clean_text,
+        extracted.metrics,
+        session=session,
+        scan_run_id=scan_run_id,
+        pdf_pages=pdf_result.iter_financial_pages(),
+    )
+    has_tables = bool(table_extracted.metrics)
+    confidence = ConfidenceEngine().score(
+        has_tables=has_tables,
+        heading_match_ratio=0.8 if extracted.metrics else 0.3,
+        unit_consistency=0.8,
+        llm_agreement=llm_validation.agreement_score,
+        metrics=llm_validation.merged_metrics,
+    )
+    outcome = ExtractionOutcome(
+        metrics=llm_validation.merged_metrics,
+        currency=extracted.currency,
+        quarter=extracted.quarter,
+        report_type=extracted.report_type,
+        agreement_score=llm_validation.agreement_score,
+        snapshot_confidence=confidence.snapshot_confidence,
+        metric_confidence=confidence.metric_confidence,
+        provenance={name: asdict(source) for name, source in extracted.provenance.items()},
+        has_tables=has_tables,
+    )
+    await cache.put(session, fingerprint, outcome)
+    return outcome
+
+
+# A scan runs as five stages: fetch/normalize, PDFs, extract/validate, diff/materiality and
+# alerts. Stages share nothing but the scan run id; whatever a later stage needs is written to
+# ScanRun.meta["pipeline"] or to the snapshot, document and parse-cache rows, so each stage can
+# run in a different worker (see orchestration/pipeline.py) or one after another in-process.
+
+
+def pipeline_state(scan_run: ScanRun) -> dict:
+    return dict((scan_run.meta or {}).get("pipeline") or {})
+
+
+def _save_pipeline_state(scan_run: ScanRun, **values) -> None:
+    # JSON columns are not mutation-tracked; assign a new dict so the update is flushed.
+    meta = dict(scan_run.meta or {})
+    meta["pipeline"] = {**(meta.get("pipeline") or {}), **values}
+    scan_run.meta = meta
+
+
+async def _load_scan(session, scan_run_id: int) -> tuple[ScanRun, Company]:
+    scan_run = await session.get(ScanRun, scan_run_id)
+    if scan_run is None:
+        raise RuntimeError(f"Scan run {scan_run_id} not found")
+    company = await _load_company(session, scan_run.company_id)
+    if company is None:
+        raise RuntimeError(f"Company {scan_run.company_id} not found")
+    return scan_run, company
+
+
+def _page_from_snapshot(snapshot: Snapshot, table_grids: list[dict]) -> NormalizedPage:
+    data = snapshot.normalized_json or {}
+    return NormalizedPage(
+        clean_text=data.get("clean_text", ""),
+        structured_sections=data.get("structured_sections", []),
+        pdf_links=data.get("pdf_links", []),
+        numbers=data.get("numbers", []),
+        page_hash=data.get("page_hash", snapshot.page_hash),
+        section_hashes=data.get("section_hashes", {}),
+        numbers_hash=data.get("numbers_hash", snapshot.numbers_hash),
+        table_grids=[TableGrid(**grid) for grid in table_grids],
+    )
+
+
+async def start_scan(company_id: int, lock_token: str | None = None) -> int | None:
+    async with session_scope() as session:
+        company = await _load_company(session, company_id)
+        if company is None:
+            return None
+        scan_run = await _get_or_create_scan_run(session, company_id)
+        scan_run.status = ScanStatus.running.value
+        scan_run.started_at = datetime.now(timezone.utc)
+        scan_run.completed_at = None
+        scan_run.error_message = None
+        meta = dict(scan_run.meta or {})
+        meta["pipeline"] = {"stage": "started", "lock_token": lock_token}
+        scan_run.meta = meta
+        await session.flush()
+        return scan_run.id
+
+
+async def fetch_stage(scan_run_id: int) -> None:
     settings = get_settings()
+    async with session_scope() as session:
+        scan_run, company = await _load_scan(session, scan_run_id)
+        company_id = company.id
+        fetcher = Fetcher()
+        try:
+            target_url = company.ir_url or company.base_url
+            crawler_controller = CrawlerController(
+                fetcher,
+                max_depth=settings.webwatch_crawl_depth,
+                max_pages=5,
+            )
+            discovered_pages = await crawler_controller.crawl_targeted(target_url)
+            if target_url not in discovered_pages:
+                discovered_pages.insert(0, target_url)
+
+            response = await fetcher.get(target_url)
+            normalized = normalize_html(response.text, source_url=target_url)
+            anchor_links = _extract_same_domain_anchor_links(response.text, target_url)
+            discovered_pages = sorted(set(discovered_pages).union(anchor_links))
+            if len(discovered_pages) <= 1:
+                sitemap_links = await _discover_links_from_sitemap(fetcher, target_url, limit=80)
+                discovered_pages = sorted(set(discovered_pages).union(sitemap_links))
+            aggregated_pdf_links = set(normalized.pdf_links)
+            for page_url in discovered_pages[:4]:
+                if page_url == target_url:
+                    continue
+                try:
+                    page_response = await fetcher.get(page_url)
+                except Exception:
+                    continue
+                page_normalized = normalize_html(page_response.text, source_url=page_url)
+                aggregated_pdf_links.update(page_normalized.pdf_links)
+        finally:
+            await fetcher.close()
+        aggregated_pdf_links_list = sorted(aggregated_pdf_links)
+
+        old_snapshot = await _latest_snapshot(session, company_id)
+        decision = await SnapshotManager(StorageService()).create_snapshot_if_changed(
+            session=session,
+            company_id=company_id,
+            scan_run_id=scan_run.id,
+            source_url=target_url,
+            normalized=normalized,
+            raw_html=response.content,
+        )
+        # An unchanged page returns the latest snapshot, so there is always one to hang state on.
+        snapshot = decision.snapshot
+        normalized_json = snapshot.normalized_json if isinstance(snapshot.normalized_json, dict) else {}
+        normalized_json = dict(normalized_json)
+        normalized_json["crawled_links"] = discovered_pages
+        normalized_json["pdf_links"] = aggregated_pdf_links_list
+        snapshot.normalized_json = normalized_json
+        _save_pipeline_state(
+            scan_run,
+            stage="fetch",
+            target_url=target_url,
+            snapshot_id=snapshot.id,
+            old_snapshot_id=old_snapshot.id if old_snapshot else None,
+            pdf_links=aggregated_pdf_links_list,
+            table_grids=[asdict(grid) for grid in normalized.table_grids],
+        )
+
+
+async def pdf_stage(scan_run_id: int) -> None:
+    async with session_scope() as session:
+        scan_run, company = await _load_scan(session, scan_run_id)
+        state = pipeline_state(scan_run)
+        fetcher = Fetcher()
+        try:
+            pdf_result = await PdfMonitor(fetcher, StorageService(), PdfParser()).process_pdf_links(
+                session,
+                company_id=company.id,
+                snapshot_id=state["snapshot_id"],
+                links=state.get("pdf_links", []),
+            )
+        finally:
+            await fetcher.close()
+        _save_pipeline_state(scan_run, stage="pdf", pdf=pdf_result.as_state())
+
+
+async def extract_stage(scan_run_id: int) -> None:
+    async with session_scope() as session:
+        scan_run, company = await _load_scan(session, scan_run_id)
+        state = pipeline_state(scan_run)
+        snapshot = await session.get(Snapshot, state["snapshot_id"])
+        normalized = _page_from_snapshot(snapshot, state.get("table_grids", []))
+        pdf_result = await restore_pdf_result(session, state.get("pdf", {}))
+        outcome = await _extract_financials(
+            session, normalized, pdf_result, state["target_url"], scan_run_id=scan_run.id
+        )
+        for metric_name, metric_value in outcome.metrics.items():
+            session.add(
+                FinancialMetric(
+                    snapshot_id=snapshot.id,
+                    company_id=company.id,
+                    metric_name=metric_name,
+                    metric_value=metric_value,
+                    unit=None,
+                    currency=outcome.currency,
+                    period=outcome.quarter,
+                    report_type=outcome.report_type,
+                    confidence=outcome.metric_confidence.get(metric_name, 0.5),
+                )
+            )
+        await MetricSeriesStore().record(
+            session,
+            company.id,
+            outcome.metrics,
+            outcome.quarter,
+            snapshot_id=snapshot.id,
+            currency=outcome.currency,
+            report_type=outcome.report_type,
+            confidence=outcome.metric_confidence,
+        )
+        _save_pipeline_state(scan_run, stage="extract", extraction=asdict(outcome))
+
+
+async def diff_stage(scan_run_id: int) -> None:
+    async with session_scope() as session:
+        scan_run, company = await _load_scan(session, scan_run_id)
+        state = pipeline_state(scan_run)
+        snapshot = await session.get(Snapshot, state["snapshot_id"])
+        old_snapshot = await session.get(Snapshot, state["old_snapshot_id"]) if state.get("old_snapshot_id") else None
+        outcome = ExtractionOutcome(**state["extraction"])
+        pdf_state = state.get("pdf", {})
+
+        previous_metrics = await _metrics_for_snapshot(session, old_snapshot.id if old_snapshot else None)
+        detection = ChangeDetector().detect(
+            old_snapshot.normalized_json if old_snapshot else None,
+            snapshot.normalized_json,
+            previous_metrics,
+            outcome.metrics,
+            pdf_state.get("changed", 0) > 0,
+            pdf_state.get("documents", []),
+        )
+        if detection.change_type == ChangeType.financial.value:
+            detection.details["provenance"] = {
+                name: source
+                for name, source in outcome.provenance.items()
+                if name in detection.details.get("deltas", {})
+            }
+        if old_snapshot and detection.details.get("verdict") == AMBIGUOUS:
+            await _escalate_text_change(
+                session,
+                detection,
+                old_snapshot.normalized_json or {},
+                snapshot.normalized_json,
+                scan_run.id,
+            )
+        materiality = MaterialityEngine().score(detection.score)
+
+        change_id = None
+        if detection.score > 0:
+            change = Change(
+                company_id=company.id,
+                from_snapshot_id=old_snapshot.id if old_snapshot else None,
+                to_snapshot_id=snapshot.id,
+                change_type=detection.change_type,
+                severity=materiality.severity,
+                score=materiality.score,
+                confidence=outcome.snapshot_confidence,
+                summary=detection.summary,
+                details=detection.details,
+            )
+            session.add(change)
+            await session.flush()
+            change_id = change.id
+        _save_pipeline_state(scan_run, stage="diff", change_id=change_id)
+
+
+async def alerts_stage(scan_run_id: int) -> dict:
+    settings = get_settings()
+    async with session_scope() as session:
+        scan_run, company = await _load_scan(session, scan_run_id)
+        logger = get_logger("webwatcher.monitor", company_id=company.id)
+        state = pipeline_state(scan_run)
+        pdf_state = state.get("pdf", {})
+        change = await session.get(Change, state["change_id"]) if state.get("change_id") else None
+        alert_change_id = None
+        if change is not None and change.confidence >= settings.webwatch_alert_confidence_threshold:
+            alert_change_id = change.id
+            metrics.inc("alerts_raised_total")
+            logger.info(
+                "Alert raised",
+                extra={
+                    "scan_run_id": scan_run.id,
+                    "change_id": change.id,
+                    "severity": change.severity,
+                    "summary": change.summary,
+                },
+            )
+
+        company.last_scanned_at = datetime.now(timezone.utc)
+        interval_minutes = company.scan_interval_minutes or settings.webwatch_scan_interval_minutes
+        if settings.webwatch_adaptive_scan_intervals:
+            history = await load_change_history(
+                session, company.id, company.last_scanned_at, settings.webwatch_scan_change_lookback_days
+            )
+            interval_minutes = adaptive_interval_minutes(
+                interval_minutes,
+                history,
+                company.last_scanned_at,
+                settings.webwatch_scan_min_interval_minutes,
+                settings.webwatch_scan_max_interval_minutes,
+                settings.webwatch_scan_change_lookback_days,
+            )
+        company.next_scan_at = next_scan_time(
+            company.id, company.last_scanned_at, interval_minutes, settings.webwatch_scan_jitter_minutes
+        )
+        scan_run.status = ScanStatus.succeeded.value
+        scan_run.completed_at = datetime.now(timezone.utc)
+        scan_run.error_message = None
+        _save_pipeline_state(scan_run, stage="alerts")
+        metrics.inc("scan_success_total")
+        logger.info(
+            "Scan completed",
+            extra={"scan_run_id": scan_run.id, "snapshot_id": state.get("snapshot_id")},
+        )
+        result = {
+            "status": "ok",
+            "scan_run_id": scan_run.id,
+            "snapshot_id": state.get("snapshot_id"),
+            "metrics_found": len((state.get("extraction") or {}).get("metrics", {})),
+            "pdf_downloaded": pdf_state.get("downloaded", 0),
+            "pdf_changed": pdf_state.get("changed", 0),
+            "alert_change_id": alert_change_id,
+            "next_interval_minutes": interval_minutes,
+        }
+    # Dispatch after commit so the OCR worker can see the new Document rows.
+    if pdf_state.get("ocr_document_ids"):
+        result["ocr_dispatched"] = dispatch_ocr(pdf_state["ocr_document_ids"])
+    return result
+
+
+SCAN_STAGES = (fetch_stage, pdf_stage, extract_stage, diff_stage)
+
+
+async def fail_scan(company_id: int, scan_run_id: int | None, exc: BaseException) -> None:
+    async with session_scope() as session:
+        scan_run = await session.get(ScanRun, scan_run_id) if scan_run_id else None
+        if scan_run is None:
+            scan_run = await _get_or_create_scan_run(session, company_id)
+        scan_run.status = ScanStatus.failed.value
+        scan_run.completed_at = datetime.now(timezone.utc)
+        scan_run.error_message = str(exc)
+
+
+async def run_monitor(company_id: int, use_distributed_lock: bool = True) -> dict:
+    # In-process run of every stage, used when no queue is available.
     logger = get_logger("webwatcher.monitor", company_id=company_id)
+    scan_run_id = None
     with Timer("scan_duration_ms"):
         try:
             lock_context = company_scan_lock(company_id) if use_distributed_lock else nullcontext()
             with lock_context:
-                async with session_scope() as session:
-                    company = await _load_company(session, company_id)
-                    if company is None:
-                        return {"status": "error", "message": f"Company {company_id} not found"}
-
-                    scan_run = await _get_or_create_scan_run(session, company_id)
-                    scan_run.status = ScanStatus.running.value
-                    scan_run.started_at = datetime.now(timezone.utc)
-                    scan_run.error_message = None
-                    await session.flush()
-                    await session.commit()
-
-                    fetcher = Fetcher()
-                    storage_service = StorageService()
-                    snapshot_manager = SnapshotManager(storage_service)
-                    pdf_monitor = PdfMonitor(fetcher, storage_service, PdfParser())
-
-                    target_url = company.ir_url or company.base_url
-                    crawler_controller = CrawlerController(
-                        fetcher,
-                        max_depth=settings.webwatch_crawl_depth,
-                        max_pages=5,
-                    )
-                    discovered_pages = await crawler_controller.crawl_targeted(target_url)
-                    if target_url not in discovered_pages:
-                        discovered_pages.insert(0, target_url)
-
-                    response = await fetcher.get(target_url)
-                    normalized = normalize_html(response.text, source_url=target_url)
-                    anchor_links = _extract_same_domain_anchor_links(response.text, target_url)
-                    discovered_pages = sorted(set(discovered_pages).union(anchor_links))
-                    if len(discovered_pages) <= 1:
-                        sitemap_links = await _discover_links_from_sitemap(fetcher, target_url, limit=80)
-                        discovered_pages = sorted(set(discovered_pages).union(sitemap_links))
-                    aggregated_pdf_links = set(normalized.pdf_links)
-                    for page_url in discovered_pages[:4]:
-                        if page_url == target_url:
-                            continue
-                        try:
-                            page_response = await fetcher.get(page_url)
-                        except Exception:
-                            continue
-                        page_normalized = normalize_html(page_response.text, source_url=page_url)
-                        aggregated_pdf_links.update(page_normalized.pdf_links)
-                    aggregated_pdf_links_list = sorted(aggregated_pdf_links)
-
-                    old_snapshot = await _latest_snapshot(session, company_id)
-                    decision = await snapshot_manager.create_snapshot_if_changed(
-                        session=session,
-                        company_id=company_id,
-                        scan_run_id=scan_run.id,
-                        source_url=target_url,
-                        normalized=normalized,
-                        raw_html=response.content,
-                    )
-
-                    snapshot = decision.snapshot
-                    if snapshot:
-                        normalized_json = snapshot.normalized_json if isinstance(snapshot.normalized_json, dict) else {}
-                        normalized_json["crawled_links"] = discovered_pages
-                        normalized_json["pdf_links"] = aggregated_pdf_links_list
-                        snapshot.normalized_json = normalized_json
-                    pdf_result = await pdf_monitor.process_pdf_links(
-                        session,
-                        company_id=company_id,
-                        snapshot_id=snapshot.id if snapshot else None,
-                        links=aggregated_pdf_links_list,
-                    )
-
-                    extractor = FinancialExtractor()
-                    merged_text = normalized.clean_text + "\n" + "\n".join(pdf_result.parsed_texts)
-                    extracted = extractor.extract(merged_text)
-
-                    llm_validator = LlmFinancialValidator(LlmClient())
-                    llm_validation = llm_validator.validate(merged_text, extracted.metrics)
-                    final_metrics = llm_validation.merged_metrics
-
-                    confidence_engine = ConfidenceEngine()
-                    confidence = confidence_engine.score(
-                        has_tables="table" in response.text.lower(),
-                        heading_match_ratio=0.8 if extracted.metrics else 0.3,
-                        unit_consistency=0.8,
-                        llm_agreement=llm_validation.agreement_score,
-                        metrics=final_metrics,
-                    )
-
-                    if snapshot:
-                        for metric_name, metric_value in final_metrics.items():
-                            session.add(
-                                FinancialMetric(
-                                    snapshot_id=snapshot.id,
-                                    company_id=company_id,
-                                    metric_name=metric_name,
-                                    metric_value=metric_value,
-                                    unit=None,
-                                    currency=extracted.currency,
-                                    period=extracted.quarter,
-                                    report_type=extracted.report_type,
-                                    confidence=confidence.metric_confidence.get(metric_name, 0.5),
-                                )
-                            )
-
-                    previous_metrics = await _metrics_for_snapshot(
-                        session, old_snapshot.id if old_snapshot else None
-                    )
-                    detector = ChangeDetector()
-                    detection = detector.detect(
-                        old_snapshot.normalized_json if old_snapshot else None,
-                        snapshot.normalized_json if snapshot else normalized.as_json(),
-                        previous_metrics,
-                        final_metrics,
-                        pdf_result.changed > 0,
-                    )
-                    materiality = MaterialityEngine().score(detection.score)
-
-                    if snapshot and detection.score > 0:
-                        session.add(
-                            Change(
-                                company_id=company_id,
-                                from_snapshot_id=old_snapshot.id if old_snapshot else None,
-                                to_snapshot_id=snapshot.id,
-                                change_type=detection.change_type,
-                                severity=materiality.severity,
-                                score=materiality.score,
-                                confidence=confidence.snapshot_confidence,
-                                summary=detection.summary,
-                                details=detection.details,
-                            )
-                        )
-
-                    company.last_scanned_at = datetime.now(timezone.utc)
-                    company.next_scan_at = company.last_scanned_at + timedelta(
-                        minutes=company.scan_interval_minutes or settings.webwatch_scan_interval_minutes
-                    )
-
-                    scan_run.status = ScanStatus.succeeded.value
-                    scan_run.completed_at = datetime.now(timezone.utc)
-                    scan_run.error_message = None
-                    await fetcher.close()
-                    metrics.inc("scan_success_total")
-                    logger.info(
-                        "Scan completed",
-                        extra={
-                            "scan_run_id": scan_run.id,
-                            "snapshot_id": snapshot.id if snapshot else None,
-                        },
-                    )
-                    return {
-                        "status": "ok",
-                        "scan_run_id": scan_run.id,
-                        "snapshot_id": snapshot.id if snapshot else None,
-                        "metrics_found": len(final_metrics),
-                        "pdf_downloaded": pdf_result.downloaded,
-                        "pdf_changed": pdf_result.changed,
-                    }
+                scan_run_id = await start_scan(company_id)
+                if scan_run_id is None:
+                    return {"status": "error", "message": f"Company {company_id} not found"}
+                for stage in SCAN_STAGES:
+                    await stage(scan_run_id)
+                return await alerts_stage(scan_run_id)
         except DistributedLockError as exc:
             metrics.inc("scan_lock_skipped_total")
             return {"status": "skipped", "reason": str(exc)}
         except Exception as exc:
             metrics.inc("scan_failed_total")
             logger.exception("Scan failed", extra={"event_name": "scan_failed"})
-            async with session_scope() as session:
-                scan_run = await _get_or_create_scan_run(session, company_id)
-                scan_run.status = ScanStatus.failed.value
-                scan_run.completed_at = datetime.now(timezone.utc)
-                scan_run.error_message = str(exc)
+            await fail_scan(company_id, scan_run_id, exc)
             return {"status": "error", "message": str(exc)}
 
 
+@dataclass
+class _DomainSlot:
+    semaphore: asyncio.Semaphore
+    users: int = 0
+
+
+# Batch scans share these per event loop, so concurrent batch tasks on one worker runtime stay
+# within the same global and per-domain caps.
+_loop_scan_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[asyncio.Semaphore, dict]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _scan_slots(limit: int) -> tuple[asyncio.Semaphore, dict[str, _DomainSlot]]:
+    loop = asyncio.get_running_loop()
+    slots = _loop_scan_slots.get(loop)
+    if slots is None:
+        slots = (asyncio.Semaphore(max(1, limit)), {})
+        _loop_scan_slots[loop] = slots
+    return slots
+
+
+async def _company_domains(company_ids: list[int]) -> dict[int, str]:
+    async with session_scope() as session:
+        result = await session.execute(
+            select(Company.id, Company.ir_url, Company.base_url).where(Company.id.in_(company_ids))
+        )
+        return {row.id: urlparse(row.ir_url or row.base_url).netloc.lower() for row in result.all()}
+
+
+async def _scan_in_batch(
+    company_id: int,
+    domain: str,
+    global_slots: asyncio.Semaphore,
+    domain_slots: dict[str, _DomainSlot],
+    per_domain: int,
+    pipelined: bool = False,
+) -> dict:
+    domain_slot = domain_slots.get(domain)
+    if domain_slot is None:
+        domain_slot = domain_slots[domain] = _DomainSlot(asyncio.Semaphore(max(1, per_domain)))
+    domain_slot.users += 1
+    try:
+        # Wait for the domain first so a scan queued behind a busy site does not hold a global slot.
+        async with domain_slot.semaphore, global_slots:
+            if pipelined:
+                from webwatcher.orchestration.pipeline import start_pipeline
+
+                return await start_pipeline(company_id)
+            try:
+                # The Redis client is blocking; keep it off the loop the other scans are running on.
+                token = await asyncio.to_thread(acquire_company_scan_lock, company_id)
+            except DistributedLockError as exc:
+                metrics.inc("scan_lock_skipped_total")
+                return {"status": "skipped", "reason": str(exc)}
+            try:
+                return await run_monitor(company_id, use_distributed_lock=False)
+            finally:
+                await asyncio.to_thread(release_company_scan_lock, company_id, token)
+    finally:
+        domain_slot.users -= 1
+        # Idle domains are dropped, so the map only holds domains with scans running or waiting.
+        if not domain_slot.users:
+            domain_slots.pop(domain, None)
+
+
+async def run_monitor_batch(company_ids: list[int]) -> dict:
+    settings = get_settings()
+    company_ids = list(dict.fromkeys(company_ids))
+    domains = await _company_domains(company_ids)
+    global_slots, domain_slots = _scan_slots(settings.webwatch_batch_scan_concurrency)
+    with Timer("scan_batch_duration_ms"):
+        outcomes = await asyncio.gather(
+            *(
+                _scan_in_batch(
+                    company_id,
+                    domains.get(company_id, ""),
+                    global_slots,
+                    domain_slots,
+                    settings.webwatch_batch_scan_per_domain,
+                    settings.webwatch_pipeline_stages,
+                )
+                for company_id in company_ids
+            ),
+            return_exceptions=True,
+        )
+    results: dict[int, dict] = {}
+    for company_id, outcome in zip(company_ids, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            # run_monitor records its own failures; this only catches errors around it.
+            metrics.inc("scan_failed_total")
+            outcome = {"status": "error", "message": str(outcome)}
+        results[company_id] = outcome
+    # Lets the scheduler enqueue these companies again on a later tick. A queued pipeline clears
+    # its company when the chain ends instead.
+    finished = [company_id for company_id, result in results.items() if result.get("status") != "queued"]
+    await asyncio.to_thread(SchedulerBackpressure().mark_finished, finished)
+    metrics.inc("scan_batches_total")
+    return {
+        "status": "ok",
+        "scanned": len(company_ids),
+        "statuses": dict(Counter(result.get("status") for result in results.values())),
+        "results": results,
+    }
+
+
+@shared_task(name="webwatcher.orchestration.monitor_worker.run_monitor_batch_task")
+def run_monitor_batch_task(company_ids: list[int]) -> dict:
+    return run_async(run_monitor_batch(company_ids))
+
+
 @shared_task(name="webwatcher.orchestration.monitor_worker.run_monitor_task")
 def run_monitor_task(company_id: int) -> dict:
-    return asyncio.run(run_monitor(company_id))
+    if get_settings().webwatch_pipeline_stages:
+        from webwatcher.orchestration.pipeline import start_pipeline
+
+        return run_async(start_pipeline(company_id))
+    return run_async(run_monitor(company_id))
@@ -0,0 +1,156 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from celery import chain, shared_task
+
+from webwatcher.core.config import get_settings
+from webwatcher.core.database import session_scope
+from webwatcher.core.logger import get_logger
+from webwatcher.core.runtime import run_async
+from webwatcher.db.models import ScanRun
+from webwatcher.observability.metrics import Timer, metrics
+from webwatcher.orchestration.backpressure import SchedulerBackpressure
+from webwatcher.orchestration.locks import (
+    LOCAL_LOCK_TOKEN,
+    DistributedLockError,
+    acquire_company_scan_lock,
+    extend_company_scan_lock,
+    release_company_scan_lock,
+)
+from webwatcher.orchestration.monitor_worker import (
+    alerts_stage,
+    diff_stage,
+    extract_stage,
+    fail_scan,
+    fetch_stage,
+    pdf_stage,
+    pipeline_state,
+    run_monitor,
+    start_scan,
+)
+
+Stage = Callable[[int], Awaitable[object]]
+
+
+async def _lock_owner(scan_run_id: int) -> tuple[int | None, str | None]:
+    async with session_scope() as session:
+        scan_run = await session.get(ScanRun, scan_run_id)
+        if scan_run is None:
+            return None, None
+        return scan_run.company_id, pipeline_state(scan_run).get("lock_token")
+
+
+async def _release(scan_run_id: int) -> None:
+    company_id, token = await _lock_owner(scan_run_id)
+    if company_id is not None:
+        await asyncio.to_thread(release_company_scan_lock, company_id, token)
+        # The scheduler may enqueue the company again once its chain has ended.
+        await asyncio.to_thread(SchedulerBackpressure().mark_finished, [company_id])
+
+
+async def _renew_lock(scan_run_id: int) -> None:
+    # Renewed as each stage starts, so a chain waiting in a backed-up queue keeps its lock as long
+    # as no single gap between stages outlasts the TTL.
+    company_id, token = await _lock_owner(scan_run_id)
+    if company_id is None:
+        return
+    ttl_seconds = get_settings().webwatch_pipeline_lock_ttl_seconds
+    if not await asyncio.to_thread(extend_company_scan_lock, company_id, token, ttl_seconds):
+        metrics.inc("scan_lock_renew_failed_total")
+
+
+async def _run_stage(stage: Stage, scan_run_id: int):
+    try:
+        await _renew_lock(scan_run_id)
+        with Timer(f"scan_stage_{stage.__name__}_ms"):
+            return await stage(scan_run_id)
+    except Exception as exc:
+        company_id, _ = await _lock_owner(scan_run_id)
+        metrics.inc("scan_failed_total")
+        get_logger("webwatcher.monitor", company_id=company_id).exception(
+            "Scan failed", extra={"event_name": "scan_failed", "scan_run_id": scan_run_id, "stage": stage.__name__}
+        )
+        if company_id is not None:
+            await fail_scan(company_id, scan_run_id, exc)
+        await _release(scan_run_id)
+        raise
+
+
+async def _run_final_stage(scan_run_id: int) -> dict:
+    result = await _run_stage(alerts_stage, scan_run_id)
+    await _release(scan_run_id)
+    return result
+
+
+async def start_pipeline(company_id: int) -> dict:
+    # Takes the company lock and creates the scan run here; the last stage (or the first one to
+    # fail) releases the lock, whichever worker it runs on. The Redis client is blocking, and batch
+    # scans share this loop, so lock calls run in a thread.
+    try:
+        token = await asyncio.to_thread(
+            acquire_company_scan_lock, company_id, get_settings().webwatch_pipeline_lock_ttl_seconds
+        )
+    except DistributedLockError as exc:
+        metrics.inc("scan_lock_skipped_total")
+        return {"status": "skipped", "reason": str(exc)}
+    if token == LOCAL_LOCK_TOKEN:
+        # Without Redis the lock only exists in this process, and a chain would release it in
+        # another worker; run every stage here instead.
+        metrics.inc("scan_pipeline_local_fallback_total")
+        try:
+            return await run_monitor(company_id, use_distributed_lock=False)
+        finally:
+            await asyncio.to_thread(release_company_scan_lock, company_id, token)
+    try:
+        scan_run_id = await start_scan(company_id, lock_token=token)
+    except Exception:
+        await asyncio.to_thread(release_company_scan_lock, company_id, token)
+        raise
+    if scan_run_id is None:
+        await asyncio.to_thread(release_company_scan_lock, company_id, token)
+        return {"status": "error", "message": f"Company {company_id} not found"}
+    try:
+        chain(
+            fetch_stage_task.si(scan_run_id),
+            pdf_stage_task.si(scan_run_id),
+            extract_stage_task.si(scan_run_id),
+            diff_stage_task.si(scan_run_id),
+            alerts_stage_task.si(scan_run_id),
+        ).apply_async()
+    except Exception as exc:
+        # No stage will ever run to release the lock or finish the scan run.
+        metrics.inc("scan_pipeline_dispatch_failed_total")
+        await fail_scan(company_id, scan_run_id, exc)
+        await asyncio.to_thread(release_company_scan_lock, company_id, token)
+        raise
+    metrics.inc("scan_pipelines_started_total")
+    return {"status": "queued", "scan_run_id": scan_run_id}
+
+
+@shared_task(name="webwatcher.orchestration.pipeline.fetch_stage")
+def fetch_stage_task(scan_run_id: int) -> int:
+    run_async(_run_stage(fetch_stage, scan_run_id))
+    return scan_run_id
+
+
+@shared_task(name="webwatcher.orchestration.pipeline.pdf_stage")
+def pdf_stage_task(scan_run_id: int) -> int:
+    run_async(_run_stage(pdf_stage, scan_run_id))
+    return scan_run_id
+
+
+@shared_task(name="webwatcher.orchestration.pipeline.extract_stage")
+def extract_stage_task(scan_run_id: int) -> int:
+    run_async(_run_stage(extract_stage, scan_run_id))
+    return scan_run_id
+
+
+@shared_task(name="webwatcher.orchestration.pipeline.diff_stage")
+def diff_stage_task(scan_run_id: int) -> int:
+    run_async(_run_stage(diff_stage, scan_run_id))
+    return scan_run_id
+
+
+@shared_task(name="webwatcher.orchestration.pipeline.alerts_stage")
+def alerts_stage_task(scan_run_id: int) -> dict:
+    return run_async(_run_final_stage(scan_run_id))
@@ -1,7 +1,9 @@
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown, worker_shutdown
 
 from webwatcher.core.config import get_settings
+from webwatcher.core.runtime import enable_worker_runtime, start_worker_runtime, stop_worker_runtime
 
 settings = get_settings()
 
@@ -10,16 +12,54 @@ celery_app.conf.update(
     timezone="UTC",
     task_acks_late=True,
     task_default_queue="crawl",
+    imports=(
+        "webwatcher.orchestration.monitor_worker",
+        "webwatcher.orchestration.pipeline",
+        "webwatcher.orchestration.scheduler",
+        "webwatcher.orchestration.maintenance",
+        "webwatcher.pdf.ocr_worker",
+    ),
     worker_concurrency=settings.celery_concurrency,
     task_routes={
         "webwatcher.orchestration.scheduler.tick_scheduler": {"queue": "scheduler"},
         "webwatcher.orchestration.monitor_worker.run_monitor_task": {"queue": "crawl"},
+        "webwatcher.orchestration.monitor_worker.run_monitor_batch_task": {"queue": "crawl"},
+        "webwatcher.orchestration.pipeline.fetch_stage": {"queue": "crawl"},
+        "webwatcher.orchestration.pipeline.pdf_stage": {"queue": "pdf"},
+        "webwatcher.orchestration.pipeline.extract_stage": {"queue": "extract"},
+        "webwatcher.orchestration.pipeline.diff_stage": {"queue": "diff"},
+        "webwatcher.orchestration.pipeline.alerts_stage": {"queue": "alerts"},
+        "webwatcher.orchestration.maintenance.compact_storage": {"queue": "scheduler"},
+        "webwatcher.orchestration.maintenance.rescore_changes": {"queue": "scheduler"},
+        "webwatcher.pdf.ocr_worker.ocr_document_task": {"queue": "pdf"},
     },
     beat_schedule={
         "tick-scheduler-every-5-mins": {
             "task": "webwatcher.orchestration.scheduler.tick_scheduler",
             "schedule": crontab(minute="*/5"),
-        }
+        },
+        "compact-storage-daily": {
+            "task": "webwatcher.orchestration.maintenance.compact_storage",
+            "schedule": crontab(minute=15, hour=3),
+        },
     },
 )
 celery_app.autodiscover_tasks(["webwatcher.orchestration"])
+
+
+@worker_init.connect
+def _enable_runtime(**_: object) -> None:
+    enable_worker_runtime()
+
+
+@worker_process_init.connect
+def _start_runtime(**_: object) -> None:
+    # Prefork children: open the loop and pools before the first task instead of during it.
+    enable_worker_runtime()
+    start_worker_runtime()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _stop_runtime(**_: object) -> None:
+    stop_worker_runtime()
@@ -0,0 +1,130 @@
+import calendar
+import hashlib
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from webwatcher.db.models import Change, ChangeType, MetricSeries, Severity
+
+# Listed companies publish quarterly results within 45 days of quarter end, 60 for the March
+# (fiscal year end) quarter.
+RESULTS_FILING_DAYS = {3: 60, 6: 45, 9: 45, 12: 45}
+# A financial change this recent marks a company as one that publishes results on its site.
+FINANCIAL_HISTORY_DAYS = 400
+
+
+@dataclass
+class ChangeHistory:
+    recent_changes: int
+    last_change_at: datetime | None
+    latest_period_end: date | None
+    has_financial_history: bool = False
+
+
+def company_offset_seconds(company_id: int, window_seconds: int, salt: str = "scan") -> int:
+    # Stable per company and independent of process, so every scheduler replica agrees.
+    if window_seconds <= 0:
+        return 0
+    digest = hashlib.sha256(f"{salt}:{company_id}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") % window_seconds
+
+
+def next_scan_time(
+    company_id: int, last_scanned_at: datetime, interval_minutes: int, jitter_minutes: int
+) -> datetime:
+    # The earliest moment after last + interval that falls on the company's own phase within the
+    # jitter window. Companies added together start on different phases and stay there, instead
+    # of coming due in the same scheduler tick forever.
+    earliest = last_scanned_at + timedelta(minutes=interval_minutes)
+    window = jitter_minutes * 60
+    if window <= 0:
+        return earliest
+    if earliest.tzinfo is None:
+        earliest = earliest.replace(tzinfo=timezone.utc)
+    phase = company_offset_seconds(company_id, window)
+    delay = (phase - int(earliest.timestamp())) % window
+    return earliest + timedelta(seconds=delay)
+
+
+def latest_quarter_end(today: date) -> date:
+    month = (today.month - 1) // 3 * 3
+    if month == 0:
+        return date(today.year - 1, 12, 31)
+    return date(today.year, month, calendar.monthrange(today.year, month)[1])
+
+
+def in_results_season(today: date, latest_period_end: date | None) -> bool:
+    # Inside the filing window of the last quarter, unless that quarter has already been extracted.
+    quarter_end = latest_quarter_end(today)
+    if latest_period_end is not None and latest_period_end >= quarter_end:
+        return False
+    return (today - quarter_end).days <= RESULTS_FILING_DAYS[quarter_end.month]
+
+
+def adaptive_interval_minutes(
+    base_minutes: int,
+    history: ChangeHistory,
+    now: datetime,
+    min_minutes: int,
+    max_minutes: int,
+    lookback_days: int,
+) -> int:
+    if history.recent_changes:
+        # One change per lookback window keeps the configured interval; each doubling halves it.
+        factor = 1 / history.recent_changes
+    elif history.last_change_at is None or now - history.last_change_at > timedelta(days=3 * lookback_days):
+        factor = 4.0
+    else:
+        factor = 2.0
+    if history.last_change_at is not None and now - history.last_change_at < timedelta(days=1):
+        factor = min(factor, 0.5)
+    # Only companies known to publish results here; the rest would just be polled four times as often.
+    if history.has_financial_history and in_results_season(now.date(), history.latest_period_end):
+        factor = min(factor, 0.25)
+    return int(min(max(base_minutes * factor, min_minutes), max_minutes))
+
+
+async def load_change_history(
+    session: AsyncSession, company_id: int, now: datetime, lookback_days: int
+) -> ChangeHistory:
+    # Minor changes are mostly layout churn and would keep a quiet page on the fast path.
+    since = now - timedelta(days=lookback_days)
+    recent = await session.execute(
+        select(func.count(Change.id)).where(
+            Change.company_id == company_id,
+            Change.severity != Severity.minor.value,
+            Change.created_at >= since,
+        )
+    )
+    last_change = await session.execute(
+        select(func.max(Change.created_at)).where(
+            Change.company_id == company_id, Change.severity != Severity.minor.value
+        )
+    )
+    latest_period = await session.execute(
+        select(func.max(MetricSeries.period_end)).where(MetricSeries.company_id == company_id)
+    )
+    latest_period_end = latest_period.scalar()
+    has_financial_history = latest_period_end is not None
+    if not has_financial_history:
+        financial_change = await session.execute(
+            select(Change.id)
+            .where(
+                Change.company_id == company_id,
+                Change.change_type == ChangeType.financial.value,
+                Change.created_at >= now - timedelta(days=FINANCIAL_HISTORY_DAYS),
+            )
+            .limit(1)
+        )
+        has_financial_history = financial_change.first() is not None
+    last_change_at = last_change.scalar()
+    if last_change_at is not None and last_change_at.tzinfo is None:
+        last_change_at = last_change_at.replace(tzinfo=timezone.utc)
+    return ChangeHistory(
+        recent_changes=recent.scalar() or 0,
+        last_change_at=last_change_at,
+        latest_period_end=latest_period_end,
+        has_financial_history=has_financial_history,
+    )
@@ -1,25 +1,117 @@
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
-from celery import shared_task
-from sqlalchemy import or_, select
+from celery import group, shared_task
+from sqlalchemy import desc, or_, select, update
 
+from webwatcher.core.config import get_settings
 from webwatcher.core.database import session_scope
-from webwatcher.db.models import Company, SchedulerState
+from webwatcher.core.runtime import run_async
+from webwatcher.db.models import Company, ScanRun, ScanStatus, SchedulerState
 from webwatcher.observability.metrics import metrics
-from webwatcher.orchestration.monitor_worker import run_monitor_task
+from webwatcher.orchestration.backpressure import QueueState, SchedulerBackpressure
+from webwatcher.orchestration.monitor_worker import run_monitor_batch_task
+from webwatcher.orchestration.scan_timing import company_offset_seconds
 
+# Matches the beat schedule in queue.py; enqueues are spread over one tick.
+TICK_SECONDS = 300
+CAPACITY_SAMPLE_SIZE = 200
 
-async def _due_company_ids() -> list[int]:
+
+async def claim_due_companies(limit: int) -> list[int]:
+    # Claims due companies by pushing next_scan_at out by a lease in the same transaction, so
+    # scheduler replicas never enqueue the same company twice. The scan sets the real next time
+    # when it completes; a scan that fails or is lost becomes due again once the lease runs out.
     now = datetime.now(timezone.utc)
+    lease_until = now + timedelta(seconds=get_settings().webwatch_scheduler_claim_lease_seconds)
+    due = (
+        select(Company.id)
+        .where(
+            Company.is_active.is_(True),
+            or_(Company.next_scan_at.is_(None), Company.next_scan_at <= now),
+        )
+        # Longest overdue first, so companies cut by the capacity cap lead the next tick.
+        .order_by(Company.next_scan_at.is_not(None), Company.next_scan_at, Company.id)
+        .limit(limit)
+    )
+    async with session_scope() as session:
+        if session.bind.dialect.name == "postgresql":
+            result = await session.execute(due.with_for_update(skip_locked=True))
+            company_ids = [row[0] for row in result.all()]
+            if company_ids:
+                await session.execute(
+                    update(Company)
+                    .where(Company.id.in_(company_ids))
+                    .values(next_scan_at=lease_until)
+                    .execution_options(synchronize_session=False)
+                )
+        else:
+            # No row locks elsewhere; a single UPDATE ... RETURNING runs under the database write lock.
+            result = await session.execute(
+                update(Company)
+                .where(Company.id.in_(due.scalar_subquery()))
+                .values(next_scan_at=lease_until)
+                .returning(Company.id)
+                .execution_options(synchronize_session=False)
+            )
+            company_ids = sorted(row[0] for row in result.all())
+    if company_ids:
+        metrics.inc("scheduler_companies_claimed_total", len(company_ids))
+    return company_ids
+
+
+async def measured_tick_capacity() -> int:
+    # Scans one tick can absorb: worker slots times the tick length, divided by the mean duration
+    # of recent successful scans.
+    settings = get_settings()
+    ceiling = settings.webwatch_scheduler_max_per_tick
     async with session_scope() as session:
         result = await session.execute(
-            select(Company.id).where(
-                Company.is_active.is_(True),
-                or_(Company.next_scan_at.is_(None), Company.next_scan_at <= now),
+            select(ScanRun.started_at, ScanRun.completed_at)
+            .where(
+                ScanRun.status == ScanStatus.succeeded.value,
+                ScanRun.started_at.is_not(None),
+                ScanRun.completed_at.is_not(None),
             )
+            .order_by(desc(ScanRun.completed_at))
+            .limit(CAPACITY_SAMPLE_SIZE)
         )
-        return [row[0] for row in result.all()]
+        durations = [
+            (completed_at - started_at).total_seconds()
+            for started_at, completed_at in result.all()
+            if completed_at >= started_at
+        ]
+    if not durations:
+        return ceiling
+    mean_seconds = max(sum(durations) / len(durations), 1.0)
+    metrics.set_gauge("scheduler_mean_scan_seconds", mean_seconds)
+    if settings.webwatch_pipeline_stages:
+        # Each scan is spread over the stage queues, and the crawl queue's processes take the fetch
+        # stages one at a time. The whole-scan duration overstates a fetch stage, so this errs low.
+        slots = max(1, settings.webwatch_crawl_concurrency)
+    else:
+        # Whole scans run in-process on crawl: processes x in-process batch concurrency.
+        slots = max(1, settings.celery_concurrency) * max(1, settings.webwatch_batch_scan_concurrency)
+    capacity = int(slots * TICK_SECONDS / mean_seconds)
+    return max(settings.webwatch_scheduler_batch_size, min(capacity, ceiling))
+
+
+def _tick_slot(company_id: int, tick_seconds: int) -> int:
+    return company_offset_seconds(company_id, tick_seconds, "tick")
+
+
+def plan_enqueue(
+    company_ids: list[int], batch_size: int, tick_seconds: int = TICK_SECONDS
+) -> list[tuple[int, list[int]]]:
+    # Each company has a fixed slot within the tick; neighbouring slots are batched together and
+    # the batch starts at its first member's slot, so load arrives evenly across the tick.
+    slotted = sorted(company_ids, key=lambda company_id: (_tick_slot(company_id, tick_seconds), company_id))
+    plan: list[tuple[int, list[int]]] = []
+    size = max(1, batch_size)
+    for start in range(0, len(slotted), size):
+        chunk = slotted[start : start + size]
+        plan.append((_tick_slot(chunk[0], tick_seconds), chunk))
+    return plan
 
 
 async def _touch_scheduler_state() -> None:
@@ -33,17 +125,69 @@ async def _touch_scheduler_state() -> None:
         await session.flush()
 
 
+def _record_queue_state(state: QueueState) -> None:
+    metrics.set_gauge("scheduler_queue_depth", state.depth)
+    # kombu keeps one unacked hash for the whole broker, so this counts reserved and countdown
+    # tasks on every queue, not only crawl batches.
+    metrics.set_gauge("scheduler_inflight_tasks_all_queues", state.in_flight)
+    metrics.set_gauge("scheduler_pending_companies", len(state.pending))
+    metrics.set_gauge("scheduler_queue_lag_seconds", state.lag_seconds)
+
+
 async def run_scheduler_tick() -> dict:
-    company_ids = await _due_company_ids()
-    for company_id in company_ids:
-        run_monitor_task.delay(company_id)
+    settings = get_settings()
+    capacity = await measured_tick_capacity()
+    backpressure = SchedulerBackpressure()
+    # The Redis client is blocking; keep it off the loop.
+    state = await asyncio.to_thread(backpressure.snapshot)
+    limit = capacity
+    if state is not None:
+        _record_queue_state(state)
+        # Allow one tick of backlog beyond the one being worked on. When workers fall further
+        # behind, due companies stay unclaimed and lead the next tick, longest overdue first.
+        # Queued batches mostly hold pending companies, so the larger of the two is the backlog;
+        # the queue still counts when pending entries are missing or expired.
+        queued = state.depth * max(1, settings.webwatch_scheduler_batch_size)
+        backlog = max(len(state.pending), queued)
+        limit = min(capacity, max(0, 2 * capacity - backlog))
+        if limit < capacity:
+            metrics.inc("scheduler_ticks_throttled_total")
+    company_ids = await claim_due_companies(limit) if limit else []
+    deduplicated = 0
+    if state is not None and state.pending:
+        # Still queued from an earlier tick whose lease ran out; the new lease defers them instead.
+        fresh = [company_id for company_id in company_ids if company_id not in state.pending]
+        deduplicated = len(company_ids) - len(fresh)
+        company_ids = fresh
+        metrics.inc("scheduler_jobs_deduplicated_total", deduplicated)
+    plan = plan_enqueue(company_ids, settings.webwatch_scheduler_batch_size)
+    if plan:
+        # Marked before publishing so a batch that finishes first cannot leave a stale entry.
+        await asyncio.to_thread(backpressure.mark_pending, company_ids)
+        try:
+            # One group publishes every batch over a single producer connection.
+            group(
+                run_monitor_batch_task.signature((chunk,), countdown=countdown) for countdown, chunk in plan
+            ).apply_async()
+        except Exception:
+            await asyncio.to_thread(backpressure.mark_finished, company_ids)
+            raise
     await _touch_scheduler_state()
     metrics.inc("scheduler_ticks_total")
     metrics.inc("scheduler_jobs_enqueued_total", len(company_ids))
-    return {"enqueued": len(company_ids), "company_ids": company_ids}
+    metrics.set_gauge("scheduler_tick_capacity", capacity)
+    return {
+        "enqueued": len(company_ids),
+        "batches": len(plan),
+        "capacity": capacity,
+        "limit": limit,
+        "deduplicated": deduplicated,
+        "queue_depth": state.depth if state else None,
+        "queue_lag_seconds": state.lag_seconds if state else None,
+        "company_ids": company_ids,
+    }
 
 
 @shared_task(name="webwatcher.orchestration.scheduler.tick_scheduler")
 def tick_scheduler() -> dict:
-    return asyncio.run(run_scheduler_tick())
-
+    return run_async(run_scheduler_tick())
@@ -0,0 +1,74 @@
+from collections.abc import Callable
+from typing import Protocol
+
+from webwatcher.core.config import get_settings
+
+try:
+    import pytesseract
+    from pdf2image import convert_from_bytes
+except Exception:  # pragma: no cover - optional dependency
+    pytesseract = None
+    convert_from_bytes = None
+
+
+class OcrUnavailableError(RuntimeError):
+    pass
+
+
+class OcrEngine(Protocol):
+    name: str
+
+    def available(self) -> bool: ...
+
+    def extract_pages(self, pdf_bytes: bytes, max_pages: int) -> list[str]: ...
+
+
+class TesseractOcrEngine:
+    name = "tesseract"
+
+    def available(self) -> bool:
+        return pytesseract is not None and convert_from_bytes is not None
+
+    def extract_pages(self, pdf_bytes: bytes, max_pages: int) -> list[str]:
+        if pytesseract is None or convert_from_bytes is None:
+            raise OcrUnavailableError("OCR requires pytesseract and pdf2image to be installed.")
+        images = convert_from_bytes(pdf_bytes, first_page=1, last_page=max_pages or None)
+        return [pytesseract.image_to_string(image) or "" for image in images]
+
+
+class StubOcrEngine:
+    name = "stub"
+
+    def __init__(self, pages: list[str] | None = None) -> None:
+        self.pages = pages or []
+
+    def available(self) -> bool:
+        return True
+
+    def extract_pages(self, pdf_bytes: bytes, max_pages: int) -> list[str]:
+        return self.pages[:max_pages] if max_pages else list(self.pages)
+
+
+_ENGINES: dict[str, Callable[[], OcrEngine]] = {
+    TesseractOcrEngine.name: TesseractOcrEngine,
+    StubOcrEngine.name: StubOcrEngine,
+}
+
+
+def register_ocr_engine(name: str, factory: Callable[[], OcrEngine]) -> None:
+    _ENGINES[name] = factory
+
+
+def get_ocr_engine(name: str | None = None) -> OcrEngine:
+    engine_name = name or get_settings().webwatch_ocr_engine
+    factory = _ENGINES.get(engine_name)
+    if factory is None:
+        raise OcrUnavailableError(f"Unknown OCR engine: {engine_name}")
+    return factory()
+
+
+def ocr_engine_available(name: str | None = None) -> bool:
+    try:
+        return get_ocr_engine(name).available()
+    except OcrUnavailableError:
+        return False
@@ -0,0 +1,128 @@
+import asyncio
+
+from celery import shared_task
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from webwatcher.core.config import get_settings
+from webwatcher.core.database import session_scope
+from webwatcher.core.logger import get_logger
+from webwatcher.core.runtime import run_async
+from webwatcher.db.models import Document, FinancialMetric
+from webwatcher.financial.financial_extractor import FinancialExtractor, TextChunk
+from webwatcher.financial.timeseries import MetricSeriesStore
+from webwatcher.observability.metrics import Timer, metrics
+from webwatcher.pdf.ocr import OcrEngine, get_ocr_engine, ocr_engine_available
+from webwatcher.pdf.parse_cache import PdfParseCache
+from webwatcher.pdf.pdf_parser import PdfParser, build_parsed_pdf, is_financial_page, page_fingerprints
+from webwatcher.storage.storage_service import StorageService
+
+settings = get_settings()
+
+
+async def ocr_document(
+    session: AsyncSession,
+    document_id: int,
+    engine: OcrEngine | None = None,
+    storage_service: StorageService | None = None,
+) -> dict:
+    document = await session.get(Document, document_id)
+    if document is None or not document.storage_path:
+        return {"status": "skipped", "reason": f"Document {document_id} has no stored file"}
+    engine = engine or get_ocr_engine()
+    storage = storage_service or StorageService()
+
+    pdf_bytes = await asyncio.to_thread(storage.read, "docs", document.storage_path)
+    # The engine stops at max_pages itself; the task's Celery soft and hard time limits bound the
+    # rest, since a thread cannot be cancelled once OCR has started.
+    with Timer("ocr_duration_ms"):
+        pages = await asyncio.to_thread(engine.extract_pages, pdf_bytes, settings.webwatch_ocr_max_pages)
+    parsed = build_parsed_pdf(pages)
+    if not parsed.text.strip():
+        metrics.inc("ocr_empty_total")
+        return {"status": "empty", "document_id": document_id}
+
+    # Overwrite the empty pypdf result so later sightings of the same file reuse the OCR text.
+    await PdfParseCache(PdfParser().version).replace(session, document.doc_hash, parsed)
+    document.page_hashes = page_fingerprints(pages)
+
+    added = 0
+    if document.snapshot_id is not None:
+        extracted = FinancialExtractor().extract_stream(
+            TextChunk(text=text, source=document.url, page=number)
+            for number, text in enumerate(pages, start=1)
+            if text and is_financial_page(text)
+        )
+        existing = await session.execute(
+            select(FinancialMetric.metric_name).where(FinancialMetric.snapshot_id == document.snapshot_id)
+        )
+        known = set(existing.scalars().all())
+        for metric_name, metric_value in extracted.metrics.items():
+            if metric_name in known:
+                continue
+            session.add(
+                FinancialMetric(
+                    snapshot_id=document.snapshot_id,
+                    company_id=document.company_id,
+                    metric_name=metric_name,
+                    metric_value=metric_value,
+                    unit=None,
+                    currency=extracted.currency,
+                    period=extracted.quarter,
+                    report_type=extracted.report_type,
+                    confidence=0.4,
+                )
+            )
+            added += 1
+        await MetricSeriesStore().record(
+            session,
+            document.company_id,
+            {name: value for name, value in extracted.metrics.items() if name not in known},
+            extracted.quarter,
+            snapshot_id=document.snapshot_id,
+            currency=extracted.currency,
+            report_type=extracted.report_type,
+            confidence={name: 0.4 for name in extracted.metrics},
+        )
+    await session.flush()
+    metrics.inc("ocr_documents_total")
+    return {"status": "ok", "document_id": document_id, "pages": len(pages), "metrics_added": added}
+
+
+async def run_ocr(document_id: int) -> dict:
+    logger = get_logger("webwatcher.ocr", event_name="ocr")
+    try:
+        async with session_scope() as session:
+            return await ocr_document(session, document_id)
+    except Exception as exc:
+        metrics.inc("ocr_failed_total")
+        logger.exception("OCR failed for document %s", document_id)
+        return {"status": "error", "document_id": document_id, "message": str(exc)}
+
+
+@shared_task(
+    name="webwatcher.pdf.ocr_worker.ocr_document_task",
+    rate_limit=settings.webwatch_ocr_rate_limit,
+    soft_time_limit=settings.webwatch_ocr_time_limit_seconds,
+    time_limit=settings.webwatch_ocr_time_limit_seconds + 30,
+)
+def ocr_document_task(document_id: int) -> dict:
+    return run_async(run_ocr(document_id))
+
+
+def dispatch_ocr(document_ids: list[int]) -> int:
+    if not document_ids:
+        return 0
+    if not ocr_engine_available():
+        # Every task would fail; the default engine needs the ocr extra and the Tesseract binaries.
+        metrics.inc("ocr_unavailable_total", len(document_ids))
+        return 0
+    dispatched = 0
+    for document_id in document_ids:
+        try:
+            # retry=False keeps a missing broker from stalling the scan that found the document.
+            ocr_document_task.apply_async((document_id,), retry=False)
+            dispatched += 1
+        except Exception:
+            metrics.inc("ocr_dispatch_failed_total")
+    return dispatched
@@ -0,0 +1,84 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from webwatcher.db.models import PdfParseCacheEntry
+from webwatcher.observability.metrics import metrics
+from webwatcher.pdf.pdf_parser import PARSER_VERSION, ParsedPdf
+
+
+def _record_lookup(hit: bool) -> None:
+    metrics.inc("pdf_parse_cache_hits_total" if hit else "pdf_parse_cache_misses_total")
+    hits = metrics.counters["pdf_parse_cache_hits_total"]
+    total = hits + metrics.counters["pdf_parse_cache_misses_total"]
+    metrics.set_gauge("pdf_parse_cache_hit_ratio", hits / total if total else 0.0)
+
+
+class PdfParseCache:
+    def __init__(self, parser_version: str = PARSER_VERSION) -> None:
+        self.parser_version = parser_version
+
+    async def get(self, session: AsyncSession, doc_hash: str) -> ParsedPdf | None:
+        result = await session.execute(
+            select(PdfParseCacheEntry).where(
+                PdfParseCacheEntry.doc_hash == doc_hash,
+                PdfParseCacheEntry.parser_version == self.parser_version,
+            )
+        )
+        entry = result.scalar_one_or_none()
+        _record_lookup(entry is not None)
+        if entry is None:
+            return None
+        pages = list(entry.pages or [])
+        return ParsedPdf(
+            text="\n".join(pages),
+            report_type=entry.report_type,
+            headings=list(entry.headings or []),
+            pages=pages,
+        )
+
+    async def replace(self, session: AsyncSession, doc_hash: str, parsed: ParsedPdf) -> None:
+        result = await session.execute(
+            select(PdfParseCacheEntry).where(
+                PdfParseCacheEntry.doc_hash == doc_hash,
+                PdfParseCacheEntry.parser_version == self.parser_version,
+            )
+        )
+        entry = result.scalar_one_or_none()
+        if entry is None:
+            await self.put_many(session, {doc_hash: parsed})
+            return
+        entry.pages = parsed.pages
+        entry.report_type = parsed.report_type
+        entry.headings = parsed.headings
+
+    async def put_many(self, session: AsyncSession, parsed_by_hash: dict[str, ParsedPdf]) -> None:
+        # The same filing parsed by concurrent scans resolves to one row; first writer wins, and
+        # the losing scan's transaction carries on.
+        if not parsed_by_hash:
+            return
+        rows = [
+            {
+                "doc_hash": doc_hash,
+                "parser_version": self.parser_version,
+                "pages": parsed.pages or [parsed.text],
+                "report_type": parsed.report_type,
+                "headings": parsed.headings,
+            }
+            for doc_hash, parsed in parsed_by_hash.items()
+        ]
+        dialect = session.bind.dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            await session.execute(
+                insert(PdfParseCacheEntry).on_conflict_do_nothing(index_elements=["doc_hash", "parser_version"]),
+                rows,
+            )
+            return
+        for row in rows:
+            try:
+                async with session.begin_nested():
+                    session.add(PdfParseCacheEntry(**row))
+            except IntegrityError:
+                metrics.inc("pdf_parse_cache_conflicts_total")
@@ -1,45 +1,194 @@
+import asyncio
 import hashlib
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
-from sqlalchemy import desc, select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from webwatcher.core.config import get_settings
 from webwatcher.crawler.fetcher import Fetcher
 from webwatcher.db.models import Document
-from webwatcher.pdf.pdf_parser import PdfParser
+from webwatcher.financial.financial_extractor import TextChunk
+from webwatcher.observability.metrics import Timer, metrics
+from webwatcher.pdf.parse_cache import PdfParseCache
+from webwatcher.pdf.pdf_parser import (
+    ParsedPdf,
+    PdfParser,
+    diff_page_fingerprints,
+    is_financial_page,
+    page_fingerprints,
+)
 from webwatcher.security.security_utils import validate_content_type, validate_file_size
 from webwatcher.storage.storage_service import StorageService
 
+LOOKUP_CHUNK_SIZE = 500
+
+
+@dataclass
+class PdfDocumentChange:
+    url: str
+    doc_hash: str
+    parsed: ParsedPdf | None
+    changed_pages: list[int]
+    removed_pages: int
+    total_pages: int
+    is_new: bool
+
+    def changed_page_texts(self) -> list[str]:
+        return [text for _, text in self.iter_changed_pages()]
+
+    def iter_changed_pages(self) -> Iterator[tuple[int | None, str]]:
+        if self.parsed is None:
+            return
+        if not self.parsed.pages:
+            if self.parsed.text:
+                yield None, self.parsed.text
+            return
+        for number in self.changed_pages:
+            yield number, self.parsed.pages[number - 1]
+
+    def as_details(self) -> dict:
+        return {
+            "url": self.url,
+            "doc_hash": self.doc_hash,
+            "is_new": self.is_new,
+            "changed_pages": self.changed_pages,
+            "removed_pages": self.removed_pages,
+            "total_pages": self.total_pages,
+        }
+
 
 @dataclass
 class PdfMonitorResult:
     downloaded: int
     changed: int
     parsed_texts: list[str]
+    documents: list[PdfDocumentChange] = field(default_factory=list)
+    ocr_document_ids: list[int] = field(default_factory=list)
+
+    def as_state(self) -> dict:
+        # Parsed text is not carried along; restore_pdf_result reads it back from the parse cache.
+        return {
+            "downloaded": self.downloaded,
+            "changed": self.changed,
+            "documents": [document.as_details() for document in self.documents],
+            "ocr_document_ids": self.ocr_document_ids,
+        }
+
+    def iter_financial_pages(self) -> Iterator[TextChunk]:
+        # Only pages that changed since the previous version of each document are re-extracted.
+        for document in self.documents:
+            for number, text in document.iter_changed_pages():
+                if text and is_financial_page(text):
+                    yield TextChunk(text=text, source=document.url, page=number)
+
+
+async def restore_pdf_result(
+    session: AsyncSession, state: dict, parse_cache: PdfParseCache | None = None
+) -> PdfMonitorResult:
+    parse_cache = parse_cache or PdfParseCache(PdfParser().version)
+    documents: list[PdfDocumentChange] = []
+    for details in state.get("documents", []):
+        documents.append(
+            PdfDocumentChange(
+                url=details["url"],
+                doc_hash=details["doc_hash"],
+                parsed=await parse_cache.get(session, details["doc_hash"]),
+                changed_pages=list(details.get("changed_pages", [])),
+                removed_pages=details.get("removed_pages", 0),
+                total_pages=details.get("total_pages", 0),
+                is_new=details.get("is_new", False),
+            )
+        )
+    parsed_texts = [text for text in ("\n".join(document.changed_page_texts()) for document in documents) if text]
+    return PdfMonitorResult(
+        downloaded=state.get("downloaded", 0),
+        changed=state.get("changed", 0),
+        parsed_texts=parsed_texts,
+        documents=documents,
+        ocr_document_ids=list(state.get("ocr_document_ids", [])),
+    )
+
+
+@dataclass
+class _LatestDocument:
+    doc_hash: str
+    page_hashes: list[str]
+
+
+@dataclass
+class _PdfOutcome:
+    changed: bool
+    row: dict | None = None
+    revisited: bool = False
+    document: PdfDocumentChange | None = None
 
 
 class PdfMonitor:
-    def __init__(self, fetcher: Fetcher, storage_service: StorageService, parser: PdfParser) -> None:
+    def __init__(
+        self,
+        fetcher: Fetcher,
+        storage_service: StorageService,
+        parser: PdfParser,
+        parse_cache: PdfParseCache | None = None,
+    ) -> None:
         self.fetcher = fetcher
         self.storage = storage_service
         self.parser = parser
+        self.parse_cache = parse_cache or PdfParseCache(parser.version)
         self.settings = get_settings()
 
     @staticmethod
     def _sha256(data: bytes) -> str:
         return hashlib.sha256(data).hexdigest()
 
-    async def _latest_doc(self, session: AsyncSession, company_id: int, url: str) -> Document | None:
-        stmt = (
-            select(Document)
-            .where(Document.company_id == company_id, Document.url == url)
-            .order_by(desc(Document.created_at))
-            .limit(1)
+    async def _known_hashes(
+        self, session: AsyncSession, company_id: int, urls: list[str]
+    ) -> tuple[dict[str, _LatestDocument], set[tuple[str, str]]]:
+        # One query per chunk instead of one per link. Rows come back oldest first, so the last
+        # hash seen for a URL is its latest version; the full (url, hash) set lets us recognise
+        # a document reverting to an earlier version without tripping the unique constraint.
+        latest: dict[str, _LatestDocument] = {}
+        known: set[tuple[str, str]] = set()
+        for start in range(0, len(urls), LOOKUP_CHUNK_SIZE):
+            chunk = urls[start : start + LOOKUP_CHUNK_SIZE]
+            result = await session.execute(
+                select(Document.url, Document.doc_hash, Document.page_hashes)
+                .where(Document.company_id == company_id, Document.url.in_(chunk))
+                .order_by(Document.created_at, Document.id)
+            )
+            for url, doc_hash, page_hashes in result.all():
+                latest[url] = _LatestDocument(doc_hash=doc_hash, page_hashes=list(page_hashes or []))
+                known.add((url, doc_hash))
+        return latest, known
+
+    async def _document_ids(
+        self, session: AsyncSession, company_id: int, pairs: list[tuple[str, str]]
+    ) -> list[int]:
+        wanted = set(pairs)
+        result = await session.execute(
+            select(Document.id, Document.url, Document.doc_hash).where(
+                Document.company_id == company_id,
+                Document.doc_hash.in_([doc_hash for _, doc_hash in pairs]),
+            )
         )
-        result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+        return [row.id for row in result.all() if (row.url, row.doc_hash) in wanted]
+
+    async def _download(self, link: str) -> tuple[bytes, str | None] | None:
+        try:
+            head = await self.fetcher.head(link)
+        except Exception:
+            return None
+        if not validate_content_type(head.get("content_type"), {"application/pdf"}):
+            return None
+        if not validate_file_size(head.get("content_length"), self.settings.webwatch_max_file_size_mb):
+            return None
+        response = await self.fetcher.get(link)
+        if response.status_code >= 400:
+            return None
+        return response.content, head.get("content_type")
 
     async def process_pdf_links(
         self,
@@ -48,48 +197,141 @@ class PdfMonitor:
         snapshot_id: int | None,
         links: list[str],
     ) -> PdfMonitorResult:
-        downloaded = 0
-        changed = 0
-        parsed_texts: list[str] = []
+        # Each link flows through download -> hash/dedupe -> store -> parse (or parse-cache hit).
+        # Every stage has its own concurrency limit, and the buffer bounds how many downloaded PDFs
+        # are held in memory at once, so slow parsing pushes back on downloads instead of piling up
+        # bytes.
+        download_slots = asyncio.Semaphore(max(1, self.settings.webwatch_pdf_download_concurrency))
+        store_slots = asyncio.Semaphore(max(1, self.settings.webwatch_pdf_store_concurrency))
+        parse_slots = asyncio.Semaphore(max(1, self.settings.webwatch_pdf_parse_concurrency))
+        buffer_slots = asyncio.Semaphore(max(1, self.settings.webwatch_pdf_pipeline_buffer))
+        links = list(dict.fromkeys(links))
+        latest_documents, known_hashes = await self._known_hashes(session, company_id, links)
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        # AsyncSession does not support concurrent use.
+        session_lock = asyncio.Lock()
+        # The same PDF under several URLs is resolved once per scan.
+        parse_tasks: dict[str, asyncio.Future[ParsedPdf | None]] = {}
+        fresh_parses: dict[str, ParsedPdf] = {}
 
-        for link in links:
+        async def resolve_parse(file_hash: str, content: bytes) -> ParsedPdf | None:
+            async with session_lock:
+                cached = await self.parse_cache.get(session, file_hash)
+            if cached is not None:
+                return cached
             try:
-                head = await self.fetcher.head(link)
+                async with parse_slots:
+                    parsed = await asyncio.to_thread(self.parser.parse, content)
             except Exception:
-                continue
-            if not validate_content_type(head.get("content_type"), {"application/pdf"}):
-                continue
-            if not validate_file_size(head.get("content_length"), self.settings.webwatch_max_file_size_mb):
-                continue
-            response = await self.fetcher.get(link)
-            if response.status_code >= 400:
+                metrics.inc("pdf_parse_failed_total")
+                return None
+            fresh_parses[file_hash] = parsed
+            return parsed
+
+        async def handle(link: str) -> _PdfOutcome | None:
+            async with buffer_slots:
+                try:
+                    async with download_slots:
+                        fetched = await self._download(link)
+                except Exception:
+                    metrics.inc("pdf_download_failed_total")
+                    return None
+                if fetched is None:
+                    return None
+                content, content_type = fetched
+
+                file_hash = await asyncio.to_thread(self._sha256, content)
+                previous = latest_documents.get(link)
+                if previous and previous.doc_hash == file_hash:
+                    return _PdfOutcome(changed=False)
+
+                relative = self.storage.build_path(company_id, timestamp, f"document-{file_hash[:16]}.pdf")
+                async with store_slots:
+                    storage_path = await asyncio.to_thread(self.storage.upload, "docs", relative, content)
+
+                if file_hash not in parse_tasks:
+                    parse_tasks[file_hash] = asyncio.ensure_future(resolve_parse(file_hash, content))
+                parsed = await parse_tasks[file_hash]
+                page_hashes = page_fingerprints(parsed.pages) if parsed else []
+                if previous and previous.page_hashes:
+                    changed_pages, removed_pages = diff_page_fingerprints(previous.page_hashes, page_hashes)
+                else:
+                    changed_pages, removed_pages = list(range(1, len(page_hashes) + 1)), 0
+
+                row = {
+                    "company_id": company_id,
+                    "snapshot_id": snapshot_id,
+                    "url": link,
+                    "doc_hash": file_hash,
+                    "file_size": len(content),
+                    "content_type": content_type,
+                    "storage_path": storage_path,
+                    "page_hashes": page_hashes,
+                }
+                document = PdfDocumentChange(
+                    url=link,
+                    doc_hash=file_hash,
+                    parsed=parsed,
+                    changed_pages=changed_pages,
+                    removed_pages=removed_pages,
+                    total_pages=len(page_hashes),
+                    is_new=previous is None,
+                )
+                revisited = (link, file_hash) in known_hashes
+                return _PdfOutcome(changed=True, row=row, revisited=revisited, document=document)
+
+        with Timer("pdf_pipeline_duration_ms"):
+            outcomes = await asyncio.gather(*(handle(link) for link in links))
+
+        downloaded = 0
+        changed = 0
+        parsed_texts: list[str] = []
+        documents: list[PdfDocumentChange] = []
+        new_rows: list[dict] = []
+        needs_ocr: list[tuple[str, str]] = []
+        for outcome in outcomes:
+            if outcome is None:
                 continue
             downloaded += 1
-
-            file_hash = self._sha256(response.content)
-            latest = await self._latest_doc(session, company_id, link)
-            if latest and latest.doc_hash == file_hash:
+            if not outcome.changed:
                 continue
             changed += 1
-
-            timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-            relative = self.storage.build_path(company_id, timestamp, "document.pdf")
-            storage_path = self.storage.upload("docs", relative, response.content)
-
-            parsed = self.parser.parse(response.content)
-            if parsed.text:
-                parsed_texts.append(parsed.text)
-
-            doc = Document(
-                company_id=company_id,
-                snapshot_id=snapshot_id,
-                url=link,
-                doc_hash=file_hash,
-                file_size=len(response.content),
-                content_type=head.get("content_type"),
-                storage_path=storage_path,
-            )
-            session.add(doc)
+            documents.append(outcome.document)
+            parsed = outcome.document.parsed
+            if parsed is None or not parsed.text.strip():
+                needs_ocr.append((outcome.document.url, outcome.document.doc_hash))
+            changed_text = "\n".join(outcome.document.changed_page_texts())
+            if changed_text:
+                parsed_texts.append(changed_text)
+            if outcome.revisited:
+                # Reverted to an earlier version: promote that row back to latest.
+                await session.execute(
+                    update(Document)
+                    .where(
+                        Document.company_id == company_id,
+                        Document.url == outcome.row["url"],
+                        Document.doc_hash == outcome.row["doc_hash"],
+                    )
+                    .values(
+                        snapshot_id=snapshot_id,
+                        storage_path=outcome.row["storage_path"],
+                        page_hashes=outcome.row["page_hashes"],
+                        created_at=datetime.now(timezone.utc),
+                    )
+                )
+            else:
+                new_rows.append(outcome.row)
+        if new_rows:
+            await session.execute(insert(Document), new_rows)
+        await self.parse_cache.put_many(session, fresh_parses)
         await session.flush()
-        return PdfMonitorResult(downloaded=downloaded, changed=changed, parsed_texts=parsed_texts)
-
+        ocr_document_ids: list[int] = []
+        if needs_ocr and self.settings.webwatch_enable_ocr_on_pdf_failure:
+            ocr_document_ids = await self._document_ids(session, company_id, needs_ocr)
+        return PdfMonitorResult(
+            downloaded=downloaded,
+            changed=changed,
+            parsed_texts=parsed_texts,
+            documents=documents,
+            ocr_document_ids=ocr_document_ids,
+        )
@@ -1,18 +1,28 @@
+import hashlib
 import re
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from io import BytesIO
 
+from webwatcher.core.config import get_settings
+from webwatcher.financial.canonical_map import METRIC_KEYWORD_RE
+from webwatcher.financial.financial_extractor import PERIOD_RE
+
 try:
     from pypdf import PdfReader
 except Exception:  # pragma: no cover - optional dependency
     PdfReader = None
 
+# Bump whenever parse output changes so cached parses from older versions are not reused.
+PARSER_VERSION = "3"
+
 
 @dataclass
 class ParsedPdf:
     text: str
     report_type: str | None
     headings: list[str]
+    pages: list[str] = field(default_factory=list)
 
 
 REPORT_PATTERNS = {
@@ -22,17 +32,70 @@ REPORT_PATTERNS = {
 }
 
 
+def is_financial_page(text: str) -> bool:
+    if METRIC_KEYWORD_RE.search(text) or PERIOD_RE.search(text):
+        return True
+    return any(pattern.search(text) for pattern in REPORT_PATTERNS.values())
+
+
+def build_parsed_pdf(pages: list[str]) -> ParsedPdf:
+    text = "\n".join(pages)
+    report_type = None
+    for name, pattern in REPORT_PATTERNS.items():
+        if pattern.search(text):
+            report_type = name
+            break
+    headings = [line.strip() for line in text.splitlines() if len(line.strip()) > 10][:25]
+    return ParsedPdf(text=text, report_type=report_type, headings=headings, pages=pages)
+
+
+def page_fingerprints(pages: list[str]) -> list[str]:
+    # Whitespace-insensitive so re-flowed text extraction does not register as an edit.
+    return [hashlib.sha256(" ".join(page.split()).encode("utf-8")).hexdigest() for page in pages]
+
+
+def diff_page_fingerprints(old: list[str], new: list[str]) -> tuple[list[int], int]:
+    # Set-based rather than positional, so inserting one slide flags that slide only instead of
+    # every page after it. Returns 1-based changed page numbers and the count of removed pages.
+    old_set = set(old)
+    new_set = set(new)
+    changed = [number for number, page_hash in enumerate(new, start=1) if page_hash not in old_set]
+    removed = sum(1 for page_hash in old if page_hash not in new_set)
+    return changed, removed
+
+
+def iter_financial_pages(pages: Iterable[str]) -> Iterator[str]:
+    for page in pages:
+        if page and is_financial_page(page):
+            yield page
+
+
 class PdfParser:
-    def parse(self, pdf_bytes: bytes) -> ParsedPdf:
-        text = ""
-        if PdfReader is not None:
-            reader = PdfReader(BytesIO(pdf_bytes))
-            text = "\n".join((page.extract_text() or "") for page in reader.pages)
-        report_type = None
-        for name, pattern in REPORT_PATTERNS.items():
-            if pattern.search(text):
-                report_type = name
-                break
-        headings = [line.strip() for line in text.splitlines() if len(line.strip()) > 10][:25]
-        return ParsedPdf(text=text, report_type=report_type, headings=headings)
+    def __init__(self, page_budget: int | None = None) -> None:
+        self.page_budget = page_budget if page_budget is not None else get_settings().webwatch_pdf_page_budget
+
+    @property
+    def version(self) -> str:
+        # The page budget changes which pages are extracted, so it is part of the cache key.
+        return f"{PARSER_VERSION}:{self.page_budget}"
 
+    def iter_pages(self, pdf_bytes: bytes) -> Iterator[str]:
+        # pypdf extracts text per page on demand. The budget counts pages that pass the financial
+        # probe, so results tables deep in a 300-page annual report are still reached, and reading
+        # stops once the budget is spent. Past the first budget's worth of pages, pages that fail
+        # the probe are yielded blank: page numbers stay aligned, but their text is not kept.
+        if PdfReader is None:
+            return
+        reader = PdfReader(BytesIO(pdf_bytes))
+        kept = 0
+        for index, page in enumerate(reader.pages):
+            text = page.extract_text() or ""
+            financial = is_financial_page(text)
+            kept += financial
+            yield text if financial or not self.page_budget or index < self.page_budget else ""
+            if self.page_budget and kept >= self.page_budget:
+                return
+
+    def parse(self, pdf_bytes: bytes) -> ParsedPdf:
+        # For page fingerprints and the parse cache; extraction reads the kept financial pages.
+        return build_parsed_pdf(list(self.iter_pages(pdf_bytes)))
@@ -0,0 +1,213 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from webwatcher.core.config import get_settings
+from webwatcher.db.models import (
+    Change,
+    Company,
+    Document,
+    ExtractionCacheEntry,
+    FinancialMetric,
+    LlmEvent,
+    PdfParseCacheEntry,
+    Snapshot,
+)
+from webwatcher.financial.extraction_cache import EXTRACTOR_VERSION
+from webwatcher.pdf.pdf_parser import PARSER_VERSION
+from webwatcher.storage.storage_service import StorageService
+
+ARCHIVE_BATCH_SIZE = 200
+
+
+@dataclass
+class CompactionReport:
+    companies_scanned: int = 0
+    snapshots_pruned: int = 0
+    metrics_pruned: int = 0
+    documents_detached: int = 0
+    blobs_deleted: int = 0
+    bytes_reclaimed: int = 0
+    blobs_archived: int = 0
+    bytes_archived: int = 0
+    archive_failures: int = 0
+    cache_rows_pruned: int = 0
+    llm_events_pruned: int = 0
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes even for timezone-aware columns.
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def select_prunable_snapshots(
+    snapshots: list[tuple[int, datetime]],
+    now: datetime,
+    daily_after_days: int,
+    monthly_after_days: int,
+    protected_ids: set[int],
+) -> list[int]:
+    daily_cutoff = now - timedelta(days=daily_after_days)
+    monthly_cutoff = now - timedelta(days=monthly_after_days)
+    # Keep the newest snapshot of every day (or month, once past the monthly cutoff). The newest
+    # snapshot overall always survives because it is the last member of its bucket.
+    keepers: dict[tuple, int] = {}
+    candidates: list[int] = []
+    for snapshot_id, created_at in sorted(snapshots, key=lambda item: _as_utc(item[1])):
+        created_at = _as_utc(created_at)
+        if created_at >= daily_cutoff:
+            continue
+        if created_at >= monthly_cutoff:
+            bucket = ("day", created_at.date())
+        else:
+            bucket = ("month", created_at.year, created_at.month)
+        keepers[bucket] = snapshot_id
+        candidates.append(snapshot_id)
+    kept = set(keepers.values()) | protected_ids
+    return [snapshot_id for snapshot_id in candidates if snapshot_id not in kept]
+
+
+class SnapshotCompactor:
+    def __init__(self, storage_service: StorageService) -> None:
+        settings = get_settings()
+        self.storage = storage_service
+        self.daily_after_days = settings.webwatch_retention_daily_after_days
+        self.monthly_after_days = settings.webwatch_retention_monthly_after_days
+        self.archive_after_days = settings.webwatch_retention_archive_after_days
+        self.cache_days = settings.webwatch_retention_cache_days
+        self.llm_event_days = settings.webwatch_retention_llm_event_days
+
+    async def _protected_snapshot_ids(self, session: AsyncSession, company_id: int) -> set[int]:
+        result = await session.execute(
+            select(Change.from_snapshot_id, Change.to_snapshot_id).where(Change.company_id == company_id)
+        )
+        protected: set[int] = set()
+        for from_id, to_id in result.all():
+            if from_id is not None:
+                protected.add(from_id)
+            protected.add(to_id)
+        return protected
+
+    async def _prune_company(
+        self, session: AsyncSession, company_id: int, now: datetime, report: CompactionReport
+    ) -> list[str]:
+        daily_cutoff = now - timedelta(days=self.daily_after_days)
+        result = await session.execute(
+            select(Snapshot.id, Snapshot.created_at, Snapshot.raw_blob_path).where(
+                Snapshot.company_id == company_id,
+                Snapshot.created_at < daily_cutoff,
+            )
+        )
+        rows = result.all()
+        if not rows:
+            return []
+        protected = await self._protected_snapshot_ids(session, company_id)
+        prunable = select_prunable_snapshots(
+            [(row.id, row.created_at) for row in rows],
+            now,
+            self.daily_after_days,
+            self.monthly_after_days,
+            protected,
+        )
+        if not prunable:
+            return []
+        prunable_set = set(prunable)
+        blob_paths = [row.raw_blob_path for row in rows if row.id in prunable_set and row.raw_blob_path]
+
+        metrics_result = await session.execute(
+            delete(FinancialMetric).where(FinancialMetric.snapshot_id.in_(prunable))
+        )
+        documents_result = await session.execute(
+            update(Document).where(Document.snapshot_id.in_(prunable)).values(snapshot_id=None)
+        )
+        await session.execute(delete(Snapshot).where(Snapshot.id.in_(prunable)))
+        report.snapshots_pruned += len(prunable)
+        report.metrics_pruned += metrics_result.rowcount or 0
+        report.documents_detached += documents_result.rowcount or 0
+        return blob_paths
+
+    async def _archive_rows(
+        self, session: AsyncSession, model, path_column, container: str, now: datetime, report: CompactionReport
+    ) -> None:
+        # archived_at limits each run to blobs that still need moving; batches keep transactions short.
+        cutoff = now - timedelta(days=self.archive_after_days)
+        after_id = 0
+        while True:
+            result = await session.execute(
+                select(model.id, path_column)
+                .where(
+                    model.id > after_id,
+                    model.created_at < cutoff,
+                    model.archived_at.is_(None),
+                    path_column.is_not(None),
+                )
+                .order_by(model.id)
+                .limit(ARCHIVE_BATCH_SIZE)
+            )
+            rows = result.all()
+            if not rows:
+                return
+            for row_id, stored_path in rows:
+                try:
+                    # Blob storage calls block; keep them off the loop.
+                    new_path, size = await asyncio.to_thread(self.storage.archive, container, stored_path)
+                except Exception:
+                    # Left unmarked, so the next run tries again.
+                    report.archive_failures += 1
+                    continue
+                await session.execute(
+                    update(model).where(model.id == row_id).values({path_column.key: new_path, "archived_at": now})
+                )
+                if size:
+                    report.blobs_archived += 1
+                    report.bytes_archived += size
+            await session.commit()
+            after_id = rows[-1][0]
+
+    async def _archive_cold_blobs(self, session: AsyncSession, now: datetime, report: CompactionReport) -> None:
+        await self._archive_rows(session, Document, Document.storage_path, "docs", now, report)
+        await self._archive_rows(session, Snapshot, Snapshot.raw_blob_path, "raw", now, report)
+
+    async def _prune_caches(self, session: AsyncSession, now: datetime, report: CompactionReport) -> None:
+        # Cache rows from older parser or extractor versions can never hit again; current ones
+        # are recomputed on demand once they age out.
+        cache_cutoff = now - timedelta(days=self.cache_days)
+        parse_result = await session.execute(
+            delete(PdfParseCacheEntry).where(
+                (PdfParseCacheEntry.parser_version != PARSER_VERSION) | (PdfParseCacheEntry.created_at < cache_cutoff)
+            )
+        )
+        extraction_result = await session.execute(
+            delete(ExtractionCacheEntry).where(
+                (ExtractionCacheEntry.extractor_version != EXTRACTOR_VERSION)
+                | (ExtractionCacheEntry.created_at < cache_cutoff)
+            )
+        )
+        events_result = await session.execute(
+            delete(LlmEvent).where(LlmEvent.created_at < now - timedelta(days=self.llm_event_days))
+        )
+        report.cache_rows_pruned += (parse_result.rowcount or 0) + (extraction_result.rowcount or 0)
+        report.llm_events_pruned += events_result.rowcount or 0
+        await session.commit()
+
+    async def run(self, session: AsyncSession, now: datetime | None = None) -> CompactionReport:
+        now = now or datetime.now(timezone.utc)
+        report = CompactionReport()
+        company_ids = (await session.execute(select(Company.id).order_by(Company.id))).scalars().all()
+        for company_id in company_ids:
+            report.companies_scanned += 1
+            blob_paths = await self._prune_company(session, company_id, now, report)
+            # Commit per company so a long run holds short transactions, and only drop blobs
+            # once the rows pointing at them are gone.
+            await session.commit()
+            for blob_path in blob_paths:
+                reclaimed = await asyncio.to_thread(self.storage.delete, "raw", blob_path)
+                if reclaimed:
+                    report.blobs_deleted += 1
+                    report.bytes_reclaimed += reclaimed
+        await self._archive_cold_blobs(session, now, report)
+        await self._prune_caches(session, now, report)
+        return report
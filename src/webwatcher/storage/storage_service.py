@@ -1,3 +1,4 @@
+import shutil
 from pathlib import Path
 
 from webwatcher.core.config import get_settings
@@ -7,12 +8,18 @@ try:
 except Exception:  # pragma: no cover - optional dependency at runtime
     BlobServiceClient = None
 
+ARCHIVE_DIRNAME = "archive"
+# Cool rather than Archive: archived blobs can still be read by the OCR worker and re-parses
+# without a rehydration that takes hours.
+ARCHIVE_BLOB_TIER = "Cool"
+
 
 class StorageService:
     def __init__(self) -> None:
         self.settings = get_settings()
         self.base = Path(self.settings.base_download_path)
         self.base.mkdir(parents=True, exist_ok=True)
+        self.archive_base = self.base / ARCHIVE_DIRNAME
 
     def build_path(self, company_id: int, timestamp: str, filename: str) -> str:
         return f"{company_id}/{timestamp}/{filename}"
@@ -23,13 +30,67 @@ class StorageService:
         path.write_bytes(data)
         return str(path)
 
-    def upload(self, container: str, relative_path: str, data: bytes) -> str:
+    def _blob_client(self):
         if self.settings.azure_storage_connection_string and BlobServiceClient is not None:
-            client = BlobServiceClient.from_connection_string(
-                self.settings.azure_storage_connection_string
-            )
+            return BlobServiceClient.from_connection_string(self.settings.azure_storage_connection_string)
+        return None
+
+    def upload(self, container: str, relative_path: str, data: bytes) -> str:
+        client = self._blob_client()
+        if client is not None:
             blob = client.get_blob_client(container=container, blob=relative_path)
             blob.upload_blob(data, overwrite=True)
             return relative_path
         return self.save_local(relative_path, data)
 
+    def read(self, container: str, stored_path: str) -> bytes:
+        client = self._blob_client()
+        if client is not None:
+            blob = client.get_blob_client(container=container, blob=stored_path)
+            return blob.download_blob().readall()
+        return Path(stored_path).read_bytes()
+
+    def delete(self, container: str, stored_path: str) -> int:
+        client = self._blob_client()
+        if client is not None:
+            blob = client.get_blob_client(container=container, blob=stored_path)
+            try:
+                size = blob.get_blob_properties().size
+                blob.delete_blob()
+            except Exception:
+                return 0
+            return int(size or 0)
+        path = Path(stored_path)
+        if not path.is_file():
+            return 0
+        size = path.stat().st_size
+        path.unlink()
+        return size
+
+    def is_archived(self, stored_path: str) -> bool:
+        return Path(stored_path).is_relative_to(self.archive_base)
+
+    def archive(self, container: str, stored_path: str) -> tuple[str, int]:
+        # Azure keeps the blob name and only changes the access tier; local storage moves the
+        # file under <base>/archive so hot and cold data can live on different volumes. Azure
+        # errors propagate so the caller can retry the blob on its next run.
+        client = self._blob_client()
+        if client is not None:
+            blob = client.get_blob_client(container=container, blob=stored_path)
+            properties = blob.get_blob_properties()
+            if str(properties.blob_tier or "").lower() in {"cool", "cold", "archive"}:
+                return stored_path, 0
+            blob.set_standard_blob_tier(ARCHIVE_BLOB_TIER)
+            return stored_path, int(properties.size or 0)
+        path = Path(stored_path)
+        if self.is_archived(stored_path) or not path.is_file():
+            return stored_path, 0
+        try:
+            relative = path.relative_to(self.base)
+        except ValueError:
+            relative = Path(*path.parts[-3:])
+        target = self.archive_base / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        size = path.stat().st_size
+        shutil.move(str(path), str(target))
+        return str(target), size
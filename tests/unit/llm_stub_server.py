@@ -0,0 +1,154 @@
+# Local stand-in for the Azure OpenAI chat completions endpoint. Point AZURE_OPENAI_ENDPOINT at it
+# for tests, benchmarks or offline work: python tests/unit/llm_stub_server.py --latency-ms 200
+
+import argparse
+import json
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from webwatcher.financial.financial_extractor import FinancialExtractor
+
+Responder = Callable[[str, str], dict[str, Any]]
+
+
+def default_responder(system_prompt: str, user_prompt: str) -> dict[str, Any]:
+    if "Classify" in system_prompt:
+        return {"summary": "Stub classification", "is_meaningful": True, "confidence": 0.5}
+    return dict(FinancialExtractor().extract(user_prompt).metrics)
+
+
+class StubLlmServer:
+    def __init__(
+        self,
+        responder: Responder | None = None,
+        latency_ms: int = 0,
+        fail_first: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.responder = responder or default_responder
+        self.latency_seconds = latency_ms / 1000
+        self.fail_first = fail_first
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubLlmServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubLlmServer":
+        return self.start()
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
+
+    def _respond(self, body: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        with self._lock:
+            self.requests += 1
+            attempt = self.requests
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency_seconds:
+                time.sleep(self.latency_seconds)
+            if attempt <= self.fail_first:
+                return 503, {"error": {"message": "stub overloaded", "type": "server_error"}}
+            messages = {message["role"]: message["content"] for message in body.get("messages", [])}
+            system_prompt = messages.get("system", "")
+            user_prompt = messages.get("user", "")
+            try:
+                batch = json.loads(user_prompt)
+            except ValueError:
+                batch = None
+            if isinstance(batch, dict) and isinstance(batch.get("items"), list):
+                payload = {
+                    "results": {
+                        str(item.get("id")): self.responder(system_prompt, str(item.get("input", "")))
+                        for item in batch["items"]
+                    }
+                }
+            else:
+                payload = self.responder(system_prompt, user_prompt)
+            content = json.dumps(payload)
+            prompt_tokens = (len(system_prompt) + len(user_prompt)) // 4
+            completion_tokens = len(content) // 4
+            return 200, {
+                "id": f"stub-{attempt}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "stub"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            }
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802
+                if not self.path.split("?", 1)[0].endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                status, payload = stub._respond(body)
+                encoded = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, *_: object) -> None:
+                return
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stub Azure OpenAI chat completions server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    args = parser.parse_args()
+    server = StubLlmServer(latency_ms=args.latency_ms, host=args.host, port=args.port).start()
+    print(f"Stub Azure OpenAI endpoint on {server.endpoint}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
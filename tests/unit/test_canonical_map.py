@@ -1,3 +1,4 @@
+from webwatcher.financial.alias_matcher import AliasMatcher
 from webwatcher.financial.canonical_map import canonicalize_metric_name
 
 
@@ -7,3 +8,11 @@ def test_canonical_map_handles_synonyms() -> None:
     assert canonicalize_metric_name("EBITDA Margin") == "ebitda"
     assert canonicalize_metric_name("Unknown Label") is None
 
+
+def test_canonical_map_prefers_longest_alias() -> None:
+    matcher = AliasMatcher({"profit": "gross_profit", "net profit": "net_profit", "pat": "net_profit"})
+    assert matcher.longest("net profit for the quarter") == "net_profit"
+    assert matcher.longest("gross profit") == "gross_profit"
+    assert [match.alias for match in matcher.find_all("net profit")] == ["net profit", "profit"]
+    assert canonicalize_metric_name("Net Income From Operations") == "net_profit"
+    assert canonicalize_metric_name("Income From Operations") == "revenue"
@@ -1,4 +1,6 @@
-from webwatcher.intelligence.change_detector import ChangeDetector
+import pytest
+
+from webwatcher.intelligence.change_detector import ChangeDetector, metric_matrix
 
 
 def test_change_detector_financial_change_priority() -> None:
@@ -12,3 +14,42 @@ def test_change_detector_financial_change_priority() -> None:
     assert result.change_type == "FINANCIAL"
     assert result.score > 0.2
 
+
+def test_batch_financial_delta_matches_single_company_rules() -> None:
+    names = ["revenue", "net_profit"]
+    old_rows = [{"revenue": 100.0, "net_profit": 10.0}, {"revenue": 0.0}, None, {"revenue": 50.0}]
+    new_rows = [{"revenue": 130.0, "net_profit": 9.0}, {"revenue": 10.0}, {"revenue": 5.0}, {"revenue": 50.5}]
+    detector = ChangeDetector()
+    batch = detector.batch_financial_delta(metric_matrix(old_rows, names), metric_matrix(new_rows, names), names)
+
+    for index, (old, new) in enumerate(zip(old_rows, new_rows, strict=True)):
+        expected = detector._financial_delta(old or {}, new)["max_change"]
+        assert batch.max_change[index] == pytest.approx(expected)
+    assert batch.financial_mask.tolist() == [True, False, False, False]
+    assert batch.scores == pytest.approx([0.3, 0.0, 0.0, 0.0])
+
+
+def _page(text: str, numbers: list[str]) -> dict:
+    sections = text.split("\n")
+    return {
+        "page_hash": str(hash(text)),
+        "clean_text": text,
+        "numbers": numbers,
+        "section_hashes": {str(index): section for index, section in enumerate(sections)},
+        "structured_sections": [{"type": "p", "text": section} for section in sections],
+    }
+
+
+def test_text_changes_are_scored_locally_before_any_llm_call() -> None:
+    body = "\n".join(f"Paragraph {index} about our investor relations programme and governance" for index in range(40))
+    old = _page(body, ["120", "45"])
+    typo = _page(body.replace("programme and governance", "program and governance", 1), ["120", "45"])
+    rewrite = _page("Board approves merger\nRevenue guidance raised to 150", ["150"])
+    detector = ChangeDetector()
+
+    cosmetic = detector.detect(old, typo, None, {}, False)
+    assert (cosmetic.score, cosmetic.details["verdict"]) == (0.0, "cosmetic")
+    meaningful = detector.detect(old, rewrite, None, {}, False)
+    assert (meaningful.score, meaningful.details["verdict"]) == (0.35, "meaningful")
+    no_text = detector.detect({"page_hash": "a"}, {"page_hash": "b"}, None, {}, False)
+    assert no_text.score == 0.35 and "verdict" not in no_text.details
@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from webwatcher.db.models import Base
+from webwatcher.financial.extraction_cache import ExtractionCache, ExtractionOutcome, extraction_fingerprint
+from webwatcher.normalization.html_normalizer import TableGrid
+
+
+def test_extraction_fingerprint_tracks_every_input() -> None:
+    grids = [TableGrid(caption="", rows=[["Revenue", "10"]])]
+    base = extraction_fingerprint("https://a.example/ir", "h1", grids, [("d1", [2, 3])], None)
+    assert base == extraction_fingerprint("https://a.example/ir", "h1", grids, [("d1", [2, 3])], None)
+    assert base != extraction_fingerprint("https://a.example/ir", "h2", grids, [("d1", [2, 3])], None)
+    assert base != extraction_fingerprint("https://a.example/ir", "h1", [], [("d1", [2, 3])], None)
+    assert base != extraction_fingerprint("https://a.example/ir", "h1", grids, [("d1", [2])], None)
+    assert base != extraction_fingerprint("https://a.example/ir", "h1", grids, [("d1", [2, 3])], "gpt-4.1")
+    assert base != extraction_fingerprint("https://a.example/ir", "h1", grids, [("d1", [2, 3])], None, "0")
+    with_prompt = extraction_fingerprint(
+        "https://a.example/ir", "h1", grids, [("d1", [2, 3])], "gpt-4.1", llm_prompt="financial-v1:3000"
+    )
+    assert with_prompt != extraction_fingerprint(
+        "https://a.example/ir", "h1", grids, [("d1", [2, 3])], "gpt-4.1", llm_prompt="financial-v1:1500"
+    )
+
+
+@pytest.mark.asyncio
+async def test_extraction_cache_round_trips_outcome(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'cache.db').as_posix()}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    outcome = ExtractionOutcome(
+        metrics={"revenue": 1.5e9},
+        currency="INR",
+        quarter="Q1 FY25",
+        report_type="consolidated",
+        agreement_score=0.0,
+        snapshot_confidence=0.7,
+        metric_confidence={"revenue": 0.65},
+        provenance={"revenue": {"source": "https://a.example/ir", "page": None, "line": "Revenue: INR 150 Cr"}},
+    )
+    cache = ExtractionCache()
+    async with session_maker() as session:
+        assert await cache.get(session, "fp") is None
+        await cache.put(session, "fp", outcome)
+        await cache.put(session, "fp", outcome)
+        await session.commit()
+        assert await cache.get(session, "fp") == outcome
+        assert await ExtractionCache("0").get(session, "fp") is None
+    await engine.dispose()
@@ -0,0 +1,26 @@
+import asyncio
+
+import pytest
+
+from webwatcher.crawler.fetcher import DomainRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_one_domain_without_blocking_others() -> None:
+    limiter = DomainRateLimiter(per_minute=60)
+    limiter._interval_seconds = 0.2
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    finished: dict[str, float] = {}
+
+    async def hit(name: str, domain: str) -> None:
+        await limiter.wait(domain)
+        finished[name] = loop.time() - start
+
+    await hit("a1", "a.example")
+    await asyncio.gather(hit("a2", "a.example"), hit("a3", "a.example"), hit("b1", "b.example"))
+
+    assert finished["a1"] < 0.1
+    assert finished["b1"] < 0.1
+    assert 0.18 <= finished["a2"] < finished["a3"]
+    assert finished["a3"] >= 0.38
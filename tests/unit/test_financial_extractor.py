@@ -1,4 +1,4 @@
-from webwatcher.financial.financial_extractor import FinancialExtractor
+from webwatcher.financial.financial_extractor import FinancialExtractor, MetricProvenance, TextChunk
 
 
 def test_financial_extractor_parses_core_metrics() -> None:
@@ -16,3 +16,22 @@ def test_financial_extractor_parses_core_metrics() -> None:
     assert extracted.metrics["eps"] == 5
     assert extracted.report_type == "consolidated"
 
+
+def test_financial_extractor_streams_chunks_like_joined_text() -> None:
+    chunks = ["Standalone results Q2 FY25\nRevenue: INR 90 Cr", "Notes", "EBITDA: INR 12 Cr\nRevenue: INR 95 Cr"]
+    streamed = FinancialExtractor().extract_stream(iter(chunks))
+    assert streamed == FinancialExtractor().extract("\n".join(chunks))
+    assert streamed.metrics["revenue"] == 95 * 10_000_000
+    assert streamed.quarter == "Q2 FY25"
+
+
+def test_financial_extractor_records_provenance_per_metric() -> None:
+    chunks = [
+        TextChunk("Quarterly update\nWe added 3 plants", source="https://example.com/ir"),
+        TextChunk("Net Sales: INR 40 Cr\nPage 4 of 12", source="https://example.com/q1.pdf", page=4),
+    ]
+    extracted = FinancialExtractor().extract_stream(chunks)
+    assert extracted.metrics == {"revenue": 40 * 10_000_000}
+    assert extracted.provenance["revenue"] == MetricProvenance(
+        source="https://example.com/q1.pdf", page=4, line="Net Sales: INR 40 Cr"
+    )
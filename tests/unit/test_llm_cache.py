@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from webwatcher.db.models import Base, LlmEvent
+from webwatcher.llm.llm_client import LlmClient
+from webwatcher.llm.llm_financial_validator import LlmFinancialValidator
+
+
+class _FakeCompletions:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def create(self, **_: object) -> SimpleNamespace:
+        self.calls += 1
+        message = SimpleNamespace(content='{"revenue": 150}')
+        usage = SimpleNamespace(prompt_tokens=120, completion_tokens=8)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+@pytest.mark.asyncio
+async def test_llm_calls_are_cached_by_input_model_and_prompt_version(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'llm.db').as_posix()}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    completions = _FakeCompletions()
+    client = LlmClient()
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    validator = LlmFinancialValidator(client)
+
+    async with session_maker() as session:
+        first = await validator.validate("Revenue: INR 150", {"revenue": 150.0}, session=session)
+        second = await validator.validate("Revenue: INR 150", {"revenue": 150.0}, session=session)
+        await client.complete_json_cached(session, "financial_validation", "financial-v2", "p", "Revenue: INR 150")
+        events = (await session.execute(select(LlmEvent))).scalars().all()
+
+    assert (first.merged_metrics, first.llm_payload) == (second.merged_metrics, second.llm_payload)
+    assert (first.prompt_tokens, second.prompt_tokens) == (120, 0)
+    assert first.agreement_score == 1.0
+    assert completions.calls == 2
+    assert [(event.prompt_version, event.prompt_tokens, event.cached) for event in events] == [
+        ("financial-v1", 120, False),
+        ("financial-v1", 0, True),
+        ("financial-v2", 120, False),
+    ]
+    await engine.dispose()
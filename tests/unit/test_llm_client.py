@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from llm_stub_server import StubLlmServer
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from webwatcher.core.config import get_settings
+from webwatcher.db.models import Base
+from webwatcher.llm.llm_client import LlmClient, close_shared_llm_client, shared_llm_client
+from webwatcher.llm.llm_financial_validator import LlmFinancialValidator
+
+
+@pytest.fixture
+def stub_llm(monkeypatch):
+    def configure(server: StubLlmServer, **settings: str) -> StubLlmServer:
+        monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", server.endpoint)
+        monkeypatch.setenv("AZURE_OPENAI_KEY", "stub-key")
+        for name, value in settings.items():
+            monkeypatch.setenv(name, value)
+        get_settings.cache_clear()
+        return server.start()
+
+    servers: list[StubLlmServer] = []
+    yield lambda server, **settings: servers.append(configure(server, **settings)) or server
+    for server in servers:
+        server.stop()
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_async_client_limits_concurrency_and_retries(stub_llm) -> None:
+    server = stub_llm(StubLlmServer(latency_ms=50, fail_first=1), WEBWATCH_LLM_MAX_CONCURRENCY="2")
+    client = LlmClient()
+    results = await asyncio.gather(*(client.complete_json("Extract", f"Revenue: INR {n}") for n in range(6)))
+    assert [result.payload["revenue"] for result in results] == [float(n) for n in range(6)]
+    assert server.requests == 7
+    assert server.max_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_merges_validations_into_one_request(stub_llm) -> None:
+    server = stub_llm(StubLlmServer(), WEBWATCH_LLM_BATCH_SIZE="4", WEBWATCH_LLM_BATCH_WINDOW_MS="20")
+    client = LlmClient()
+    validator = LlmFinancialValidator(client)
+
+    async def validate(value: int):
+        return await client.batcher.submit("Extract revenue", f"Revenue: INR {value}")
+
+    results = await asyncio.gather(*(validate(n) for n in (10, 20, 30, 40)))
+    assert [result.payload for result in results] == [{"revenue": float(n)} for n in (10, 20, 30, 40)]
+    assert server.requests == 1
+    single = await validator.validate("Revenue: INR 15", {"revenue": 15.0})
+    assert single.agreement_score == 1.0
+
+
+@pytest.mark.asyncio
+async def test_max_retries_counts_retries_after_the_first_attempt(stub_llm) -> None:
+    server = stub_llm(StubLlmServer(fail_first=1), WEBWATCH_LLM_MAX_RETRIES="1")
+    result = await LlmClient().complete_json("Extract", "Revenue: INR 5")
+    assert result.payload == {"revenue": 5.0}
+    assert server.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_scans_share_one_client_and_its_batches(stub_llm) -> None:
+    server = stub_llm(StubLlmServer(), WEBWATCH_LLM_BATCH_SIZE="4", WEBWATCH_LLM_BATCH_WINDOW_MS="20")
+
+    async def scan(value: int):
+        # Each scan looks the client up on its own, as the monitor stages do.
+        return await shared_llm_client().batcher.submit("Extract revenue", f"Revenue: INR {value}")
+
+    results = await asyncio.gather(*(scan(n) for n in (1, 2, 3)))
+    assert [result.payload for result in results] == [{"revenue": float(n)} for n in (1, 2, 3)]
+    assert server.requests == 1
+    assert shared_llm_client() is shared_llm_client()
+    await close_shared_llm_client()
+
+
+@pytest.mark.asyncio
+async def test_cached_call_with_batching_and_single_flight_completes(stub_llm, tmp_path) -> None:
+    server = stub_llm(
+        StubLlmServer(),
+        WEBWATCH_LLM_BATCH_SIZE="4",
+        WEBWATCH_LLM_BATCH_WINDOW_MS="20",
+        WEBWATCH_LLM_SINGLE_FLIGHT_WAIT_SECONDS="60",
+        REDIS_URL="redis://127.0.0.1:1/0",
+    )
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'llm.db').as_posix()}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    client = LlmClient()
+    assert client.batcher is not None and client.single_flight is not None
+
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def scan(prompt: str):
+        async with session_maker() as session:
+            return await client.complete_json_cached(session, "financial_validation", "v1", "Extract revenue", prompt)
+
+    # A lone prompt flushes as a single request, the path that used to wait on its own flight.
+    alone = await asyncio.wait_for(scan("Revenue: INR 6"), timeout=5)
+    results = await asyncio.wait_for(
+        asyncio.gather(*(scan(prompt) for prompt in ("Revenue: INR 7", "Revenue: INR 7", "Revenue: INR 8"))),
+        timeout=5,
+    )
+
+    assert alone.payload == {"revenue": 6.0}
+    assert [result.payload for result in results] == [{"revenue": 7.0}, {"revenue": 7.0}, {"revenue": 8.0}]
+    assert server.requests == 2
+    await client.close()
+    await engine.dispose()
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from webwatcher.core.config import get_settings
+from webwatcher.llm.llm_client import LlmResult
+from webwatcher.llm.single_flight import LlmSingleFlight
+
+
+class _SharedRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def eval(self, _script: str, _keys: int, key: str, token: str) -> int:
+        if self.values.get(key) == token:
+            del self.values[key]
+            return 1
+        return 0
+
+
+def _counting_call(calls: list[int], payload: dict) -> object:
+    async def call() -> LlmResult:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return LlmResult(payload=payload, prompt_tokens=10, completion_tokens=5, latency_ms=50, input_hash="h")
+
+    return call
+
+
+@pytest.fixture(autouse=True)
+def _settings(monkeypatch):
+    monkeypatch.setenv("REDIS_URL", "redis://127.0.0.1:1/0")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_workers_share_one_call_through_redis() -> None:
+    redis = _SharedRedis()
+    calls: list[int] = []
+    workers = [LlmSingleFlight(client=redis) for _ in range(3)]
+    call = _counting_call(calls, {"revenue": 150.0})
+    # Each worker runs its own event loop, as separate Celery processes would.
+    results = await asyncio.gather(*(asyncio.to_thread(asyncio.run, worker.run("h", call)) for worker in workers))
+    assert len(calls) == 1
+    assert all(result.payload == {"revenue": 150.0} for result in results)
+    assert sorted(result.cached for result in results) == [False, True, True]
+    assert "llm:flight:h" not in redis.values
+
+
+@pytest.mark.asyncio
+async def test_local_coalescing_without_redis() -> None:
+    calls: list[int] = []
+    flight = LlmSingleFlight()
+    call = _counting_call(calls, {"summary": "same"})
+    results = await asyncio.gather(*(flight.run("h", call) for _ in range(4)))
+    assert len(calls) == 1
+    assert [result.prompt_tokens for result in results].count(10) == 1
@@ -1,3 +1,5 @@
+import numpy as np
+
 from webwatcher.intelligence.confidence_engine import ConfidenceEngine
 from webwatcher.intelligence.materiality_engine import MaterialityEngine
 
@@ -8,6 +10,15 @@ def test_materiality_thresholds() -> None:
     assert engine.score(0.45).severity in {"Moderate", "Significant", "Critical"}
 
 
+def test_materiality_batch_matches_scalar_scoring() -> None:
+    engine = MaterialityEngine()
+    raw = [-0.2, 0.1, 0.45, 0.7, 0.95, 1.4, float("nan")]
+    batch = engine.score_batch(np.asarray(raw))
+    expected = [engine.score(0.0 if value != value else value) for value in raw]
+    assert batch.severities.tolist() == [result.severity for result in expected]
+    assert batch.scores.tolist() == [result.score for result in expected]
+
+
 def test_confidence_snapshot_score_range() -> None:
     result = ConfidenceEngine().score(
         has_tables=True,
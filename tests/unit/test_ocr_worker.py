@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from webwatcher.core.config import get_settings
+from webwatcher.db.models import Base, Company, Document, FinancialMetric, PdfParseCacheEntry, Snapshot
+from webwatcher.pdf import ocr, ocr_worker
+from webwatcher.pdf.ocr import StubOcrEngine
+from webwatcher.pdf.ocr_worker import dispatch_ocr, ocr_document
+
+
+class _BytesStorage:
+    def read(self, container: str, stored_path: str) -> bytes:
+        return b"%PDF-scanned"
+
+
+@pytest.mark.asyncio
+async def test_ocr_document_fills_cache_and_metrics_with_stub_engine(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'ocr.db').as_posix()}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_maker() as session:
+        session.add(Company(id=1, name="Scan Co", base_url="https://scan.example.com"))
+        session.add(Snapshot(id=1, company_id=1, source_url="https://scan.example.com", page_hash="p", numbers_hash="n"))
+        session.add(
+            Document(id=1, company_id=1, snapshot_id=1, url="https://scan.example.com/q1.pdf", doc_hash="h1", storage_path="q1.pdf")
+        )
+        await session.flush()
+
+        stub = StubOcrEngine(pages=["Quarterly results", "Revenue: INR 10 Cr"])
+        result = await ocr_document(session, 1, engine=stub, storage_service=_BytesStorage())
+        await session.commit()
+
+        document = await session.get(Document, 1)
+        metric_names = (await session.execute(select(FinancialMetric.metric_name))).scalars().all()
+        cached = (await session.execute(select(PdfParseCacheEntry))).scalars().all()
+
+    assert result["status"] == "ok"
+    assert len(document.page_hashes) == 2
+    assert metric_names == ["revenue"]
+    assert cached[0].pages == ["Quarterly results", "Revenue: INR 10 Cr"]
+    await engine.dispose()
+
+
+def test_dispatch_skips_documents_when_the_engine_is_not_installed(monkeypatch) -> None:
+    sent = []
+    monkeypatch.setattr(ocr_worker.ocr_document_task, "apply_async", lambda args, **_: sent.append(args))
+    monkeypatch.setattr(ocr, "pytesseract", None)
+    monkeypatch.setenv("WEBWATCH_OCR_ENGINE", "tesseract")
+    get_settings.cache_clear()
+
+    assert dispatch_ocr([1, 2]) == 0
+    assert sent == []
+
+    monkeypatch.setenv("WEBWATCH_OCR_ENGINE", "stub")
+    get_settings.cache_clear()
+    assert dispatch_ocr([1, 2]) == 2
+    assert sent == [(1,), (2,)]
+    get_settings.cache_clear()
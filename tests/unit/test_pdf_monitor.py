@@ -0,0 +1,183 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from webwatcher.crawler.fetcher import FetchResponse
+from webwatcher.db.models import Base, Document, PdfParseCacheEntry
+from webwatcher.pdf.parse_cache import PdfParseCache
+from webwatcher.pdf.pdf_monitor import PdfMonitor
+from webwatcher.pdf.pdf_parser import ParsedPdf
+
+
+class _SlowFetcher:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def head(self, url: str) -> dict:
+        return {"content_type": "application/pdf", "content_length": 10}
+
+    async def get(self, url: str) -> FetchResponse:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        return FetchResponse(url=url, status_code=200, content=url.encode(), headers={}, fetched_at=None)
+
+
+class _MemoryStorage:
+    def build_path(self, company_id: int, timestamp: str, filename: str) -> str:
+        return f"{company_id}/{timestamp}/{filename}"
+
+    def upload(self, container: str, relative_path: str, data: bytes) -> str:
+        return relative_path
+
+
+class _EchoParser:
+    version = "test"
+
+    def parse(self, pdf_bytes: bytes) -> ParsedPdf:
+        return ParsedPdf(text=pdf_bytes.decode(), report_type=None, headings=[])
+
+
+@pytest.mark.asyncio
+async def test_pdf_pipeline_runs_links_concurrently_within_limits(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("WEBWATCH_PDF_DOWNLOAD_CONCURRENCY", "3")
+    from webwatcher.core.config import get_settings
+
+    get_settings.cache_clear()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'pdf.db').as_posix()}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    fetcher = _SlowFetcher()
+    monitor = PdfMonitor(fetcher, _MemoryStorage(), _EchoParser())
+    links = [f"https://example.com/docs/{index}.pdf" for index in range(9)]
+    async with session_maker() as session:
+        first = await monitor.process_pdf_links(session, company_id=1, snapshot_id=None, links=links)
+        second = await monitor.process_pdf_links(session, company_id=1, snapshot_id=None, links=links)
+        stored = (await session.execute(select(Document))).scalars().all()
+
+    assert 1 < fetcher.peak <= 3
+    assert first.downloaded == 9 and first.changed == 9
+    assert first.parsed_texts == links
+    assert second.downloaded == 9 and second.changed == 0
+    assert len(stored) == 9
+    await engine.dispose()
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_pdf_pipeline_promotes_reverted_document_version(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'pdf_revert.db').as_posix()}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    versions = iter([b"v1", b"v2", b"v1", b"v1"])
+
+    class _VersionedFetcher(_SlowFetcher):
+        async def get(self, url: str) -> FetchResponse:
+            return FetchResponse(url=url, status_code=200, content=next(versions), headers={}, fetched_at=None)
+
+    monitor = PdfMonitor(_VersionedFetcher(), _MemoryStorage(), _EchoParser())
+    link = ["https://example.com/docs/report.pdf"]
+    async with session_maker() as session:
+        changed = [
+            (await monitor.process_pdf_links(session, company_id=1, snapshot_id=None, links=link)).changed
+            for _ in range(4)
+        ]
+        stored = (await session.execute(select(Document))).scalars().all()
+
+    assert changed == [1, 1, 1, 0]
+    assert len(stored) == 2
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pdf_parse_cache_reuses_parse_for_same_hash(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'pdf_cache.db').as_posix()}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    class _SameBytesFetcher(_SlowFetcher):
+        async def get(self, url: str) -> FetchResponse:
+            return FetchResponse(url=url, status_code=200, content=b"same", headers={}, fetched_at=None)
+
+    class _CountingParser(_EchoParser):
+        calls = 0
+
+        def parse(self, pdf_bytes: bytes) -> ParsedPdf:
+            _CountingParser.calls += 1
+            return ParsedPdf(text="same", report_type="annual_report", headings=[], pages=["same"])
+
+    monitor = PdfMonitor(_SameBytesFetcher(), _MemoryStorage(), _CountingParser())
+    async with session_maker() as session:
+        first = await monitor.process_pdf_links(
+            session, company_id=1, snapshot_id=None, links=["https://example.com/a.pdf", "https://example.com/b.pdf"]
+        )
+        second = await monitor.process_pdf_links(
+            session, company_id=2, snapshot_id=None, links=["https://example.com/c.pdf"]
+        )
+
+    assert _CountingParser.calls == 1
+    assert first.parsed_texts == ["same", "same"]
+    assert second.parsed_texts == ["same"]
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pdf_monitor_reports_changed_pages_only(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'pdf_pages.db').as_posix()}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    class _PagedParser(_EchoParser):
+        def parse(self, pdf_bytes: bytes) -> ParsedPdf:
+            pages = pdf_bytes.decode().split("|")
+            return ParsedPdf(text="\n".join(pages), report_type=None, headings=[], pages=pages)
+
+    versions = iter([b"Cover|Revenue: INR 10 Cr|Outlook", b"Cover|Revenue: INR 11 Cr|Outlook"])
+
+    class _VersionedFetcher(_SlowFetcher):
+        async def get(self, url: str) -> FetchResponse:
+            return FetchResponse(url=url, status_code=200, content=next(versions), headers={}, fetched_at=None)
+
+    monitor = PdfMonitor(_VersionedFetcher(), _MemoryStorage(), _PagedParser())
+    link = ["https://example.com/docs/results.pdf"]
+    async with session_maker() as session:
+        first = await monitor.process_pdf_links(session, company_id=1, snapshot_id=None, links=link)
+        second = await monitor.process_pdf_links(session, company_id=1, snapshot_id=None, links=link)
+
+    assert first.documents[0].changed_pages == [1, 2, 3]
+    assert second.documents[0].changed_pages == [2]
+    assert second.parsed_texts == ["Revenue: INR 11 Cr"]
+    chunks = list(second.iter_financial_pages())
+    assert [(chunk.text, chunk.source, chunk.page) for chunk in chunks] == [("Revenue: INR 11 Cr", link[0], 2)]
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_parse_cache_put_many_tolerates_concurrent_writers(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'cache.db').as_posix()}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    parsed = ParsedPdf(text="Revenue", report_type=None, headings=[], pages=["Revenue"])
+    cache = PdfParseCache("v1")
+
+    async with session_maker() as first, session_maker() as second:
+        await cache.put_many(first, {"h1": parsed})
+        await first.commit()
+        # The second scan parsed the same filing and writes it alongside a new one.
+        await cache.put_many(second, {"h1": parsed, "h2": parsed})
+        await second.commit()
+        hashes = (await second.execute(select(PdfParseCacheEntry.doc_hash))).scalars().all()
+
+    assert sorted(hashes) == ["h1", "h2"]
+    await engine.dispose()
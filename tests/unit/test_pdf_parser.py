@@ -0,0 +1,52 @@
+from webwatcher.pdf import pdf_parser
+from webwatcher.pdf.pdf_parser import PdfParser, diff_page_fingerprints, iter_financial_pages, page_fingerprints
+
+
+class _FakePage:
+    extracted = 0
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def extract_text(self) -> str:
+        _FakePage.extracted += 1
+        return self.text
+
+
+def test_pdf_parser_budget_counts_financial_pages(monkeypatch) -> None:
+    pages = [_FakePage(f"Notes to accounts page {index}") for index in range(300)]
+    pages[1] = _FakePage("Quarterly results\nRevenue: INR 120 Cr")
+    pages[210] = _FakePage("Standalone results\nNet profit: INR 30 Cr")
+    monkeypatch.setattr(pdf_parser, "PdfReader", lambda _stream: type("Reader", (), {"pages": pages}))
+    _FakePage.extracted = 0
+
+    parsed = PdfParser(page_budget=5).parse(b"%PDF")
+
+    # Two financial pages never spend the budget, so the whole report is probed.
+    assert _FakePage.extracted == 300
+    assert len(parsed.pages) == 300
+    assert parsed.pages[4] == "Notes to accounts page 4"
+    assert parsed.pages[5] == ""
+    assert parsed.report_type == "quarterly_results"
+    assert list(iter_financial_pages(parsed.pages)) == [
+        "Quarterly results\nRevenue: INR 120 Cr",
+        "Standalone results\nNet profit: INR 30 Cr",
+    ]
+
+    for index in range(20, 30):
+        pages[index] = _FakePage(f"Segment revenue: INR {index} Cr")
+    _FakePage.extracted = 0
+
+    parsed = PdfParser(page_budget=5).parse(b"%PDF")
+
+    assert _FakePage.extracted == 24
+    assert len(list(iter_financial_pages(parsed.pages))) == 5
+
+
+def test_page_diff_flags_only_edited_and_inserted_pages() -> None:
+    old = page_fingerprints(["Cover", "Revenue: INR 100 Cr", "Outlook"])
+    new = page_fingerprints(["Cover", "New  slide", "Revenue: INR 101 Cr", "Outlook"])
+    changed, removed = diff_page_fingerprints(old, new)
+    assert changed == [2, 3]
+    assert removed == 1
+    assert page_fingerprints(["Outlook  text"]) == page_fingerprints(["Outlook\ntext"])
@@ -0,0 +1,27 @@
+from webwatcher.financial.financial_extractor import TextChunk
+from webwatcher.llm.prompt_builder import FinancialPromptBuilder, estimate_tokens
+
+
+def test_builder_packs_metric_dense_sections_within_budget() -> None:
+    boilerplate = "\n".join(f"Our company values integrity and customer focus, line {n}." for n in range(200))
+    results_page = TextChunk(
+        text="Revenue 1,250.4\nNet profit 210.7\nEBITDA 330.2\nEPS 12.4",
+        source="https://example.com/q3.pdf",
+        page=4,
+    )
+    cover_page = TextChunk(text="Investor presentation 2024", source="https://example.com/q3.pdf", page=1)
+
+    built = FinancialPromptBuilder(token_budget=200).build(boilerplate, [cover_page, results_page])
+
+    assert built.estimated_tokens <= 200
+    assert "[pdf https://example.com/q3.pdf p.4]" in built.text
+    assert "Net profit 210.7" in built.text
+    assert "integrity" not in built.text
+    assert "Investor presentation" not in built.text
+
+
+def test_builder_falls_back_to_page_head_without_aliases() -> None:
+    text = "Total income 500\n" * 100
+    built = FinancialPromptBuilder(token_budget=50).build(text)
+    assert built.text.startswith("Total income 500")
+    assert estimate_tokens(built.text) <= 50
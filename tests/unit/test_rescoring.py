@@ -0,0 +1,36 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from webwatcher.db.models import Base, Change
+from webwatcher.intelligence.materiality_engine import MaterialityEngine
+from webwatcher.intelligence.rescoring import rescore_changes
+
+
+@pytest.mark.asyncio
+async def test_rescore_changes_moves_only_rows_whose_bucket_changed(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'rescore.db').as_posix()}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    materiality = MaterialityEngine()
+    async with session_maker() as session:
+        for score in (0.1, 0.5, 0.9):
+            session.add(
+                Change(
+                    company_id=1,
+                    to_snapshot_id=1,
+                    change_type="TEXT",
+                    severity=materiality.score(score).severity,
+                    score=score,
+                    confidence=0.5,
+                    summary="seed",
+                )
+            )
+        await session.flush()
+        materiality.critical = 0.4
+        report = await rescore_changes(session, materiality, chunk_size=2)
+        severities = (await session.execute(select(Change.severity).order_by(Change.id))).scalars().all()
+    assert (report.scanned, report.updated) == (3, 1)
+    assert severities == ["Minor", "Critical", "Critical"]
+    await engine.dispose()
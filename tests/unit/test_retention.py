@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from webwatcher.core import database
+from webwatcher.core.config import get_settings
+from webwatcher.db.models import Base, Company, Document, LlmEvent, PdfParseCacheEntry
+from webwatcher.pdf.pdf_parser import PARSER_VERSION
+from webwatcher.storage import retention
+from webwatcher.storage.retention import SnapshotCompactor, select_prunable_snapshots
+from webwatcher.storage.storage_service import StorageService
+
+
+def test_retention_thins_old_snapshots_and_keeps_protected() -> None:
+    now = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    snapshots = [
+        (1, now - timedelta(days=400, hours=5)),
+        (2, now - timedelta(days=400, hours=1)),
+        (3, now - timedelta(days=60, hours=5)),
+        (4, now - timedelta(days=60, hours=1)),
+        (5, now - timedelta(days=45, hours=2)),
+        (6, now - timedelta(days=2)),
+    ]
+    prunable = select_prunable_snapshots(snapshots, now, 30, 365, protected_ids={3})
+    assert prunable == [1]
+
+
+def test_storage_archive_and_delete_report_bytes(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BASE_DOWNLOAD_PATH", str(tmp_path / "downloads"))
+    get_settings.cache_clear()
+    storage = StorageService()
+    stored = storage.upload("docs", "1/20240101T000000Z/document.pdf", b"x" * 10)
+    archived_path, archived_bytes = storage.archive("docs", stored)
+    assert archived_bytes == 10
+    assert storage.is_archived(archived_path)
+    assert storage.archive("docs", archived_path) == (archived_path, 0)
+    assert storage.delete("docs", archived_path) == 10
+    get_settings.cache_clear()
+
+
+class _FakeBlob:
+    def __init__(self) -> None:
+        self.tier = "Hot"
+
+    def get_blob_properties(self):
+        return type("Properties", (), {"blob_tier": self.tier, "size": 10})()
+
+    def set_standard_blob_tier(self, tier: str) -> None:
+        self.tier = tier
+
+
+class _FakeBlobService:
+    def __init__(self, blob: _FakeBlob) -> None:
+        self.blob = blob
+
+    def get_blob_client(self, container: str, blob: str) -> _FakeBlob:
+        return self.blob
+
+
+def test_azure_archive_moves_blobs_to_a_readable_tier(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("BASE_DOWNLOAD_PATH", str(tmp_path / "downloads"))
+    get_settings.cache_clear()
+    storage = StorageService()
+    blob = _FakeBlob()
+    monkeypatch.setattr(storage, "_blob_client", lambda: _FakeBlobService(blob))
+
+    assert storage.archive("docs", "1/doc.pdf") == ("1/doc.pdf", 10)
+    assert blob.tier == "Cool"
+    assert storage.archive("docs", "1/doc.pdf") == ("1/doc.pdf", 0)
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_compactor_archives_each_blob_once_and_prunes_caches(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{(tmp_path / 'retention.db').as_posix()}")
+    monkeypatch.setenv("BASE_DOWNLOAD_PATH", str(tmp_path / "downloads"))
+    get_settings.cache_clear()
+    monkeypatch.setattr(database, "_engine", None)
+    monkeypatch.setattr(database, "_session_maker", None)
+    async with database.get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    storage = StorageService()
+    now = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    old = now - timedelta(days=120)
+    async with database.session_scope() as session:
+        company = Company(name="Acme", base_url="https://acme.example")
+        session.add(company)
+        await session.flush()
+        for index in range(3):
+            stored = storage.upload("docs", f"{company.id}/old/doc{index}.pdf", b"x" * 10)
+            session.add(
+                Document(
+                    company_id=company.id,
+                    url=f"https://acme.example/{index}.pdf",
+                    doc_hash=str(index),
+                    storage_path=stored,
+                    created_at=old,
+                )
+            )
+        session.add(PdfParseCacheEntry(doc_hash="a", parser_version="0", pages=[], headings=[]))
+        session.add(PdfParseCacheEntry(doc_hash="b", parser_version=PARSER_VERSION, pages=[], headings=[]))
+        session.add(
+            LlmEvent(
+                purpose="p",
+                model="m",
+                prompt_version="1",
+                input_hash="h",
+                output_json={},
+                created_at=old - timedelta(days=90),
+            )
+        )
+    calls = []
+    original_archive = storage.archive
+
+    def _archive(container: str, stored_path: str):
+        calls.append(stored_path)
+        return original_archive(container, stored_path)
+
+    monkeypatch.setattr(storage, "archive", _archive)
+    monkeypatch.setattr(retention, "ARCHIVE_BATCH_SIZE", 2)
+    try:
+        async with database.session_scope() as session:
+            first = await SnapshotCompactor(storage).run(session, now=now)
+        async with database.session_scope() as session:
+            second = await SnapshotCompactor(storage).run(session, now=now)
+            archived = (await session.execute(select(Document.archived_at))).scalars().all()
+            parse_versions = (await session.execute(select(PdfParseCacheEntry.parser_version))).scalars().all()
+    finally:
+        await database.get_engine().dispose()
+        get_settings.cache_clear()
+
+    assert first.blobs_archived == 3 and first.bytes_archived == 30
+    assert len(calls) == 3
+    assert second.blobs_archived == 0
+    assert all(archived)
+    assert first.cache_rows_pruned == 1 and first.llm_events_pruned == 1
+    assert parse_versions == [PARSER_VERSION]
@@ -0,0 +1,42 @@
+import asyncio
+
+from webwatcher.core import database, runtime
+from webwatcher.crawler.fetcher import Fetcher
+
+
+async def _loop_and_client() -> tuple[int, int | None]:
+    fetcher = Fetcher()
+    client = fetcher._client
+    await fetcher.close()
+    return id(asyncio.get_running_loop()), id(client) if not client.is_closed else None
+
+
+def test_worker_runtime_reuses_one_loop_and_http_client(monkeypatch) -> None:
+    monkeypatch.setattr(runtime, "_worker_mode", True)
+    try:
+        first = runtime.run_async(_loop_and_client())
+        second = runtime.run_async(_loop_and_client())
+        shared = runtime.current_runtime().http_client
+    finally:
+        runtime.stop_worker_runtime()
+    assert first == second
+    assert first[1] == id(shared)
+    assert shared.is_closed
+    assert runtime.current_runtime() is None
+
+
+def test_run_async_without_runtime_disposes_engine_per_task(monkeypatch) -> None:
+    monkeypatch.setattr(runtime, "_worker_mode", False)
+    monkeypatch.setattr(database, "_engine", None)
+    monkeypatch.setattr(database, "_session_maker", None)
+
+    async def touch_engine() -> bool:
+        database.get_engine()
+        fetcher = Fetcher()
+        owned = fetcher._owns_client
+        await fetcher.close()
+        return owned
+
+    owned = runtime.run_async(touch_engine())
+    assert owned
+    assert database._engine is None
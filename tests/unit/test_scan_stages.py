@@ -0,0 +1,254 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+
+from webwatcher.core import database
+from webwatcher.core.config import get_settings
+from webwatcher.crawler.fetcher import FetchResponse
+from webwatcher.db.models import Base, Change, Company, ScanRun
+from webwatcher.observability.metrics import metrics
+from webwatcher.orchestration import locks, monitor_worker, pipeline
+
+
+class _FakeFetcher:
+    pages: dict[str, str] = {}
+
+    async def get(self, url: str) -> FetchResponse:
+        html = self.pages.get(url, "<html></html>")
+        return FetchResponse(url, 200, html.encode(), {}, datetime.now(timezone.utc))
+
+    async def close(self) -> None:
+        return None
+
+
+class _FakeCrawler:
+    def __init__(self, *_: object, **__: object) -> None:
+        pass
+
+    async def crawl_targeted(self, url: str) -> list[str]:
+        return [url]
+
+
+@pytest.fixture
+async def scan_db(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{(tmp_path / 'scan.db').as_posix()}")
+    monkeypatch.setenv("BASE_DOWNLOAD_PATH", str(tmp_path / "downloads"))
+    monkeypatch.delenv("AZURE_OPENAI_ENDPOINT", raising=False)
+    get_settings.cache_clear()
+    monkeypatch.setattr(database, "_engine", None)
+    monkeypatch.setattr(database, "_session_maker", None)
+    monkeypatch.setattr(monitor_worker, "Fetcher", _FakeFetcher)
+    monkeypatch.setattr(monitor_worker, "CrawlerController", _FakeCrawler)
+    async with database.get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with database.session_scope() as session:
+        company = Company(name="Acme", base_url="https://acme.example/investors")
+        session.add(company)
+        await session.flush()
+        company_id = company.id
+    yield company_id
+    await database.get_engine().dispose()
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_stages_hand_state_through_the_scan_run(scan_db) -> None:
+    url = "https://acme.example/investors"
+    _FakeFetcher.pages = {url: "<html><body><p>Revenue: INR 100 Cr</p></body></html>"}
+    first = await monitor_worker.run_monitor(scan_db, use_distributed_lock=False)
+
+    _FakeFetcher.pages = {url: "<html><body><p>Revenue: INR 130 Cr</p></body></html>"}
+    async with database.session_scope() as session:
+        scan_run = await session.get(ScanRun, first["scan_run_id"])
+        scan_run.idempotency_key = "earlier-window"
+    second = await monitor_worker.run_monitor(scan_db, use_distributed_lock=False)
+
+    assert first["status"] == second["status"] == "ok"
+    assert second["metrics_found"] == 1
+    async with database.session_scope() as session:
+        scan_run = await session.get(ScanRun, second["scan_run_id"])
+        state = monitor_worker.pipeline_state(scan_run)
+        changes = (await session.execute(select(Change))).scalars().all()
+    assert state["stage"] == "alerts"
+    assert state["old_snapshot_id"] == first["snapshot_id"]
+    assert state["extraction"]["metrics"] == {"revenue": 1_300_000_000.0}
+    assert [change.change_type for change in changes] == ["TEXT", "FINANCIAL"]
+    assert state["change_id"] == changes[-1].id
+
+
+@pytest.mark.asyncio
+async def test_batch_scan_caps_each_domain_and_isolates_failures(scan_db, monkeypatch) -> None:
+    monkeypatch.setenv("WEBWATCH_BATCH_SCAN_PER_DOMAIN", "1")
+    monkeypatch.setenv("WEBWATCH_PIPELINE_STAGES", "false")
+    get_settings.cache_clear()
+    async with database.session_scope() as session:
+        session.add_all(
+            [
+                Company(name="Acme Bonds", base_url="https://acme.example/bonds"),
+                Company(name="Other", base_url="https://other.example/ir"),
+            ]
+        )
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def fake_run_monitor(company_id: int, use_distributed_lock: bool = True) -> dict:
+        domain = "acme" if company_id in (1, 2) else "other"
+        in_flight[domain] = in_flight.get(domain, 0) + 1
+        peak[domain] = max(peak.get(domain, 0), in_flight[domain])
+        await asyncio.sleep(0.05)
+        in_flight[domain] -= 1
+        if company_id == 3:
+            raise RuntimeError("boom")
+        return {"status": "ok"}
+
+    monkeypatch.setattr(monitor_worker, "run_monitor", fake_run_monitor)
+    result = await monitor_worker.run_monitor_batch([scan_db, 2, 3, 2])
+
+    assert result["scanned"] == 3
+    assert result["statuses"] == {"ok": 2, "error": 1}
+    assert result["results"][3] == {"status": "error", "message": "boom"}
+    assert peak == {"acme": 1, "other": 1}
+    assert monitor_worker._scan_slots(16)[1] == {}
+
+
+class _RecordingBackpressure:
+    finished: list[int] = []
+
+    def mark_finished(self, company_ids: list[int]) -> None:
+        self.finished.extend(company_ids)
+
+
+@pytest.mark.asyncio
+async def test_batch_scan_starts_pipelines_and_leaves_queued_companies_pending(scan_db, monkeypatch) -> None:
+    async with database.session_scope() as session:
+        session.add(Company(name="Other", base_url="https://other.example/ir"))
+
+    async def fake_start_pipeline(company_id: int) -> dict:
+        if company_id == 2:
+            return {"status": "skipped", "reason": "locked"}
+        return {"status": "queued", "scan_run_id": 10 + company_id}
+
+    async def unexpected_run_monitor(*_: object, **__: object) -> dict:
+        raise AssertionError("batch scans should go through the pipeline")
+
+    monkeypatch.setattr(pipeline, "start_pipeline", fake_start_pipeline)
+    monkeypatch.setattr(monitor_worker, "run_monitor", unexpected_run_monitor)
+    monkeypatch.setattr(monitor_worker, "SchedulerBackpressure", _RecordingBackpressure)
+    monkeypatch.setattr(_RecordingBackpressure, "finished", [])
+
+    result = await monitor_worker.run_monitor_batch([scan_db, 2])
+
+    assert result["statuses"] == {"queued": 1, "skipped": 1}
+    assert _RecordingBackpressure.finished == [2]
+
+
+class _LockRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+    def eval(self, _script: str, _numkeys: int, key: str, token: str, ttl_seconds: int) -> int:
+        if self.values.get(key) != token:
+            return 0
+        self.ttls[key] = ttl_seconds
+        return 1
+
+
+def _recording_chain(dispatched: list):
+    class _Chain:
+        def __init__(self, *signatures) -> None:
+            self.signatures = signatures
+
+        def apply_async(self) -> None:
+            dispatched.append(self.signatures)
+
+    return _Chain
+
+
+@pytest.mark.asyncio
+async def test_pipeline_renews_its_lock_per_stage_and_releases_at_the_end(scan_db, monkeypatch) -> None:
+    redis = _LockRedis()
+    dispatched = []
+    monkeypatch.setattr(locks, "_redis_client", lambda: redis)
+    monkeypatch.setattr(pipeline, "chain", _recording_chain(dispatched))
+    monkeypatch.setattr(pipeline, "SchedulerBackpressure", _RecordingBackpressure)
+    monkeypatch.setattr(_RecordingBackpressure, "finished", [])
+    key = f"lock:company:{scan_db}:scan"
+
+    started = await pipeline.start_pipeline(scan_db)
+    scan_run_id = started["scan_run_id"]
+
+    assert started["status"] == "queued"
+    assert len(dispatched[0]) == 5
+    assert redis.ttls[key] == 3600
+    redis.ttls[key] = 5
+    await pipeline._run_stage(monitor_worker.fetch_stage, scan_run_id)
+    assert redis.ttls[key] == 3600
+
+    token = redis.values[key]
+    redis.values[key] = "another-scan"
+    before = metrics.counters.get("scan_lock_renew_failed_total", 0)
+    await pipeline._run_stage(monitor_worker.pdf_stage, scan_run_id)
+    assert metrics.counters["scan_lock_renew_failed_total"] == before + 1
+    assert redis.ttls[key] == 3600
+
+    redis.values[key] = token
+    await pipeline._run_stage(monitor_worker.extract_stage, scan_run_id)
+    await pipeline._run_stage(monitor_worker.diff_stage, scan_run_id)
+    result = await pipeline._run_final_stage(scan_run_id)
+    assert result["status"] == "ok"
+    assert key not in redis.values
+    assert _RecordingBackpressure.finished == [scan_db]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_in_process_when_redis_is_down(scan_db, monkeypatch) -> None:
+    monkeypatch.setenv("REDIS_URL", "redis://127.0.0.1:1/0")
+    get_settings.cache_clear()
+    dispatched = []
+    monkeypatch.setattr(pipeline, "chain", _recording_chain(dispatched))
+
+    result = await pipeline.start_pipeline(scan_db)
+
+    assert result["status"] == "ok"
+    assert dispatched == []
+    assert scan_db not in locks._local_active_company_ids
+
+
+@pytest.mark.asyncio
+async def test_pipeline_releases_its_lock_when_the_chain_cannot_be_published(scan_db, monkeypatch) -> None:
+    redis = _LockRedis()
+    monkeypatch.setattr(locks, "_redis_client", lambda: redis)
+
+    class _BrokenChain:
+        def __init__(self, *signatures) -> None:
+            pass
+
+        def apply_async(self) -> None:
+            raise ConnectionError("broker down")
+
+    monkeypatch.setattr(pipeline, "chain", _BrokenChain)
+
+    with pytest.raises(ConnectionError):
+        await pipeline.start_pipeline(scan_db)
+
+    async with database.session_scope() as session:
+        scan_run = (await session.execute(select(ScanRun))).scalar_one()
+    assert redis.values == {}
+    assert scan_run.status == "failed"
+    assert scan_run.error_message == "broker down"
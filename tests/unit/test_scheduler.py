@@ -0,0 +1,246 @@
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from webwatcher.core import database
+from webwatcher.core.config import get_settings
+from webwatcher.db.models import Base, Change, Company, ScanRun
+from webwatcher.observability.metrics import metrics
+from webwatcher.orchestration import scheduler
+from webwatcher.orchestration.backpressure import SchedulerBackpressure
+from webwatcher.orchestration.scan_timing import (
+    ChangeHistory,
+    adaptive_interval_minutes,
+    company_offset_seconds,
+    load_change_history,
+    next_scan_time,
+)
+
+
+def test_next_scan_time_keeps_each_company_on_its_own_phase() -> None:
+    last = datetime(2026, 3, 2, 9, 0, tzinfo=timezone.utc)
+    times = {company_id: next_scan_time(company_id, last, 90, 30) for company_id in range(1, 41)}
+
+    for company_id, due in times.items():
+        assert last + timedelta(minutes=90) <= due < last + timedelta(minutes=120)
+        assert int(due.timestamp()) % 1800 == company_offset_seconds(company_id, 1800)
+    assert len({due for due in times.values()}) > 30
+    assert next_scan_time(7, last, 90, 0) == last + timedelta(minutes=90)
+
+
+def test_plan_enqueue_spreads_batches_over_the_tick() -> None:
+    plan = scheduler.plan_enqueue(list(range(1, 21)), batch_size=8)
+
+    assert [len(chunk) for _, chunk in plan] == [8, 8, 4]
+    assert sorted(company_id for _, chunk in plan for company_id in chunk) == list(range(1, 21))
+    countdowns = [countdown for countdown, _ in plan]
+    assert countdowns == sorted(countdowns)
+    assert all(0 <= countdown < scheduler.TICK_SECONDS for countdown in countdowns)
+    assert scheduler.plan_enqueue(list(reversed(range(1, 21))), batch_size=8) == plan
+
+
+class _QueueRedis:
+    def __init__(self, pending: dict[str, float], depth: int) -> None:
+        self.pending = dict(pending)
+        self.depth = depth
+
+    def zremrangebyscore(self, _key: str, _low: str, high: float) -> None:
+        self.pending = {member: score for member, score in self.pending.items() if score > high}
+
+    def zrange(self, _key: str, _start: int, _stop: int, withscores: bool = False) -> list:
+        return sorted(self.pending.items(), key=lambda item: item[1])
+
+    def llen(self, _key: str) -> int:
+        return self.depth
+
+    def hlen(self, _key: str) -> int:
+        return 2
+
+    def zadd(self, _key: str, mapping: dict[str, float], nx: bool = False) -> None:
+        for member, score in mapping.items():
+            self.pending.setdefault(member, score)
+
+    def zrem(self, _key: str, *members: str) -> None:
+        for member in members:
+            self.pending.pop(member, None)
+
+
+@pytest.fixture
+async def tick_db(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{(tmp_path / 'tick.db').as_posix()}")
+    monkeypatch.setenv("REDIS_URL", "redis://127.0.0.1:1/0")
+    monkeypatch.setenv("WEBWATCH_SCHEDULER_BATCH_SIZE", "2")
+    monkeypatch.setenv("WEBWATCH_SCHEDULER_MAX_PER_TICK", "5")
+    get_settings.cache_clear()
+    monkeypatch.setattr(database, "_engine", None)
+    monkeypatch.setattr(database, "_session_maker", None)
+    published = []
+
+    class _Group:
+        def __init__(self, signatures) -> None:
+            self.signatures = list(signatures)
+
+        def apply_async(self) -> None:
+            published.append(self.signatures)
+
+    monkeypatch.setattr(scheduler, "group", _Group)
+    async with database.get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    now = datetime.now(timezone.utc)
+    async with database.session_scope() as session:
+        for index in range(8):
+            session.add(
+                Company(
+                    name=f"Co {index}",
+                    base_url=f"https://co{index}.example",
+                    next_scan_at=now - timedelta(minutes=index) if index % 2 else None,
+                )
+            )
+        session.add(Company(name="Later", base_url="https://later.example", next_scan_at=now + timedelta(hours=1)))
+    yield now, published
+    await database.get_engine().dispose()
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_tick_caps_due_companies_and_publishes_one_group(tick_db) -> None:
+    now, published = tick_db
+    result = await scheduler.run_scheduler_tick()
+    second = await scheduler.run_scheduler_tick()
+    third = await scheduler.run_scheduler_tick()
+    async with database.session_scope() as session:
+        leased = (
+            await session.execute(select(Company.next_scan_at).where(Company.id.in_(result["company_ids"])))
+        ).scalars().all()
+
+    assert result["capacity"] == 5
+    assert result["enqueued"] == 5
+    assert result["batches"] == 3
+    # Companies without a next_scan_at come first, then the longest overdue.
+    assert result["company_ids"] == [1, 3, 5, 7, 8]
+    assert sorted(second["company_ids"]) == [2, 4, 6]
+    assert third["enqueued"] == 0
+    assert all(when.replace(tzinfo=timezone.utc) > now + timedelta(minutes=25) for when in leased)
+    assert len(published) == 2
+    queued = [company_id for signature in published[0] for company_id in signature.args[0]]
+    assert sorted(queued) == sorted(result["company_ids"])
+    assert all(signature.options["countdown"] < scheduler.TICK_SECONDS for signature in published[0])
+
+
+@pytest.mark.asyncio
+async def test_tick_backs_off_and_skips_companies_still_pending(tick_db, monkeypatch) -> None:
+    _, published = tick_db
+    queued_at = time.time()
+    redis = _QueueRedis({"1": queued_at - 600, **{str(company_id): queued_at for company_id in range(101, 108)}}, depth=4)
+    monkeypatch.setattr(scheduler, "SchedulerBackpressure", lambda: SchedulerBackpressure(client=redis))
+
+    result = await scheduler.run_scheduler_tick()
+
+    # Eight companies outstanding against a capacity of five leaves room for two.
+    assert result["limit"] == 2
+    assert result["deduplicated"] == 1
+    assert result["company_ids"] == [3]
+    assert result["queue_depth"] == 4
+    assert result["queue_lag_seconds"] >= 600
+    assert metrics.gauges["scheduler_queue_lag_seconds"] >= 600
+    assert "3" in redis.pending
+    assert len(published) == 1
+
+    SchedulerBackpressure(client=redis).mark_finished([1, 3])
+    assert "1" not in redis.pending and "3" not in redis.pending
+
+
+@pytest.mark.asyncio
+async def test_tick_counts_queued_batches_without_pending_entries(tick_db, monkeypatch) -> None:
+    redis = _QueueRedis({}, depth=4)
+    monkeypatch.setattr(scheduler, "SchedulerBackpressure", lambda: SchedulerBackpressure(client=redis))
+
+    result = await scheduler.run_scheduler_tick()
+
+    # Four queued batches of two are eight companies of backlog against a capacity of five.
+    assert result["limit"] == 2
+    assert result["enqueued"] == 2
+    assert metrics.gauges["scheduler_inflight_tasks_all_queues"] == 2
+
+
+def test_adaptive_interval_follows_changes_and_results_season() -> None:
+    now = datetime(2026, 2, 20, 12, 0, tzinfo=timezone.utc)
+    quiet = ChangeHistory(recent_changes=0, last_change_at=now - timedelta(days=200), latest_period_end=date(2025, 12, 31))
+    busy = ChangeHistory(recent_changes=3, last_change_at=now - timedelta(days=3), latest_period_end=date(2025, 12, 31))
+    fresh = ChangeHistory(recent_changes=1, last_change_at=now - timedelta(hours=2), latest_period_end=date(2025, 12, 31))
+
+    assert adaptive_interval_minutes(90, quiet, now, 30, 720, 30) == 360
+    assert adaptive_interval_minutes(90, busy, now, 30, 720, 30) == 30
+    assert adaptive_interval_minutes(90, fresh, now, 30, 720, 30) == 45
+    assert adaptive_interval_minutes(240, quiet, now, 30, 720, 30) == 720
+
+    in_season = datetime(2026, 4, 20, 12, 0, tzinfo=timezone.utc)
+    # Without financial history the filing window does not apply.
+    assert adaptive_interval_minutes(120, quiet, in_season, 30, 720, 30) == 480
+    reporting = ChangeHistory(
+        recent_changes=0,
+        last_change_at=now - timedelta(days=200),
+        latest_period_end=date(2025, 12, 31),
+        has_financial_history=True,
+    )
+    assert adaptive_interval_minutes(120, reporting, in_season, 30, 720, 30) == 30
+    reported = ChangeHistory(
+        recent_changes=0, last_change_at=None, latest_period_end=date(2026, 3, 31), has_financial_history=True
+    )
+    assert adaptive_interval_minutes(120, reported, in_season, 30, 720, 30) == 480
+
+
+@pytest.mark.asyncio
+async def test_financial_history_comes_from_a_recent_financial_change(tick_db) -> None:
+    now, _ = tick_db
+    async with database.session_scope() as session:
+        before = await load_change_history(session, 1, now, 30)
+        session.add(
+            Change(
+                company_id=1,
+                to_snapshot_id=1,
+                change_type="FINANCIAL",
+                severity="Minor",
+                score=0.1,
+                confidence=0.9,
+                summary="Revenue updated",
+                created_at=now - timedelta(days=120),
+            )
+        )
+        await session.flush()
+        after = await load_change_history(session, 1, now, 30)
+
+    assert not before.has_financial_history
+    assert after.has_financial_history
+    assert after.recent_changes == 0
+
+
+@pytest.mark.asyncio
+async def test_tick_capacity_counts_crawl_workers_when_scans_are_staged(tick_db, monkeypatch) -> None:
+    now, _ = tick_db
+    monkeypatch.setenv("WEBWATCH_SCHEDULER_MAX_PER_TICK", "10000")
+    monkeypatch.setenv("CELERY_CONCURRENCY", "4")
+    monkeypatch.setenv("WEBWATCH_BATCH_SCAN_CONCURRENCY", "16")
+    monkeypatch.setenv("WEBWATCH_CRAWL_CONCURRENCY", "3")
+    get_settings.cache_clear()
+    async with database.session_scope() as session:
+        session.add(
+            ScanRun(
+                company_id=1,
+                status="succeeded",
+                idempotency_key="capacity",
+                started_at=now - timedelta(seconds=60),
+                completed_at=now,
+            )
+        )
+
+    staged = await scheduler.measured_tick_capacity()
+    monkeypatch.setenv("WEBWATCH_PIPELINE_STAGES", "false")
+    get_settings.cache_clear()
+    in_process = await scheduler.measured_tick_capacity()
+
+    # 300 second tick over 60 second scans: 3 crawl processes, or 4 processes x 16 in-process slots.
+    assert staged == 15
+    assert in_process == 320
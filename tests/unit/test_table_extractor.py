@@ -0,0 +1,37 @@
+from webwatcher.financial.periods import period_sort_key
+from webwatcher.financial.table_extractor import TableExtractor, build_table_matrix
+from webwatcher.normalization.html_normalizer import normalize_html
+
+RESULTS_HTML = """
+<html><body>
+  <p>Statement of Consolidated Financial Results (Rs. in Crore)</p>
+  <table>
+    <tr><th rowspan="2">Particulars</th><th colspan="2">Quarter ended</th><th>Year ended</th></tr>
+    <tr><th>31.12.2024</th><th>31.03.2025</th><th>31.03.2025</th></tr>
+    <tr><td>Revenue from operations</td><td>1,150.50</td><td>1,240.00</td><td>4,700.25</td></tr>
+    <tr><td>Net Profit after tax</td><td>(12.00)</td><td>98.40</td><td>310.00</td></tr>
+    <tr><td>EBITDA margin (%)</td><td>18.2</td><td>19.1</td><td>18.7</td></tr>
+    <tr><td>EPS (Basic)</td><td>-0.40</td><td>3.25</td><td>10.10</td></tr>
+  </table>
+</body></html>
+"""
+
+
+def test_period_sort_key_orders_fiscal_labels_and_dates() -> None:
+    labels = ["FY24", "Q1 FY25", "31.12.2024", "Mar-25", "Quarter ended 30 September 2024"]
+    assert sorted(labels, key=period_sort_key) == ["FY24", "Q1 FY25", "Quarter ended 30 September 2024", "31.12.2024", "Mar-25"]
+    assert period_sort_key("Particulars") == 0
+
+
+def test_table_extractor_builds_matrix_and_picks_latest_period() -> None:
+    normalized = normalize_html(RESULTS_HTML, "https://example.com/ir")
+    assert "table_grids" not in normalized.as_json()
+    matrix = build_table_matrix(normalized.table_grids[0])
+    assert matrix.periods == ["Quarter ended 31.12.2024", "Quarter ended 31.03.2025", "Year ended 31.03.2025"]
+    assert matrix.values["net_profit"]["Quarter ended 31.12.2024"] == -12 * 10_000_000
+
+    extracted = TableExtractor().extract(normalized.table_grids, source="https://example.com/ir")
+    assert extracted.quarter == "Quarter ended 31.03.2025"
+    assert extracted.metrics == {"revenue": 1240 * 10_000_000, "net_profit": 98.4 * 10_000_000, "eps": 3.25}
+    assert extracted.currency == "INR"
+    assert extracted.report_type == "consolidated"
@@ -0,0 +1,66 @@
+from datetime import date
+
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from webwatcher.db.models import Base, Company, MetricSeries
+from webwatcher.financial.timeseries import MetricSeriesStore, build_series_matrix, latest_growth
+
+
+def test_series_matrix_aligns_companies_and_periods() -> None:
+    q1, q2, q3 = date(2024, 6, 30), date(2024, 9, 30), date(2024, 12, 31)
+    rows = [(7, q1, 100.0), (7, q2, 110.0), (3, q1, 50.0), (3, q2, 40.0), (3, q3, 60.0)]
+    matrix = build_series_matrix("revenue", rows, [q3, q1, q2])
+    assert matrix.company_ids.tolist() == [3, 7]
+    assert matrix.period_ends == [q1, q2, q3]
+    assert np.isnan(matrix.row(7)[2])
+
+    _, latest, previous, growth = latest_growth(matrix, lag=1)
+    assert latest.tolist() == [60.0, 110.0]
+    assert previous.tolist() == [40.0, 100.0]
+    assert growth == pytest.approx([0.5, 0.1])
+
+
+@pytest.mark.asyncio
+async def test_metric_series_store_dedupes_points_and_screens(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'series.db').as_posix()}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    store = MetricSeriesStore()
+    async with session_maker() as session:
+        session.add_all(
+            [Company(id=1, name="Acme", base_url="https://a.example"), Company(id=2, name="Beta", base_url="https://b.example")]
+        )
+        await session.flush()
+        await store.record(session, 1, {"revenue": 100.0}, "Q1 FY25", snapshot_id=1)
+        await store.record(session, 1, {"revenue": 130.0}, "Q2 FY25", snapshot_id=2)
+        # The same quarter seen again in a later snapshot updates the point in place.
+        assert (
+            await store.record(
+                session, 1, {"revenue": 135.0}, "Quarter ended 30.09.2024", snapshot_id=3, currency="INR"
+            )
+            == 0
+        )
+        await store.record(session, 2, {"revenue": 80.0}, "Q1 FY25")
+        await store.record(session, 2, {"revenue": 84.0}, "Q2 FY25")
+        assert await store.record(session, 2, {"revenue": 1.0}, "no period here") == 0
+        await session.flush()
+
+        assert len((await session.execute(MetricSeries.__table__.select())).all()) == 4
+        updated = (
+            await session.execute(
+                MetricSeries.__table__.select().where(
+                    MetricSeries.company_id == 1, MetricSeries.period_end == date(2024, 9, 30)
+                )
+            )
+        ).one()
+        assert (updated.period_label, updated.currency, updated.source_snapshot_id) == (
+            "Quarter ended 30.09.2024",
+            "INR",
+            3,
+        )
+        screen = await store.screen_growth(session, "revenue", min_growth=0.1)
+    assert [(row.company_id, row.latest, row.period_end) for row in screen] == [(1, 135.0, date(2024, 9, 30))]
+    await engine.dispose()